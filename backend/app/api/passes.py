@@ -0,0 +1,102 @@
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Annotated, Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from starlette.concurrency import run_in_threadpool
+
+from app.core.pass_cache import PassCache
+from app.core.satellite import TLE_DATA_PATH, load_satellites, prediction_window
+from app.core.workers import offload
+from app.schemas.common import GroundStation, PassQuery, PassResponse
+
+router = APIRouter(prefix="/api", tags=["passes"])
+
+# A cache miss propagates this far beyond the requested window, so follow-up
+# queries whose window has slid forward are still answered from the cache
+HORIZON_MARGIN_HOURS = 6
+
+# Pass caches opened by pool workers, keyed by path
+_worker_caches: Dict[str, PassCache] = {}
+
+
+def predict_passes(tle_file: str, ground_stations: List[Dict], start_ts: float, end_ts: float,
+                   altitude_degrees: float, cache_path: str, satellite_ids: List = None) -> List[Dict]:
+    """
+    Process-pool entry point: passes rising inside [start_ts, end_ts],
+    propagating whatever the shared pass cache does not cover yet (plus
+    HORIZON_MARGIN_HOURS of lookahead).
+    """
+    if cache_path not in _worker_caches:
+        _worker_caches[cache_path] = PassCache(cache_path)
+    start = datetime.fromtimestamp(start_ts, tz=timezone.utc)
+    satellites = load_satellites(tle_file, at=start, satellite_ids=satellite_ids)
+    end = datetime.fromtimestamp(end_ts, tz=timezone.utc)
+    passes = _worker_caches[cache_path].get_passes(
+        satellites, ground_stations, start, end + timedelta(hours=HORIZON_MARGIN_HOURS), altitude_degrees
+    )
+    return [p for p in passes if datetime.fromisoformat(p['set_time']) <= end]
+
+
+def query_satellite_ids(query: PassQuery) -> Optional[List]:
+    """Catalog keys of a query's satellites: NORAD IDs for numeric entries, names otherwise."""
+    if query.satellites is None:
+        return None
+    return [int(key) if key.strip().isdigit() else key for key in query.satellites]
+
+
+def query_window(query: PassQuery) -> Tuple[datetime, datetime]:
+    """Start and end of a query's window (see satellite.prediction_window)."""
+    return prediction_window(query.start, None, query.days, query.snap_seconds)
+
+
+def resolve_query(request: Request, query: PassQuery) -> Tuple[list, List[Dict]]:
+    """
+    Satellites and station dictionaries named by a pass query (404 if
+    unknown). Satellites come from the element sets closest to the window
+    start, as in predict_passes, so cache fingerprints match.
+    """
+    if not (TLE_DATA_PATH / query.tle_file).is_file():
+        raise HTTPException(status_code=404, detail=f"Unknown TLE file '{query.tle_file}'")
+    start, _ = query_window(query)
+    try:
+        satellites = load_satellites(query.tle_file, at=start, satellite_ids=query_satellite_ids(query))
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=f"Unknown satellite in '{query.tle_file}': {e.args[0]!r}")
+
+    known = {station['name']: station for station in request.app.state.ground_stations}
+    names = query.stations or list(known)
+    missing = [name for name in names if name not in known]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Unknown ground stations: {missing}")
+    return satellites, [known[name] for name in names]
+
+
+@router.get("/ground-stations", response_model=List[GroundStation])
+async def list_ground_stations(request: Request):
+    """Ground stations known to the service."""
+    return request.app.state.ground_stations
+
+
+@router.get("/passes", response_model=PassResponse)
+async def get_passes(request: Request, query: Annotated[PassQuery, Query()]):
+    """
+    Passes over the next `days`. Windows the pass cache already covers are
+    read in a thread and never wait for the process pool; anything else is
+    propagated in a worker while the event loop keeps serving requests.
+    """
+    started = time.perf_counter()
+    # Opening a bulk catalog and building its satellites must not block the event loop
+    satellites, stations = await run_in_threadpool(resolve_query, request, query)
+    now, end = query_window(query)
+
+    passes = await run_in_threadpool(request.app.state.pass_cache.lookup, satellites, stations,
+                                     now, end, query.altitude_degrees)
+    cached = passes is not None
+    if not cached:
+        passes = await offload(request.app.state.executor, predict_passes, query.tle_file, stations,
+                               now.timestamp(), end.timestamp(), query.altitude_degrees,
+                               request.app.state.pass_cache_path, query_satellite_ids(query))
+
+    return PassResponse(passes=passes, count=len(passes), cached=cached,
+                        elapsed_ms=(time.perf_counter() - started) * 1000)
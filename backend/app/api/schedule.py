@@ -0,0 +1,359 @@
+import asyncio
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import asdict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from app.api.passes import predict_passes, query_satellite_ids, query_window, resolve_query
+from app.core.workers import offload
+from app.schemas.common import Contact, Job, JobStatus, PassQuery, ScheduleMode, ScheduleRequest, ScheduleResult
+
+router = APIRouter(prefix="/api/schedule", tags=["schedule"])
+
+# Finished jobs kept for polling; the oldest are dropped first
+MAX_FINISHED_JOBS = 200
+
+# Seconds between polls of a job for its event stream
+EVENT_INTERVAL = 0.5
+
+# How long a finished job's stream waits for incumbents still on the progress queue
+SETTLE_SECONDS = 2.0
+
+TERMINAL_STATES = (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+def _plain(value: Any) -> Any:
+    """Convert numpy scalars and arrays nested in a result into JSON builtins."""
+    if isinstance(value, dict):
+        return {str(k): _plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def run_schedule(payload: Dict) -> Dict:
+    """
+    Process-pool entry point: run one scheduling request.
+
+    `payload` holds the JSON form of a ScheduleRequest, plus the resolved
+    station dictionaries and pass cache path used when its passes have to
+    be predicted first. Jobs also carry their id and a progress queue, on
+    which optimized and hybrid solves publish every improved incumbent.
+    """
+    from app.scheduling.baseline import create_baseline_schedule
+    from app.scheduling.optimizer import AdvancedSchedulingOptimizer, OptimizationObjective
+
+    started_at = datetime.now(timezone.utc)
+    request = payload['request']
+    passes = request.get('passes')
+    if passes is None:
+        query = PassQuery(**request['pass_query'])
+        start, end = query_window(query)
+        passes = predict_passes(query.tle_file, payload['stations'], start.timestamp(), end.timestamp(),
+                                query.altitude_degrees, payload['cache_path'], payload['satellite_ids'])
+    demands = request['demands']
+    ground_stations = request.get('ground_stations') or payload['stations']
+    objective = OptimizationObjective(request['objective'])
+    mode = ScheduleMode(request['mode'])
+
+    if mode == ScheduleMode.BASELINE:
+        t0 = datetime.now(timezone.utc)
+        contacts, unscheduled = create_baseline_schedule(passes, demands, ground_stations=ground_stations)
+        total = sum(c['demand_mb'] for c in contacts)
+        requested = sum(d['data_mb'] for d in demands)
+        result = {
+            "status": "FEASIBLE",
+            "solution_quality": "GREEDY",
+            "objective_value": total,
+            "solve_time_seconds": (datetime.now(timezone.utc) - t0).total_seconds(),
+            "total_data_scheduled": total,
+            "schedule_efficiency": total / requested if requested else 0.0,
+            "scheduled_contacts": contacts,
+            "unscheduled_demands": unscheduled,
+            "metadata": {},
+        }
+    else:
+        optimizer = AdvancedSchedulingOptimizer(request['solver_profile'], request.get('random_seed'))
+        optimizer.time_resolution_seconds = request.get('time_resolution_seconds', 1)
+        timeout = request.get('solver_timeout')
+        on_solution = None
+        if payload.get('progress') is not None:
+            progress, job_id = payload['progress'], payload['job_id']
+            on_solution = lambda update: progress.put((job_id, _plain(asdict(update))))
+        if mode == ScheduleMode.SPLIT:
+            outcome = optimizer.create_split_schedule(passes, demands, objective,
+                                                      ground_stations=ground_stations,
+                                                      solver_timeout=timeout)
+        elif mode == ScheduleMode.DECOMPOSED:
+            kwargs = {'window_timeout': timeout} if timeout else {}
+            outcome = optimizer.create_decomposed_schedule(passes, demands, objective,
+                                                           ground_stations=ground_stations, **kwargs)
+        elif mode == ScheduleMode.HYBRID:
+            kwargs = {'time_budget_seconds': timeout} if timeout else {}
+            outcome = optimizer.create_hybrid_schedule(passes, demands, objective,
+                                                       ground_stations=ground_stations,
+                                                       on_solution=on_solution, **kwargs)
+        else:
+            outcome = optimizer.create_advanced_schedule(passes, demands, objective,
+                                                         solver_timeout=timeout,
+                                                         ground_stations=ground_stations,
+                                                         on_solution=on_solution,
+                                                         target_gap=request.get('target_gap'),
+                                                         no_improvement_seconds=request.get('no_improvement_seconds'))
+        result = asdict(outcome)
+        result['status'] = result.pop('optimization_status')
+        for key in ('resource_utilization', 'constraint_violations'):
+            result['metadata'][key] = result.pop(key)
+
+    result['mode'] = mode.value
+    return {"started_at": started_at.isoformat(), "result": _plain(result)}
+
+
+def _job_payload(request: Request, body: ScheduleRequest) -> Dict:
+    """
+    Worker payload for a request, resolving its pass query up front so bad
+    names fail fast. This can open a TLE catalog, so handlers call it in a
+    thread.
+    """
+    stations = []
+    if body.passes is None:
+        _, stations = resolve_query(request, body.pass_query)
+    elif body.ground_stations is None:
+        stations = request.app.state.ground_stations
+    return {
+        "request": body.model_dump(mode="json", exclude_none=True),
+        "stations": stations,
+        "satellite_ids": query_satellite_ids(body.pass_query),
+        "cache_path": request.app.state.pass_cache_path,
+    }
+
+
+class JobStore:
+    """
+    In-memory registry of scheduling jobs running in the process pool.
+
+    With a `progress` queue (a multiprocessing manager queue, so workers can
+    receive it as an argument), a background thread collects the incumbents
+    that jobs publish and keeps each job's current schedule up to date.
+    """
+
+    def __init__(self, progress=None, max_finished: int = MAX_FINISHED_JOBS):
+        self.max_finished = max_finished
+        self.progress = progress
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._futures: Dict[str, Future] = {}
+        self._events: Dict[str, List[Dict]] = {}
+        self._incumbents: Dict[str, Dict[str, Dict]] = {}
+        self._lock = threading.Lock()
+        if progress is not None:
+            threading.Thread(target=self._drain, name="job-progress", daemon=True).start()
+
+    def close(self):
+        if self.progress is not None:
+            self.progress.put(None)
+
+    def submit(self, executor, payload: Dict, mode: ScheduleMode) -> Job:
+        job = Job(job_id=uuid.uuid4().hex, status=JobStatus.QUEUED, mode=mode,
+                  submitted_at=datetime.now(timezone.utc))
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._events[job.job_id] = []
+            self._evict()
+        payload = {**payload, "job_id": job.job_id, "progress": self.progress}
+        future = executor.submit(run_schedule, payload)
+        with self._lock:
+            self._futures[job.job_id] = future
+        future.add_done_callback(lambda f: self._finish(job.job_id, f))
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            future = self._futures.get(job_id)
+            if job is not None and job.status == JobStatus.QUEUED and future is not None and future.running():
+                job.status = JobStatus.RUNNING
+                job.started_at = datetime.now(timezone.utc)
+            return job
+
+    def events(self, job_id: str, since: int = 0) -> List[Dict]:
+        """Incumbent updates published by a job, from index `since` on."""
+        with self._lock:
+            return self._events.get(job_id, [])[since:]
+
+    def incumbent(self, job_id: str) -> List[Dict]:
+        """Contacts of the best solution a job has published so far."""
+        with self._lock:
+            contacts = list(self._incumbents.get(job_id, {}).values())
+        return sorted(contacts, key=lambda c: c['start_time'])
+
+    def list(self) -> List[Job]:
+        return [self.get(job_id) for job_id in list(self._jobs)]
+
+    def cancel(self, job_id: str) -> Optional[bool]:
+        """Cancel a queued job: None if unknown, False if it already started."""
+        job = self.get(job_id)
+        if job is None:
+            return None
+        if job.status in TERMINAL_STATES:
+            return job.status == JobStatus.CANCELLED
+        future = self._futures.get(job_id)
+        return future is not None and future.cancel()
+
+    def _finish(self, job_id: str, future: Future):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            self._futures.pop(job_id, None)
+            if job is None:
+                return
+            job.finished_at = datetime.now(timezone.utc)
+            if future.cancelled():
+                job.status = JobStatus.CANCELLED
+            elif future.exception() is not None:
+                job.status = JobStatus.FAILED
+                job.error = f"{type(future.exception()).__name__}: {future.exception()}"
+            else:
+                output = future.result()
+                job.started_at = datetime.fromisoformat(output['started_at'])
+                job.result = ScheduleResult(**output['result'])
+                job.status = JobStatus.COMPLETED
+
+    def _drain(self):
+        while True:
+            try:
+                item = self.progress.get()
+            except (EOFError, OSError):
+                return
+            if item is None:
+                return
+            job_id, update = item
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job is None:
+                    continue
+                contacts = self._incumbents.setdefault(job_id, {})
+                for contact_id in update['contacts_removed']:
+                    contacts.pop(contact_id, None)
+                for contact in update['contacts_added']:
+                    contacts[contact['contact_id']] = contact
+                job.incumbents = update['sequence']
+                job.best_objective = update['objective_value']
+                job.gap = update['gap']
+                self._events[job_id].append(update)
+
+    def _evict(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.status in TERMINAL_STATES]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
+            self._events.pop(job_id, None)
+            self._incumbents.pop(job_id, None)
+
+
+def _job_or_404(request: Request, job_id: str) -> Job:
+    job = request.app.state.jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job '{job_id}'")
+    return job
+
+
+@router.post("", response_model=ScheduleResult)
+async def schedule(request: Request, body: ScheduleRequest):
+    """
+    Solve a scheduling request and wait for the result. The solve runs in
+    the process pool, so the server keeps answering other requests.
+    """
+    payload = await run_in_threadpool(_job_payload, request, body)
+    try:
+        output = await offload(request.app.state.executor, run_schedule, payload)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return output['result']
+
+
+@router.post("/jobs", response_model=Job, status_code=202)
+async def submit_job(request: Request, body: ScheduleRequest):
+    """Queue a scheduling request and return its job for polling."""
+    payload = await run_in_threadpool(_job_payload, request, body)
+    return request.app.state.jobs.submit(request.app.state.executor, payload, body.mode)
+
+
+@router.get("/jobs", response_model=List[Job])
+async def list_jobs(request: Request):
+    """All known jobs, oldest first."""
+    return request.app.state.jobs.list()
+
+
+@router.get("/jobs/{job_id}", response_model=Job)
+async def get_job(request: Request, job_id: str):
+    """Poll a job; `result` is set once it completes."""
+    return _job_or_404(request, job_id)
+
+
+@router.get("/jobs/{job_id}/incumbent", response_model=List[Contact])
+async def get_incumbent(request: Request, job_id: str):
+    """Contacts of the best schedule an optimized job has found so far."""
+    _job_or_404(request, job_id)
+    return request.app.state.jobs.incumbent(job_id)
+
+
+@router.get("/jobs/{job_id}/events")
+async def job_events(request: Request, job_id: str):
+    """
+    Server-sent events for a job: an `incumbent` event for every improved
+    solution (objective, bound, gap, elapsed time and the contact delta),
+    a `status` event whenever its status changes, ending with the final
+    job (result included) once it finishes.
+    """
+    _job_or_404(request, job_id)
+    store = request.app.state.jobs
+
+    async def events():
+        last = None
+        sent = 0
+        settle = time.monotonic() + SETTLE_SECONDS
+        while True:
+            job = store.get(job_id)
+            if job is None:
+                return
+            for update in store.events(job_id, sent):
+                sent += 1
+                yield f"event: incumbent\ndata: {json.dumps(update)}\n\n"
+            if job.status in TERMINAL_STATES and job.result is not None and time.monotonic() < settle \
+                    and sent < job.result.metadata.get('incumbents', 0):
+                # Incumbents still in flight from the worker
+                await asyncio.sleep(0.05)
+                continue
+            if job.status != last:
+                last = job.status
+                data = job.model_dump_json() if job.status in TERMINAL_STATES else json.dumps(
+                    {"job_id": job_id, "status": job.status.value})
+                yield f"event: status\ndata: {data}\n\n"
+            if job.status in TERMINAL_STATES or await request.is_disconnected():
+                return
+            settle = time.monotonic() + SETTLE_SECONDS
+            await asyncio.sleep(EVENT_INTERVAL)
+
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache"})
+
+
+@router.delete("/jobs/{job_id}", response_model=Job)
+async def cancel_job(request: Request, job_id: str):
+    """Cancel a queued job. Jobs already running cannot be interrupted (409)."""
+    _job_or_404(request, job_id)
+    if not request.app.state.jobs.cancel(job_id):
+        raise HTTPException(status_code=409, detail="Job is already running or finished")
+    return request.app.state.jobs.get(job_id)
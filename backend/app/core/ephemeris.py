@@ -0,0 +1,54 @@
+import threading
+
+from skyfield.api import load
+
+# Planetary ephemeris used for Sun/Moon geometry. Only loaded on demand.
+EPHEMERIS_FILENAME = 'de421.bsp'
+
+_lock = threading.Lock()
+_timescale = None
+_ephemeris = None
+
+
+def get_timescale():
+    """
+    Returns the process-wide Skyfield timescale, building it on first use.
+    """
+    global _timescale
+    if _timescale is None:
+        with _lock:
+            if _timescale is None:
+                _timescale = load.timescale()
+    return _timescale
+
+
+def get_ephemeris():
+    """
+    Returns the process-wide planetary ephemeris, opening it on first use.
+
+    Skyfield opens BSP kernels through jplephem, which memory-maps the
+    segment data instead of reading it into the heap, so the pages are
+    shared between this process and any workers forked after the first
+    call. The file is downloaded into the working directory if missing.
+    """
+    global _ephemeris
+    if _ephemeris is None:
+        with _lock:
+            if _ephemeris is None:
+                _ephemeris = load(EPHEMERIS_FILENAME)
+    return _ephemeris
+
+
+def is_ephemeris_loaded() -> bool:
+    """Whether the ephemeris has been opened in this process."""
+    return _ephemeris is not None
+
+
+def preload(ephemeris: bool = False):
+    """
+    Initialise the shared resources up front, e.g. in a parent process
+    before forking workers so that they inherit them.
+    """
+    get_timescale()
+    if ephemeris:
+        get_ephemeris()
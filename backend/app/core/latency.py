@@ -1,6 +1,22 @@
 import math
 from datetime import datetime, timezone
-from typing import Dict, Optional, Tuple, List
+from typing import Dict, Optional, Tuple, List, Sequence
+import numpy as np
+
+# Integer weather codes accepted by LatencyEstimator.estimate_batch
+WEATHER_CODES = ('clear', 'light_clouds', 'heavy_clouds', 'rain', 'storm')
+
+# Row layout of LatencyEstimator.estimate_batch results
+ESTIMATION_DTYPE = np.dtype([
+    ('total_required_time_seconds', np.float64),
+    ('data_transfer_time_seconds', np.float64),
+    ('overhead_time_seconds', np.float64),
+    ('effective_data_rate_mbps', np.float64),
+    ('propagation_delay_seconds', np.float64),
+    ('data_efficiency', np.float64),
+    ('pass_utilization', np.float64),
+    ('is_feasible', np.bool_),
+])
 
 class LatencyEstimator:
     """
@@ -108,6 +124,181 @@ class LatencyEstimator:
         
         return max(1.0, effective_rate)  # Minimum 1 Mbps
 
+    def estimate_demand_requirements(self, data_demand_mb: float,
+                                     base_data_rate_mbps: float = None,
+                                     weather_condition: str = 'clear',
+                                     satellite_altitude_km: float = 408) -> Dict:
+        """
+        Estimate the pass-independent part of a transfer: the contact time a
+        demand needs regardless of which pass carries it.
+        
+        Args:
+            data_demand_mb: Data to transfer in Megabytes
+            base_data_rate_mbps: Base data rate in Mbps
+            weather_condition: Weather condition
+            satellite_altitude_km: Satellite altitude in km (default ISS altitude)
+            
+        Returns:
+            Dictionary of unrounded timing components
+        """
+        # Use default data rate if not provided
+        if base_data_rate_mbps is None:
+            base_data_rate_mbps = self.default_data_rate_mbps
+        
+        # Estimate average elevation angle (simplified model)
+        # In reality, this would be calculated from orbital mechanics
+        avg_elevation_deg = 45.0  # Simplified assumption
+        
+        # Calculate effective data rate
+        effective_rate_mbps = self.calculate_effective_data_rate(
+            base_data_rate_mbps, avg_elevation_deg, weather_condition
+        )
+        
+        # Calculate propagation delay
+        propagation_delay = self.calculate_signal_propagation_delay(
+            satellite_altitude_km, avg_elevation_deg
+        )
+        
+        # Calculate transfer time components
+        data_transfer_time = (data_demand_mb * 8) / effective_rate_mbps  # Convert MB to Mb
+        total_overhead_time = self.handshake_time + (2 * propagation_delay)
+        
+        # Total required time
+        total_required_time = data_transfer_time + total_overhead_time
+        
+        return {
+            "total_required_time": total_required_time,
+            "data_transfer_time": data_transfer_time,
+            "overhead_time": total_overhead_time,
+            "effective_rate_mbps": effective_rate_mbps,
+            "base_data_rate_mbps": base_data_rate_mbps,
+            "propagation_delay": propagation_delay,
+            "elevation_deg": avg_elevation_deg
+        }
+
+    def estimate_profile_requirements(self, profile: Dict, data_demands_mb,
+                                      base_data_rate_mbps: float = None,
+                                      weather_condition: str = 'clear') -> Dict:
+        """
+        Pass-specific counterpart of estimate_demand_requirements for a pass
+        with an elevation/range profile (see app.core.satellite.add_pass_profiles).
+        
+        The link is set up at rise, with the propagation delay of the measured
+        slant range, and data then flows at the rate the elevation allows at
+        each moment. Throughput is integrated over the profile (trapezoidal
+        rule) and inverted to find when the demand is complete. Demands that
+        do not fit are extrapolated at the rate at set, so their required
+        time exceeds the pass.
+        
+        Args:
+            profile: Dict of 'offsets_s', 'elevation_deg' and 'range_km' arrays
+            data_demands_mb: Data to transfer in Megabytes (scalar or array)
+            base_data_rate_mbps: Base data rate in Mbps
+            weather_condition: Weather condition
+            
+        Returns:
+            Dictionary of unrounded timing components with the shape of
+            `data_demands_mb`, plus the pass capacity in MB
+        """
+        if base_data_rate_mbps is None:
+            base_data_rate_mbps = self.default_data_rate_mbps
+        
+        offsets = np.asarray(profile['offsets_s'], dtype=np.float64)
+        elevation = np.asarray(profile['elevation_deg'], dtype=np.float64)
+        range_m = np.asarray(profile['range_km'], dtype=np.float64) * 1000
+        data_mb = np.asarray(data_demands_mb, dtype=np.float64)
+        
+        rates = self._effective_rates(base_data_rate_mbps, elevation,
+                                      self.weather_degradation.get(weather_condition, 1.0))
+        propagation_delay = (2 * range_m[0]) / self.SPEED_OF_LIGHT
+        overhead_time = self.handshake_time + (2 * propagation_delay)
+        
+        # Cumulative megabits and degree-seconds since rise at each sample
+        steps = np.diff(offsets)
+        delivered = np.concatenate(([0.0], np.cumsum(0.5 * (rates[1:] + rates[:-1]) * steps)))
+        exposure = np.concatenate(([0.0], np.cumsum(0.5 * (elevation[1:] + elevation[:-1]) * steps)))
+        
+        start_mb = np.interp(overhead_time, offsets, delivered)
+        target = start_mb + data_mb * 8
+        end = np.where(target <= delivered[-1],
+                       np.interp(target, delivered, offsets),
+                       offsets[-1] + (target - delivered[-1]) / rates[-1])
+        data_transfer_time = end - overhead_time
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            effective_rate = np.where(data_transfer_time > 0, data_mb * 8 / data_transfer_time,
+                                      np.interp(overhead_time, offsets, rates))
+            covered = np.minimum(end, offsets[-1]) - overhead_time
+            mean_elevation = np.where(
+                covered > 0,
+                (np.interp(np.minimum(end, offsets[-1]), offsets, exposure)
+                 - np.interp(overhead_time, offsets, exposure)) / covered,
+                np.interp(overhead_time, offsets, elevation))
+        
+        return {
+            "total_required_time": overhead_time + data_transfer_time,
+            "data_transfer_time": data_transfer_time,
+            "overhead_time": np.full(data_mb.shape, overhead_time),
+            "effective_rate_mbps": effective_rate,
+            "base_data_rate_mbps": base_data_rate_mbps,
+            "propagation_delay": propagation_delay,
+            "elevation_deg": mean_elevation,
+            "pass_capacity_mb": max(0.0, delivered[-1] - start_mb) / 8
+        }
+
+    def estimate_profile_start_slack(self, profile: Dict, data_demands_mb, contact_seconds,
+                                     base_data_rate_mbps: float = None,
+                                     weather_condition: str = 'clear',
+                                     step_seconds: float = 1.0) -> np.ndarray:
+        """
+        How far past rise a contact sized by estimate_profile_requirements can
+        start on a profiled pass and still deliver its demand.
+
+        Contact lengths are computed for a link set up at rise, but the rate
+        changes with elevation over the pass. Every start from rise onwards
+        is tried on a `step_seconds` grid, with the set-up overhead of the
+        slant range at that moment, and the slack ends at the first start
+        whose contact delivers less than the demand (or less than the same
+        contact at rise, when that one falls short by rounding) or overruns
+        the profile.
+
+        Args:
+            profile: Dict of 'offsets_s', 'elevation_deg' and 'range_km' arrays
+            data_demands_mb: Data to transfer in Megabytes (array)
+            contact_seconds: Contact length of each demand (array)
+            base_data_rate_mbps: Base data rate in Mbps
+            weather_condition: Weather condition
+            step_seconds: Spacing of the start times tried
+
+        Returns:
+            Array of the largest start offset from rise, in seconds, such that
+            every start up to it delivers the demand
+        """
+        if base_data_rate_mbps is None:
+            base_data_rate_mbps = self.default_data_rate_mbps
+
+        offsets = np.asarray(profile['offsets_s'], dtype=np.float64)
+        elevation = np.asarray(profile['elevation_deg'], dtype=np.float64)
+        range_m = np.asarray(profile['range_km'], dtype=np.float64) * 1000
+        needed = np.asarray(data_demands_mb, dtype=np.float64) * 8
+        lengths = np.asarray(contact_seconds, dtype=np.float64)
+
+        rates = self._effective_rates(base_data_rate_mbps, elevation,
+                                      self.weather_degradation.get(weather_condition, 1.0))
+        steps = np.diff(offsets)
+        delivered = np.concatenate(([0.0], np.cumsum(0.5 * (rates[1:] + rates[:-1]) * steps)))
+
+        # Starts x demands: megabits delivered between link set-up and contact end
+        shifts = np.arange(0.0, offsets[-1] + step_seconds, step_seconds)
+        overhead = self.handshake_time + 4 * np.interp(shifts, offsets, range_m) / self.SPEED_OF_LIGHT
+        ends = shifts[:, None] + lengths[None, :]
+        got = (np.interp(np.minimum(ends, offsets[-1]), offsets, delivered)
+               - np.interp(shifts + overhead, offsets, delivered)[:, None])
+        ok = (got >= np.minimum(needed, got[0]) - 1e-6) & (ends <= offsets[-1])
+
+        first_short = np.where(ok.all(axis=0), len(shifts), np.argmin(ok, axis=0))
+        return np.where(first_short > 0, shifts[np.maximum(first_short - 1, 0)], 0.0)
+
     def estimate_transfer_time_detailed(self, pass_info: Dict, data_demand_mb: float,
                                       base_data_rate_mbps: float = None,
                                       weather_condition: str = 'clear',
@@ -115,6 +306,9 @@ class LatencyEstimator:
         """
         Enhanced transfer time estimation with detailed latency modeling.
         
+        Passes carrying a 'profile' are estimated by integrating throughput
+        over their elevation profile; others assume a 45° average elevation.
+        
         Args:
             pass_info: Dictionary containing pass timing information
             data_demand_mb: Data to transfer in Megabytes
@@ -133,56 +327,133 @@ class LatencyEstimator:
             # Calculate pass duration
             pass_duration_seconds = (set_time - rise_time).total_seconds()
             
-            # Use default data rate if not provided
-            if base_data_rate_mbps is None:
-                base_data_rate_mbps = self.default_data_rate_mbps
-            
-            # Estimate average elevation angle (simplified model)
-            # In reality, this would be calculated from orbital mechanics
-            avg_elevation_deg = 45.0  # Simplified assumption
-            
-            # Calculate effective data rate
-            effective_rate_mbps = self.calculate_effective_data_rate(
-                base_data_rate_mbps, avg_elevation_deg, weather_condition
-            )
-            
-            # Calculate propagation delay
-            propagation_delay = self.calculate_signal_propagation_delay(
-                satellite_altitude_km, avg_elevation_deg
-            )
-            
-            # Calculate transfer time components
-            data_transfer_time = (data_demand_mb * 8) / effective_rate_mbps  # Convert MB to Mb
-            total_overhead_time = self.handshake_time + (2 * propagation_delay)
-            
-            # Total required time
-            total_required_time = data_transfer_time + total_overhead_time
-            
-            # Check feasibility
-            is_feasible = pass_duration_seconds >= total_required_time
-            
-            # Calculate efficiency metrics
-            data_efficiency = data_transfer_time / total_required_time if total_required_time > 0 else 0
-            pass_utilization = total_required_time / pass_duration_seconds if pass_duration_seconds > 0 else 0
-            
-            return {
-                "is_feasible": is_feasible,
-                "total_required_time_seconds": round(total_required_time, 2),
-                "data_transfer_time_seconds": round(data_transfer_time, 2),
-                "overhead_time_seconds": round(total_overhead_time, 2),
-                "pass_duration_seconds": round(pass_duration_seconds, 2),
-                "effective_data_rate_mbps": round(effective_rate_mbps, 2),
-                "base_data_rate_mbps": base_data_rate_mbps,
-                "propagation_delay_seconds": round(propagation_delay, 3),
-                "data_efficiency": round(data_efficiency, 3),
-                "pass_utilization": round(pass_utilization, 3),
-                "weather_condition": weather_condition,
-                "estimated_elevation_deg": avg_elevation_deg
-            }
+            if 'profile' in pass_info:
+                requirements = self.estimate_profile_requirements(
+                    pass_info['profile'], data_demand_mb, base_data_rate_mbps, weather_condition
+                )
+                requirements = {key: float(value) for key, value in requirements.items()}
+            else:
+                requirements = self.estimate_demand_requirements(
+                    data_demand_mb, base_data_rate_mbps, weather_condition, satellite_altitude_km
+                )
+            return self.format_estimation(requirements, pass_duration_seconds, weather_condition)
             
         except (KeyError, TypeError, ValueError) as e:
             return None
 
+    def format_estimation(self, requirements: Dict, pass_duration_seconds: float,
+                          weather_condition: str = 'clear') -> Dict:
+        """
+        Combine demand requirements with a pass duration into the detailed
+        estimation dictionary returned by estimate_transfer_time_detailed.
+        """
+        total_required_time = requirements["total_required_time"]
+        data_transfer_time = requirements["data_transfer_time"]
+        
+        # Check feasibility
+        is_feasible = pass_duration_seconds >= total_required_time
+        
+        # Calculate efficiency metrics
+        data_efficiency = data_transfer_time / total_required_time if total_required_time > 0 else 0
+        pass_utilization = total_required_time / pass_duration_seconds if pass_duration_seconds > 0 else 0
+        
+        estimation = {
+            "is_feasible": is_feasible,
+            "total_required_time_seconds": round(total_required_time, 2),
+            "data_transfer_time_seconds": round(data_transfer_time, 2),
+            "overhead_time_seconds": round(requirements["overhead_time"], 2),
+            "pass_duration_seconds": round(pass_duration_seconds, 2),
+            "effective_data_rate_mbps": round(requirements["effective_rate_mbps"], 2),
+            "base_data_rate_mbps": requirements["base_data_rate_mbps"],
+            "propagation_delay_seconds": round(requirements["propagation_delay"], 3),
+            "data_efficiency": round(data_efficiency, 3),
+            "pass_utilization": round(pass_utilization, 3),
+            "weather_condition": weather_condition,
+            "estimated_elevation_deg": round(requirements["elevation_deg"], 2)
+        }
+        if "pass_capacity_mb" in requirements:
+            estimation["pass_capacity_mb"] = round(requirements["pass_capacity_mb"], 2)
+        return estimation
+
+    def encode_weather(self, conditions: Sequence[str]) -> np.ndarray:
+        """
+        Convert weather condition names to the integer codes used by
+        estimate_batch. Unknown conditions map to 'clear', as in the scalar API.
+        """
+        lookup = {name: code for code, name in enumerate(WEATHER_CODES)}
+        return np.array([lookup.get(c, 0) for c in conditions], dtype=np.int8)
+
+    def estimate_batch(self, pass_durations_s, data_demands_mb,
+                       elevations_deg=45.0, altitudes_km=408.0, weather_codes=0,
+                       base_data_rate_mbps: float = None) -> np.ndarray:
+        """
+        Vectorized transfer estimation over NumPy arrays.
+        
+        All array arguments broadcast against each other, so e.g. a column of
+        pass durations and a row of demand sizes evaluate every combination.
+        Values are the unrounded equivalents of estimate_transfer_time_detailed.
+        
+        Args:
+            pass_durations_s: Pass durations in seconds
+            data_demands_mb: Data to transfer in Megabytes
+            elevations_deg: Elevation angles in degrees
+            altitudes_km: Satellite altitudes in km
+            weather_codes: Indices into WEATHER_CODES
+            base_data_rate_mbps: Base data rate in Mbps
+            
+        Returns:
+            Structured array of ESTIMATION_DTYPE with the broadcast shape
+        """
+        if base_data_rate_mbps is None:
+            base_data_rate_mbps = self.default_data_rate_mbps
+        
+        # Terms are computed at their own (broadcastable) shapes, so scalar
+        # elevation/altitude/weather cost nothing per element
+        duration = np.asarray(pass_durations_s, dtype=np.float64)
+        data_mb = np.asarray(data_demands_mb, dtype=np.float64)
+        elevation = np.asarray(elevations_deg, dtype=np.float64)
+        altitude_km = np.asarray(altitudes_km, dtype=np.float64)
+        weather = np.asarray(weather_codes, dtype=np.intp)
+        shape = np.broadcast_shapes(duration.shape, data_mb.shape, elevation.shape,
+                                    altitude_km.shape, weather.shape)
+        weather_factors = np.array([self.weather_degradation.get(name, 1.0) for name in WEATHER_CODES])
+        
+        effective_rate = self._effective_rates(base_data_rate_mbps, elevation, weather_factors[weather])
+        
+        # Propagation delay (see calculate_signal_propagation_delay)
+        elevation_rad = np.radians(elevation)
+        satellite_distance = self.EARTH_RADIUS + altitude_km * 1000
+        slant_range = np.sqrt(
+            satellite_distance**2 - self.EARTH_RADIUS**2 * np.cos(elevation_rad)**2
+        ) - self.EARTH_RADIUS * np.sin(elevation_rad)
+        propagation_delay = (2 * slant_range) / self.SPEED_OF_LIGHT
+        
+        data_transfer_time = (data_mb * 8) / effective_rate
+        overhead_time = self.handshake_time + (2 * propagation_delay)
+        total_required_time = data_transfer_time + overhead_time
+        
+        result = np.empty(shape, dtype=ESTIMATION_DTYPE)
+        result['total_required_time_seconds'] = total_required_time
+        result['data_transfer_time_seconds'] = data_transfer_time
+        result['overhead_time_seconds'] = overhead_time
+        result['effective_data_rate_mbps'] = effective_rate
+        result['propagation_delay_seconds'] = propagation_delay
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result['data_efficiency'] = np.where(
+                total_required_time > 0, data_transfer_time / total_required_time, 0.0)
+            result['pass_utilization'] = np.where(
+                duration > 0, total_required_time / duration, 0.0)
+        result['is_feasible'] = duration >= total_required_time
+        return result
+
+    def _effective_rates(self, base_rate_mbps: float, elevation_deg, weather_factor):
+        """Vectorized calculate_effective_data_rate."""
+        degradation = np.clip(elevation_deg / 90.0, 0.3, 1.0) * weather_factor
+        effective_rate = base_rate_mbps * degradation
+        effective_rate *= (1 - self.protocol_overhead)
+        effective_rate *= (1 - self.error_correction_overhead)
+        return np.maximum(effective_rate, 1.0)
+
     def estimate_multiple_passes(self, passes: List[Dict], data_demand_mb: float,
                                **kwargs) -> List[Dict]:
         """
@@ -0,0 +1,307 @@
+import hashlib
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from skyfield.api import EarthSatellite
+
+from app.core import satellite as satellite_module
+from app.core.ephemeris import get_timescale
+
+# Default on-disk location of the pass cache
+CACHE_PATH = Path(__file__).resolve().parent.parent.parent.parent / "data/cache/pass_cache.sqlite3"
+
+# When the horizon is extended, the new tail is recomputed from this long
+# before the old horizon so that passes in progress at the old horizon
+# (which the engine drops) are found. Must exceed the longest pass.
+EXTENSION_OVERLAP_SECONDS = 1800
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS coverage (
+    norad_id INTEGER NOT NULL,
+    station_key TEXT NOT NULL,
+    altitude_deg REAL NOT NULL,
+    tle_fingerprint TEXT NOT NULL,
+    tle_epoch REAL NOT NULL,
+    start_ts REAL NOT NULL,
+    end_ts REAL NOT NULL,
+    PRIMARY KEY (norad_id, station_key, altitude_deg, tle_fingerprint)
+);
+CREATE TABLE IF NOT EXISTS passes (
+    norad_id INTEGER NOT NULL,
+    station_key TEXT NOT NULL,
+    altitude_deg REAL NOT NULL,
+    tle_fingerprint TEXT NOT NULL,
+    rise_ts REAL NOT NULL,
+    set_ts REAL NOT NULL,
+    satellite TEXT,
+    ground_station TEXT,
+    rise_time TEXT,
+    culmination_time TEXT,
+    set_time TEXT,
+    max_elevation_deg REAL
+);
+CREATE INDEX IF NOT EXISTS passes_by_key
+    ON passes (norad_id, station_key, altitude_deg, tle_fingerprint, rise_ts);
+"""
+
+_PASS_COLUMNS = ("satellite", "ground_station", "rise_time", "culmination_time",
+                 "set_time", "max_elevation_deg")
+
+
+def tle_fingerprint(satellite: EarthSatellite) -> str:
+    """
+    Returns a short checksum of a satellite's orbital elements, so that two
+    TLEs issued for the same epoch are still told apart.
+    """
+    model = satellite.model
+    elements = (model.satnum, model.jdsatepoch, model.jdsatepochF, model.bstar,
+                model.inclo, model.nodeo, model.ecco, model.argpo, model.mo, model.no_kozai)
+    return hashlib.sha1(repr(elements).encode()).hexdigest()[:16]
+
+
+def station_key(ground_station: Dict) -> str:
+    """Returns the cache key for a ground station's coordinates."""
+    return (f"{ground_station['latitude']:.6f},{ground_station['longitude']:.6f},"
+            f"{ground_station.get('elevation_m', 0.0):.1f}")
+
+
+class PassCache:
+    """
+    Persistent SQLite cache of predicted passes.
+
+    Entries are keyed by NORAD ID, TLE fingerprint, station coordinates and
+    altitude threshold. Each key records the time range it covers; when a
+    request reaches past that range only the missing tail is propagated,
+    and loading a newer TLE for a satellite drops the entries computed
+    from older ones.
+    """
+
+    def __init__(self, path: Path = CACHE_PATH, step_seconds: float = 30.0):
+        self.path = Path(path)
+        self.step_seconds = step_seconds
+        if str(path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self.stats = {"hits": 0, "extensions": 0, "misses": 0}
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def get_passes(self, satellites: List[EarthSatellite], ground_stations: List[Dict],
+                   start: datetime, end: datetime,
+                   altitude_degrees: float = 10.0) -> List[Dict]:
+        """
+        Return all passes of the satellites over the stations that lie inside
+        [start, end], computing only what the cache does not already cover.
+
+        Args:
+            satellites: Skyfield EarthSatellite objects
+            ground_stations: Ground station dictionaries
+            start: Window start (timezone-aware UTC datetime)
+            end: Window end (timezone-aware UTC datetime)
+            altitude_degrees: Minimum altitude defining a pass
+
+        Returns:
+            List of pass dictionaries sorted by rise time
+        """
+        start_ts, end_ts = start.timestamp(), end.timestamp()
+
+        with self._lock:
+            # Work out, per satellite/station pair, which window still needs propagating
+            pending = {}
+            keys = []
+            for sat_idx, satellite in enumerate(satellites):
+                fingerprint = tle_fingerprint(satellite)
+                epoch = satellite.model.jdsatepoch + satellite.model.jdsatepochF
+                for station_idx, station in enumerate(ground_stations):
+                    key = (satellite.model.satnum, station_key(station), altitude_degrees, fingerprint)
+                    keys.append(key)
+                    window = self._plan(key, epoch, start_ts, end_ts)
+                    if window is not None:
+                        pending.setdefault(window, []).append((sat_idx, station_idx, key))
+
+            for (compute_start, compute_end, keep_after), pairs in pending.items():
+                self._compute(satellites, ground_stations, pairs, compute_start,
+                              compute_end, keep_after, altitude_degrees)
+
+            self.stats["hits"] += len(keys) - sum(len(pairs) for pairs in pending.values())
+            passes = []
+            for key in keys:
+                passes.extend(self._query(key, start_ts, end_ts))
+            self._conn.commit()
+
+        passes.sort(key=lambda p: p['rise_time'])
+        return passes
+
+    def lookup(self, satellites: List[EarthSatellite], ground_stations: List[Dict],
+               start: datetime, end: datetime,
+               altitude_degrees: float = 10.0) -> Optional[List[Dict]]:
+        """
+        Read-only variant of get_passes: return the cached passes inside
+        [start, end] if every satellite/station pair already covers the
+        window, or None. Never propagates and never changes coverage, so it
+        is cheap enough to call from a request handler.
+        """
+        start_ts, end_ts = start.timestamp(), end.timestamp()
+
+        with self._lock:
+            keys = []
+            for satellite in satellites:
+                fingerprint = tle_fingerprint(satellite)
+                for station in ground_stations:
+                    key = (satellite.model.satnum, station_key(station), altitude_degrees, fingerprint)
+                    row = self._conn.execute(
+                        "SELECT start_ts, end_ts FROM coverage WHERE norad_id = ? AND station_key = ? "
+                        "AND altitude_deg = ? AND tle_fingerprint = ?", key
+                    ).fetchone()
+                    if row is None or start_ts < row[0] or end_ts > row[1]:
+                        return None
+                    keys.append(key)
+            passes = []
+            for key in keys:
+                passes.extend(self._query(key, start_ts, end_ts))
+
+        passes.sort(key=lambda p: p['rise_time'])
+        return passes
+
+    def invalidate(self, norad_id: Optional[int] = None):
+        """Drop cached passes for one satellite, or for every satellite."""
+        with self._lock:
+            if norad_id is None:
+                self._conn.execute("DELETE FROM coverage")
+                self._conn.execute("DELETE FROM passes")
+            else:
+                self._conn.execute("DELETE FROM coverage WHERE norad_id = ?", (norad_id,))
+                self._conn.execute("DELETE FROM passes WHERE norad_id = ?", (norad_id,))
+            self._conn.commit()
+
+    def _plan(self, key, tle_epoch: float, start_ts: float, end_ts: float):
+        """
+        Update coverage bookkeeping for `key` and return the window that still
+        has to be propagated as (start_ts, end_ts, keep_after_ts), or None.
+        """
+        norad_id, st_key, altitude_deg, fingerprint = key
+
+        # A newer TLE supersedes everything computed from older element sets
+        stale = self._conn.execute(
+            "SELECT tle_fingerprint FROM coverage WHERE norad_id = ? AND station_key = ? "
+            "AND altitude_deg = ? AND tle_fingerprint != ? AND tle_epoch <= ?",
+            (norad_id, st_key, altitude_deg, fingerprint, tle_epoch)
+        ).fetchall()
+        for (old_fingerprint,) in stale:
+            self._delete_key((norad_id, st_key, altitude_deg, old_fingerprint))
+
+        row = self._conn.execute(
+            "SELECT start_ts, end_ts FROM coverage WHERE norad_id = ? AND station_key = ? "
+            "AND altitude_deg = ? AND tle_fingerprint = ?", key
+        ).fetchone()
+
+        if row is None or start_ts < row[0]:
+            self._delete_key(key)
+            self._conn.execute("INSERT INTO coverage VALUES (?, ?, ?, ?, ?, ?, ?)",
+                               key + (tle_epoch, start_ts, end_ts))
+            self.stats["misses"] += 1
+            return (start_ts, end_ts, start_ts)
+
+        covered_start, covered_end = row
+        # Drop passes that have slid out of the front of the horizon
+        if start_ts > covered_start:
+            self._conn.execute(
+                "DELETE FROM passes WHERE norad_id = ? AND station_key = ? AND altitude_deg = ? "
+                "AND tle_fingerprint = ? AND rise_ts < ?", key + (start_ts,)
+            )
+        self._conn.execute(
+            "UPDATE coverage SET start_ts = ?, end_ts = ? WHERE norad_id = ? AND station_key = ? "
+            "AND altitude_deg = ? AND tle_fingerprint = ?",
+            (max(start_ts, covered_start), max(end_ts, covered_end)) + key
+        )
+
+        if end_ts <= covered_end:
+            return None
+        self.stats["extensions"] += 1
+        tail_start = max(start_ts, covered_end - EXTENSION_OVERLAP_SECONDS)
+        return (tail_start, end_ts, covered_end)
+
+    def _compute(self, satellites, ground_stations, pairs, compute_start: float,
+                 compute_end: float, keep_after: float, altitude_degrees: float):
+        """Propagate one window for a group of pairs and store the new passes."""
+        sat_indices = sorted({sat_idx for sat_idx, _, _ in pairs})
+        station_indices = sorted({station_idx for _, station_idx, _ in pairs})
+        wanted = {(satellites[s].model.satnum, ground_stations[g]['name']): key
+                  for s, g, key in pairs}
+
+        t0 = get_timescale().from_datetime(datetime.fromtimestamp(compute_start, tz=timezone.utc))
+        computed = satellite_module._predict_passes(
+            [satellites[i] for i in sat_indices],
+            [ground_stations[i] for i in station_indices],
+            t0, compute_end - compute_start, altitude_degrees, self.step_seconds
+        )
+
+        # Rise and set come from the table's epoch columns; only stored rows are formatted
+        rise_ts, set_ts = computed.rise_seconds.tolist(), computed.set_seconds.tolist()
+        norad_ids = computed.data["norad_id"].tolist()
+        kept, keys = [], []
+        for row in range(len(computed)):
+            key = wanted.get((norad_ids[row], computed.station_name(row)))
+            if key is None:
+                continue
+            # Passes ending before the old horizon are already stored
+            if set_ts[row] <= keep_after and keep_after > compute_start:
+                continue
+            kept.append(row)
+            keys.append(key)
+        rows = [key + (rise_ts[row], set_ts[row]) + tuple(pass_info[c] for c in _PASS_COLUMNS)
+                for key, row, pass_info in zip(keys, kept, computed.records(kept))]
+        self._conn.executemany(
+            "INSERT INTO passes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+        )
+
+    def _query(self, key, start_ts: float, end_ts: float) -> List[Dict]:
+        cursor = self._conn.execute(
+            "SELECT norad_id, " + ", ".join(_PASS_COLUMNS) + " FROM passes "
+            "WHERE norad_id = ? AND station_key = ? AND altitude_deg = ? AND tle_fingerprint = ? "
+            "AND rise_ts >= ? AND set_ts <= ? ORDER BY rise_ts",
+            key + (start_ts, end_ts)
+        )
+        passes = []
+        for norad_id, name, *rest in cursor:
+            pass_info = {"satellite": name, "norad_id": norad_id}
+            pass_info.update(zip(_PASS_COLUMNS[1:], rest))
+            passes.append(pass_info)
+        return passes
+
+    def _delete_key(self, key):
+        where = "WHERE norad_id = ? AND station_key = ? AND altitude_deg = ? AND tle_fingerprint = ?"
+        self._conn.execute("DELETE FROM coverage " + where, key)
+        self._conn.execute("DELETE FROM passes " + where, key)
+
+
+def cached_passes(satellites: List[EarthSatellite], ground_stations: List[Dict],
+                  days: int = 2, altitude_degrees: float = 10.0,
+                  cache: Optional[PassCache] = None, start: datetime = None,
+                  end: datetime = None, snap_seconds: float = None) -> List[Dict]:
+    """
+    Cached equivalent of find_passes_batch, for the same window arguments
+    (see satellite.prediction_window).
+    """
+    cache = cache or get_default_cache()
+    start, end = satellite_module.prediction_window(start, end, days, snap_seconds)
+    return cache.get_passes(satellites, ground_stations, start, end, altitude_degrees)
+
+
+_default_cache = None
+
+def get_default_cache() -> PassCache:
+    """Returns the process-wide pass cache at CACHE_PATH, opening it on first use."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = PassCache()
+    return _default_cache
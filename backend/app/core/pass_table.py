@@ -0,0 +1,268 @@
+"""
+Columnar storage for satellite passes.
+
+A PassTable keeps passes in one NumPy structured array, with times as int64
+microseconds since the Unix epoch and satellites and stations as indices
+into name lists. Timestamps are parsed once, when legacy pass dictionaries
+come in, and formatted once, when they go back out.
+"""
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+PASS_DTYPE = np.dtype([
+    ("rise_us", np.int64),
+    ("culmination_us", np.int64),
+    ("set_us", np.int64),
+    ("satellite", np.int32),
+    ("norad_id", np.int64),
+    ("station", np.int32),
+    ("max_elevation_deg", np.float32),
+])
+
+# Missing satellite, NORAD ID or station
+NO_ID = -1
+
+# Missing culmination time
+NO_TIME = np.iinfo(np.int64).min
+
+# Pass dictionary keys held in columns; anything else is kept as an extra
+_COLUMN_KEYS = frozenset(("satellite", "norad_id", "ground_station", "rise_time", "culmination_time",
+                          "set_time", "max_elevation_deg", "profile"))
+
+
+def parse_timestamps(values: Sequence[str]) -> np.ndarray:
+    """Parse ISO timestamps into int64 microseconds since the epoch, treating naive values as UTC."""
+    cleaned = []
+    for value in values:
+        if value.endswith('Z'):
+            value = value[:-1]
+        elif value.endswith('+00:00'):
+            value = value[:-6]
+        elif value[-6:-5] in ('+', '-') and value[-3:-2] == ':':
+            # Non-UTC offsets: fall back to the datetime parser
+            parsed = (datetime.fromisoformat(v) for v in values)
+            return np.array([
+                round((d if d.tzinfo else d.replace(tzinfo=timezone.utc)).timestamp() * 1e6) for d in parsed
+            ], dtype=np.int64)
+        cleaned.append(value)
+    return np.array(cleaned, dtype='datetime64[us]').astype(np.int64)
+
+
+def format_timestamps(values: np.ndarray) -> List[str]:
+    """
+    Format int64 epoch microseconds as ISO UTC timestamps with a trailing Z,
+    to whole seconds when there is no fraction (as Skyfield's utc_iso does).
+    """
+    values = np.asarray(values, dtype=np.int64)
+    if values.size == 0:
+        return []
+    stamps = values.astype('datetime64[us]')
+    whole = values % 1_000_000 == 0
+    if whole.all():
+        formatted = np.datetime_as_string(stamps, unit='s')
+    else:
+        formatted = np.where(whole, np.datetime_as_string(stamps, unit='s').astype(object),
+                             np.datetime_as_string(stamps, unit='us').astype(object))
+    return [stamp + "Z" for stamp in formatted.tolist()]
+
+
+class PassTable:
+    """
+    Passes as columns.
+
+    Attributes:
+        data: Structured array with PASS_DTYPE fields, one row per pass
+        satellites: Satellite names indexed by the 'satellite' column
+        stations: Station names indexed by the 'station' column
+        profiles: Per-pass elevation profiles (or None), when any pass has one
+        extras: Per-pass dictionaries of other legacy keys, when any pass has them
+    """
+    __slots__ = ("data", "satellites", "stations", "profiles", "extras")
+
+    def __init__(self, data: np.ndarray, satellites: Sequence[str] = (), stations: Sequence[str] = (),
+                 profiles: Optional[List[Optional[Dict]]] = None, extras: Optional[List[Optional[Dict]]] = None):
+        self.data = data
+        self.satellites = list(satellites)
+        self.stations = list(stations)
+        self.profiles = profiles
+        self.extras = extras
+
+    @classmethod
+    def from_columns(cls, rise_us, set_us, culmination_us=None, satellite=None, satellites: Sequence[str] = (),
+                     norad_id=None, station=None, stations: Sequence[str] = (),
+                     max_elevation_deg=None) -> "PassTable":
+        """Build a table from column arrays; missing columns are filled with NO_ID / NO_TIME / NaN."""
+        data = np.empty(len(rise_us), dtype=PASS_DTYPE)
+        data["rise_us"] = rise_us
+        data["set_us"] = set_us
+        data["culmination_us"] = NO_TIME if culmination_us is None else culmination_us
+        data["satellite"] = NO_ID if satellite is None else satellite
+        data["norad_id"] = NO_ID if norad_id is None else norad_id
+        data["station"] = NO_ID if station is None else station
+        data["max_elevation_deg"] = np.nan if max_elevation_deg is None else max_elevation_deg
+        return cls(data, satellites, stations)
+
+    @classmethod
+    def from_dicts(cls, passes: Iterable[Dict]) -> "PassTable":
+        """Convert legacy pass dictionaries, parsing every timestamp column in one call."""
+        passes = list(passes)
+        satellites, stations = {}, {}
+        satellite = np.full(len(passes), NO_ID, dtype=np.int32)
+        station = np.full(len(passes), NO_ID, dtype=np.int32)
+        norad_id = np.full(len(passes), NO_ID, dtype=np.int64)
+        elevation = np.full(len(passes), np.nan, dtype=np.float32)
+        culminations, with_culmination = [], []
+        profiles = extras = None
+        for i, pass_info in enumerate(passes):
+            if 'satellite' in pass_info:
+                satellite[i] = satellites.setdefault(pass_info['satellite'], len(satellites))
+            if 'ground_station' in pass_info:
+                station[i] = stations.setdefault(pass_info['ground_station'], len(stations))
+            if pass_info.get('norad_id') is not None:
+                norad_id[i] = pass_info['norad_id']
+            if pass_info.get('max_elevation_deg') is not None:
+                elevation[i] = pass_info['max_elevation_deg']
+            if pass_info.get('culmination_time'):
+                culminations.append(pass_info['culmination_time'])
+                with_culmination.append(i)
+            if 'profile' in pass_info:
+                if profiles is None:
+                    profiles = [None] * len(passes)
+                profiles[i] = pass_info['profile']
+            if not _COLUMN_KEYS.issuperset(pass_info):
+                if extras is None:
+                    extras = [None] * len(passes)
+                extras[i] = {k: v for k, v in pass_info.items() if k not in _COLUMN_KEYS}
+
+        culmination = np.full(len(passes), NO_TIME, dtype=np.int64)
+        if with_culmination:
+            culmination[with_culmination] = parse_timestamps(culminations)
+        table = cls.from_columns(
+            parse_timestamps([p['rise_time'] for p in passes]), parse_timestamps([p['set_time'] for p in passes]),
+            culmination, satellite, list(satellites), norad_id, station, list(stations), elevation
+        )
+        table.profiles = profiles
+        table.extras = extras
+        return table
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __iter__(self) -> Iterator[Dict]:
+        return iter(self.to_dicts())
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return self.record(int(index))
+        return self.take(index)
+
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes
+
+    @property
+    def rise_seconds(self) -> np.ndarray:
+        """Rise times as float POSIX seconds."""
+        return self.data["rise_us"] / 1e6
+
+    @property
+    def set_seconds(self) -> np.ndarray:
+        """Set times as float POSIX seconds."""
+        return self.data["set_us"] / 1e6
+
+    @property
+    def duration_seconds(self) -> np.ndarray:
+        return (self.data["set_us"] - self.data["rise_us"]) / 1e6
+
+    def has_profile(self, i: int) -> bool:
+        return self.profiles is not None and self.profiles[i] is not None
+
+    def satellite_name(self, i: int) -> Optional[str]:
+        s = self.data["satellite"][i]
+        return self.satellites[s] if s != NO_ID else None
+
+    def station_name(self, i: int) -> Optional[str]:
+        g = self.data["station"][i]
+        return self.stations[g] if g != NO_ID else None
+
+    def rise_time(self, i: int) -> str:
+        """Legacy ISO rise timestamp of one pass."""
+        return format_timestamps(self.data["rise_us"][i:i + 1])[0]
+
+    def take(self, indices) -> "PassTable":
+        """Sub-table of the given rows (indices, a slice or a boolean mask), sharing name lists."""
+        rows = np.arange(len(self))[indices]
+        pick = (lambda values: None if values is None else [values[i] for i in rows.tolist()])
+        return PassTable(self.data[rows], self.satellites, self.stations,
+                         pick(self.profiles), pick(self.extras))
+
+    def sort_by_rise(self) -> "PassTable":
+        return self.take(np.argsort(self.data["rise_us"], kind='stable'))
+
+    @classmethod
+    def concatenate(cls, tables: Sequence["PassTable"]) -> "PassTable":
+        """Join tables, merging their satellite and station name lists."""
+        satellites, stations, parts = {}, {}, []
+        profiles, extras = [], []
+        for table in tables:
+            part = table.data.copy()
+            sat_map = np.array([satellites.setdefault(n, len(satellites)) for n in table.satellites] + [NO_ID])
+            station_map = np.array([stations.setdefault(n, len(stations)) for n in table.stations] + [NO_ID])
+            part["satellite"] = sat_map[part["satellite"]]
+            part["station"] = station_map[part["station"]]
+            parts.append(part)
+            profiles.extend(table.profiles or [None] * len(table))
+            extras.extend(table.extras or [None] * len(table))
+        data = np.concatenate(parts) if parts else np.empty(0, dtype=PASS_DTYPE)
+        return cls(data, list(satellites), list(stations),
+                   profiles if any(p is not None for p in profiles) else None,
+                   extras if any(e is not None for e in extras) else None)
+
+    def record(self, i: int) -> Dict:
+        """One pass as a legacy dictionary."""
+        return self.records([i])[0]
+
+    def to_dicts(self) -> List[Dict]:
+        """All passes as legacy dictionaries, formatting each timestamp column in one call."""
+        return self.records(np.arange(len(self)))
+
+    def records(self, rows) -> List[Dict]:
+        """The given rows as legacy dictionaries."""
+        rows = np.asarray(rows, dtype=np.int64)
+        data = self.data[rows]
+        rises = format_timestamps(data["rise_us"])
+        sets = format_timestamps(data["set_us"])
+        has_culmination = (data["culmination_us"] != NO_TIME).tolist()
+        culminations = format_timestamps(np.where(has_culmination, data["culmination_us"], 0))
+        satellites = data["satellite"].tolist()
+        norad_ids = data["norad_id"].tolist()
+        stations = data["station"].tolist()
+        elevations = data["max_elevation_deg"].tolist()
+        records = []
+        for k, row in enumerate(rows.tolist()):
+            record = {}
+            if satellites[k] != NO_ID:
+                record["satellite"] = self.satellites[satellites[k]]
+            if norad_ids[k] != NO_ID:
+                record["norad_id"] = norad_ids[k]
+            if stations[k] != NO_ID:
+                record["ground_station"] = self.stations[stations[k]]
+            record["rise_time"] = rises[k]
+            if has_culmination[k]:
+                record["culmination_time"] = culminations[k]
+            record["set_time"] = sets[k]
+            if elevations[k] == elevations[k]:  # not NaN
+                record["max_elevation_deg"] = round(elevations[k], 2)
+            if self.profiles is not None and self.profiles[row] is not None:
+                record["profile"] = self.profiles[row]
+            if self.extras is not None and self.extras[row] is not None:
+                record.update(self.extras[row])
+            records.append(record)
+        return records
+
+
+def as_pass_table(passes) -> PassTable:
+    """A PassTable for either a PassTable or a list of legacy pass dictionaries."""
+    return passes if isinstance(passes, PassTable) else PassTable.from_dicts(passes)
@@ -1,17 +1,82 @@
-from skyfield.api import load, EarthSatellite, Topos
-from datetime import timedelta, timezone
+from skyfield.api import EarthSatellite, Topos, wgs84
+from skyfield.sgp4lib import theta_GMST1982
+from sgp4.api import SatrecArray
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Dict, List, Tuple
+import math
+import multiprocessing
+import numpy as np
 
-# Initialize the timescale and ephemeris
-ts = load.timescale()
-eph = load('de421.bsp')
+from app.core.ephemeris import get_timescale, get_ephemeris, preload
+from app.core.pass_table import PassTable
+from app.core.tle_catalog import get_catalog
+from app.core.workers import available_cores
 
 # Build path to the TLE data directory
 TLE_DATA_PATH = Path(__file__).resolve().parent.parent.parent.parent / "data/tles/"
 
-def find_satellite_passes(tle_filename: str, ground_station: dict, days: int = 2):
+# Upper bound on (satellites x stations x time steps) altitude samples held in
+# memory at once by the batch engine; satellites are processed in chunks below it.
+BATCH_CHUNK_ELEMENTS = 2_000_000
+
+# Number of evenly spaced samples, rise to set inclusive, in a pass profile
+PROFILE_SAMPLES = 16
+
+def __getattr__(name):
+    # Lazily resolve the legacy module-level `ts` and `eph` attributes
+    if name == 'ts':
+        return get_timescale()
+    if name == 'eph':
+        return get_ephemeris()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def prediction_window(start: datetime = None, end: datetime = None, days: float = 2,
+                      snap_seconds: float = None) -> Tuple[datetime, datetime]:
+    """
+    Resolves a prediction window: from `start` (default: now) until `end`
+    (default: `days` later), as UTC datetimes. Naive datetimes are UTC.
+
+    With `snap_seconds`, start is floored to a grid of that spacing anchored
+    at the Unix epoch (before the default end is derived from it) and end is
+    ceiled, so calls made anywhere inside one grid step predict over the
+    same window and give identical results.
+    """
+    start = start or datetime.now(timezone.utc)
+    start = start if start.tzinfo else start.replace(tzinfo=timezone.utc)
+    if snap_seconds:
+        start = datetime.fromtimestamp(math.floor(start.timestamp() / snap_seconds) * snap_seconds, tz=timezone.utc)
+    end = end or start + timedelta(days=days)
+    end = end if end.tzinfo else end.replace(tzinfo=timezone.utc)
+    if snap_seconds:
+        end = datetime.fromtimestamp(math.ceil(end.timestamp() / snap_seconds) * snap_seconds, tz=timezone.utc)
+    if end <= start:
+        raise ValueError(f"Prediction window ends ({end.isoformat()}) before it starts ({start.isoformat()})")
+    return start, end
+
+
+def find_satellite_passes(tle_filename: str, ground_station: dict, days: int = 2, cache=None,
+                          profile: bool = False, satellite_id=None, start: datetime = None,
+                          end: datetime = None, snap_seconds: float = None):
     """
     Calculates the visible passes of a satellite over a ground station for a given number of days.
+
+    The window runs from `start` (default: now) until `end` (default: `days`
+    later), optionally snapped to a grid (see prediction_window).
+
+    The satellite comes from the TLE catalog of the file: the object with
+    NORAD ID or name `satellite_id`, or the file's first object (lowest
+    NORAD ID), using the element set whose epoch is closest to the start.
+
+    If a PassCache is given, passes are served from it and only the part of
+    the window it does not yet cover is propagated. The cache is filled by
+    the batch engine (see find_passes_batch), so its event times may differ
+    from the uncached Skyfield event search by about a second, passes
+    shorter than the cache's grid step may be missing, and each pass also
+    carries the batch engine's satellite, NORAD ID, station and maximum
+    elevation fields. With `profile`, each pass also carries an
+    elevation/range profile (see add_pass_profiles).
     """
     # Define the ground station location
     station_location = Topos(
@@ -20,26 +85,39 @@ def find_satellite_passes(tle_filename: str, ground_station: dict, days: int = 2
         elevation_m=ground_station['elevation_m']
     )
 
-    # Load the satellite(s) from the TLE file
+    start, end = prediction_window(start, end, days, snap_seconds)
+
+    # Pick the satellite from the TLE file's catalog
     tle_path = TLE_DATA_PATH / tle_filename
     try:
-        satellites = load.tle_file(str(tle_path))
-        satellite = satellites[0]
+        catalog = get_catalog(tle_path)
     except FileNotFoundError:
         print(f"Error: TLE file not found at {tle_path}")
         return []
-    except IndexError:
+    if len(catalog) == 0:
         print(f"Error: No satellites found in TLE file at {tle_path}")
         return []
+    if satellite_id is None:
+        if len(catalog.norad_ids) > 1:
+            print(f"Warning: {tle_path} holds {len(catalog.norad_ids)} satellites, "
+                  f"using NORAD {catalog.norad_ids[0]}; pass satellite_id to choose one")
+        satellite_id = int(catalog.norad_ids[0])
+    try:
+        satellite = catalog.satellite(satellite_id, at=start)
+    except KeyError:
+        print(f"Error: No satellite {satellite_id!r} in TLE file at {tle_path}")
+        return []
+
+    if cache is not None:
+        passes = cache.get_passes([satellite], [ground_station], start, end)
+        if profile:
+            add_pass_profiles(passes, [satellite], [ground_station])
+        return passes
 
     # Define the time window for the search
-    t0 = ts.now()
-    
-    # ---- THIS IS THE FIX ----
-    # Convert skyfield time to python datetime, add timedelta, and convert back.
-    # The correct method is .utc_datetime() as the error suggested.
-    t1 = ts.from_datetime(t0.utc_datetime() + timedelta(days=days))
-    # ---- END OF FIX ----
+    ts = get_timescale()
+    t0 = ts.from_datetime(start)
+    t1 = ts.from_datetime(end)
 
     # Find rise, culmination, and set events
     times, events = satellite.find_events(station_location, t0, t1, altitude_degrees=10.0)
@@ -47,7 +125,8 @@ def find_satellite_passes(tle_filename: str, ground_station: dict, days: int = 2
     passes = []
     # Group events by pass (rise -> culminate -> set)
     for i, event_type in enumerate(events):
-        if event_type == 0:  # This is a rise event
+        # A rise with no culmination and set before the window ends is not a pass
+        if event_type == 0 and i + 2 < len(events):  # This is a rise event
             pass_info = {
                 "rise_time": times[i].utc_iso(),
                 "culmination_time": times[i+1].utc_iso(),
@@ -55,4 +134,394 @@ def find_satellite_passes(tle_filename: str, ground_station: dict, days: int = 2
             }
             passes.append(pass_info)
     
-    return passes
\ No newline at end of file
+    if profile:
+        add_pass_profiles(passes, [satellite], [ground_station])
+    return passes
+
+
+def load_satellites(tle_filename: str, at: datetime = None, satellite_ids=None) -> List[EarthSatellite]:
+    """
+    Loads the satellites of a TLE file in the TLE data directory: those
+    with the given NORAD IDs or names, or all of them in NORAD order. Each
+    comes from its element set closest to `at` (default: now). The file is
+    parsed once per process (see tle_catalog.get_catalog); an unknown ID
+    raises KeyError.
+    """
+    tle_path = TLE_DATA_PATH / tle_filename
+    try:
+        return get_catalog(tle_path).satellites(satellite_ids, at=at)
+    except FileNotFoundError:
+        print(f"Error: TLE file not found at {tle_path}")
+        return []
+
+
+def _station_vectors(ground_stations: List[Dict]):
+    """Returns ITRS positions (km) and local zenith unit vectors for the stations."""
+    positions = []
+    zeniths = []
+    for station in ground_stations:
+        position = wgs84.latlon(station['latitude'], station['longitude'],
+                                elevation_m=station.get('elevation_m', 0.0))
+        positions.append(position.itrs_xyz.km)
+        lat = np.radians(station['latitude'])
+        lon = np.radians(station['longitude'])
+        zeniths.append([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)])
+    return np.array(positions), np.array(zeniths)
+
+
+def _altitude_grid(satellites: List[EarthSatellite], station_xyz: np.ndarray,
+                   station_up: np.ndarray, t, gmst: np.ndarray) -> np.ndarray:
+    """
+    Topocentric altitude in degrees of every satellite above every station at
+    every time in `t`, as an array of shape (satellites, stations, times).
+    `gmst` holds the GMST angle at each time of `t`.
+    """
+    # Propagate all satellites over the shared grid in a single SGP4 call
+    fraction = t.tai_fraction - t._leap_seconds() / 86400.0
+    errors, r_teme, _ = SatrecArray([sat.model for sat in satellites]).sgp4(t.whole, fraction)
+    r_teme[errors != 0] = np.nan
+
+    # TEME -> pseudo Earth-fixed is a rotation about z by GMST
+    cos_t, sin_t = np.cos(gmst), np.sin(gmst)
+    r = np.empty_like(r_teme)
+    r[..., 0] = cos_t * r_teme[..., 0] + sin_t * r_teme[..., 1]
+    r[..., 1] = -sin_t * r_teme[..., 0] + cos_t * r_teme[..., 1]
+    r[..., 2] = r_teme[..., 2]
+
+    # Broadcast satellites against stations without materialising the
+    # (satellites, stations, times, 3) difference vectors
+    up_dot = np.einsum('ntk,mk->nmt', r, station_up) - np.sum(station_xyz * station_up, axis=1)[None, :, None]
+    range_sq = (np.einsum('ntk,ntk->nt', r, r)[:, None, :]
+                - 2.0 * np.einsum('ntk,mk->nmt', r, station_xyz)
+                + np.sum(station_xyz ** 2, axis=1)[None, :, None])
+    return np.degrees(np.arcsin(up_dot / np.sqrt(range_sq)))
+
+
+def _profile_samples(satellite: EarthSatellite, station_xyz: np.ndarray, station_up: np.ndarray,
+                     rise_tt: np.ndarray, set_tt: np.ndarray, samples: int):
+    """
+    Samples elevation (degrees) and slant range (km) of one satellite on
+    `samples` evenly spaced times from rise to set of every given pass.
+    Station vectors are given per pass, shape (passes, 3).
+
+    Returns (offsets from rise in seconds, elevation, range), each of shape
+    (passes, samples).
+    """
+    fractions = np.linspace(0.0, 1.0, samples)
+    spans = set_tt - rise_tt
+    t = get_timescale().tt_jd((rise_tt[:, None] + spans[:, None] * fractions[None, :]).ravel())
+
+    # One SGP4 call over every sample of every pass, rotated to Earth-fixed
+    # axes by GMST as in the batch engine
+    fraction = t.tai_fraction - t._leap_seconds() / 86400.0
+    errors, r_teme, _ = satellite.model.sgp4_array(t.whole, fraction)
+    r_teme[errors != 0] = np.nan
+    gmst, _ = theta_GMST1982(t.whole, t.ut1_fraction)
+    cos_t, sin_t = np.cos(gmst), np.sin(gmst)
+    r = np.stack([cos_t * r_teme[:, 0] + sin_t * r_teme[:, 1],
+                  -sin_t * r_teme[:, 0] + cos_t * r_teme[:, 1],
+                  r_teme[:, 2]], axis=-1).reshape(len(spans), samples, 3)
+
+    delta = r - station_xyz[:, None, :]
+    distance = np.sqrt(np.einsum('psk,psk->ps', delta, delta))
+    elevation = np.degrees(np.arcsin(np.einsum('psk,pk->ps', delta, station_up) / distance))
+    return spans[:, None] * fractions[None, :] * 86400.0, elevation, distance
+
+
+def add_pass_profiles(passes, satellites: List[EarthSatellite],
+                      ground_stations: List[Dict], samples: int = PROFILE_SAMPLES):
+    """
+    Attaches an elevation/range time series to each pass, in place, for a
+    list of pass dictionaries or a PassTable.
+
+    The profile is stored under 'profile' as a dict of float32 arrays:
+    'offsets_s' (seconds since rise), 'elevation_deg' and 'range_km'.
+    All passes of a satellite are sampled in a single vectorized
+    propagation. Passes are matched to satellites by 'norad_id' and to
+    stations by 'ground_station'; untagged passes match when only one
+    satellite or station is given. Passes that match nothing are left
+    without a profile.
+
+    Returns:
+        The same passes
+    """
+    table = passes if isinstance(passes, PassTable) else PassTable.from_dicts(passes)
+    by_norad = {sat.model.satnum: sat for sat in satellites}
+    station_index = {station['name']: i for i, station in enumerate(ground_stations)}
+    station_xyz, station_up = _station_vectors(ground_stations) if ground_stations else (None, None)
+
+    groups = {}
+    norad_ids = table.data["norad_id"].tolist()
+    for p_idx in range(len(table)):
+        satellite = by_norad.get(norad_ids[p_idx], satellites[0] if len(satellites) == 1 else None)
+        station = station_index.get(table.station_name(p_idx), 0 if len(ground_stations) == 1 else None)
+        if satellite is not None and station is not None:
+            groups.setdefault(satellite.model.satnum, (satellite, [], []))
+            groups[satellite.model.satnum][1].append(p_idx)
+            groups[satellite.model.satnum][2].append(station)
+
+    for satellite, p_indices, stations in groups.values():
+        rise = _epoch_us_to_time(table.data["rise_us"][p_indices]).tt
+        set_ = _epoch_us_to_time(table.data["set_us"][p_indices]).tt
+        offsets, elevation, distance = _profile_samples(
+            satellite, station_xyz[stations], station_up[stations], rise, set_, samples)
+        for row, p_idx in enumerate(p_indices):
+            profile = {
+                "offsets_s": offsets[row].astype(np.float32),
+                "elevation_deg": elevation[row].astype(np.float32),
+                "range_km": distance[row].astype(np.float32),
+            }
+            if table is passes:
+                if table.profiles is None:
+                    table.profiles = [None] * len(table)
+                table.profiles[p_idx] = profile
+            else:
+                passes[p_idx]['profile'] = profile
+    return passes
+
+
+def _epoch_us_to_time(values: np.ndarray):
+    """Skyfield times for epoch microseconds, split into UTC days so leap seconds are applied."""
+    days, remainder = np.divmod(np.asarray(values, dtype=np.int64), 86_400_000_000)
+    return get_timescale().utc(1970, 1, 1 + days, 0, 0, remainder / 1e6)
+
+
+def _extract_passes(altitude: np.ndarray, altitude_degrees: float):
+    """
+    Finds complete passes (rise and set both inside the grid) in an altitude
+    array of shape (rows, times).
+
+    Returns (rows, rise, culmination, set, max_elevation) where the event
+    positions are fractional grid indices.
+    """
+    n_times = altitude.shape[1]
+    above = altitude >= altitude_degrees
+    step = np.diff(above.astype(np.int8), axis=1)
+    rise_rows, rise_idx = np.nonzero(step == 1)
+    set_rows, set_idx = np.nonzero(step == -1)
+
+    # Drop the set of a pass already in progress at the window start and the
+    # rise of a pass still in progress at the window end
+    first_set = np.r_[True, set_rows[1:] != set_rows[:-1]] if set_rows.size else np.zeros(0, bool)
+    keep_set = ~(first_set & above[set_rows, 0])
+    set_rows, set_idx = set_rows[keep_set], set_idx[keep_set]
+    last_rise = np.r_[rise_rows[1:] != rise_rows[:-1], True] if rise_rows.size else np.zeros(0, bool)
+    keep_rise = ~(last_rise & above[rise_rows, -1])
+    rise_rows, rise_idx = rise_rows[keep_rise], rise_idx[keep_rise]
+
+    if rise_rows.size == 0:
+        empty = np.zeros(0)
+        return rise_rows, empty, empty, empty, empty
+
+    # Linear interpolation of the threshold crossings
+    a0 = altitude[rise_rows, rise_idx]
+    a1 = altitude[rise_rows, rise_idx + 1]
+    rise = rise_idx + (altitude_degrees - a0) / (a1 - a0)
+    a0 = altitude[set_rows, set_idx]
+    a1 = altitude[set_rows, set_idx + 1]
+    set_ = set_idx + (altitude_degrees - a0) / (a1 - a0)
+
+    # Culmination: argmax over each pass, padded to the longest pass
+    first = rise_idx + 1
+    length = set_idx - rise_idx
+    offsets = np.arange(length.max())
+    window = np.minimum(first[:, None] + offsets[None, :], set_idx[:, None])
+    values = altitude[rise_rows[:, None], window]
+    values[offsets[None, :] >= length[:, None]] = -np.inf
+    peak = first + np.argmax(values, axis=1)
+
+    # Parabolic refinement around the sampled peak
+    y0 = altitude[rise_rows, np.maximum(peak - 1, 0)]
+    y1 = altitude[rise_rows, peak]
+    y2 = altitude[rise_rows, np.minimum(peak + 1, n_times - 1)]
+    curvature = y0 - 2.0 * y1 + y2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        shift = np.where(curvature < 0, 0.5 * (y0 - y2) / curvature, 0.0)
+    shift = np.clip(shift, -0.5, 0.5)
+    culmination = peak + shift
+    max_elevation = y1 - 0.25 * (y0 - y2) * shift
+
+    return rise_rows, rise, culmination, set_, max_elevation
+
+
+def _utc_microseconds(t) -> np.ndarray:
+    """Whole UTC seconds of Skyfield times, as int64 epoch microseconds."""
+    utc = t.utc
+    months = (utc.year - 1970) * 12 + utc.month - 1
+    days = months.astype('datetime64[M]').astype('datetime64[D]').astype(np.int64) + utc.day - 1
+    seconds = days * 86400 + utc.hour * 3600 + utc.minute * 60 + np.round(utc.second)
+    return (seconds * 1_000_000).astype(np.int64)
+
+
+def _predict_passes(satellites: List[EarthSatellite], ground_stations: List[Dict],
+                    t0, duration_seconds: float, altitude_degrees: float,
+                    step_seconds: float) -> PassTable:
+    """
+    Batch pass prediction over the window starting at Skyfield time `t0`.
+    Passes already in progress at either end of the window are not returned.
+    """
+    names = [satellite.name for satellite in satellites]
+    station_names = [station['name'] for station in ground_stations]
+    if not satellites or not ground_stations:
+        return PassTable.from_columns([], [], satellites=names, stations=station_names)
+
+    ts = get_timescale()
+    n_times = int(duration_seconds / step_seconds) + 1
+    grid_tt = t0.tt + np.arange(n_times) * (step_seconds / 86400.0)
+    t = ts.tt_jd(grid_tt)
+    gmst, _ = theta_GMST1982(t.whole, t.ut1_fraction)
+
+    station_xyz, station_up = _station_vectors(ground_stations)
+    n_stations = len(ground_stations)
+    chunk = max(1, BATCH_CHUNK_ELEMENTS // (n_stations * n_times))
+
+    found = []
+    for start in range(0, len(satellites), chunk):
+        block = satellites[start:start + chunk]
+        altitude = _altitude_grid(block, station_xyz, station_up, t, gmst)
+        rows, rise, culmination, set_, max_elevation = _extract_passes(
+            altitude.reshape(len(block) * n_stations, n_times), altitude_degrees
+        )
+        found.append((start + rows // n_stations, rows % n_stations,
+                      rise, culmination, set_, max_elevation))
+
+    sat_idx, station_idx, rise, culmination, set_, max_elevation = (
+        np.concatenate(columns) for columns in zip(*found)
+    )
+    if rise.size == 0:
+        return PassTable.from_columns([], [], satellites=names, stations=station_names)
+    # Event times rounded to whole UTC seconds, as utc_iso() always gave them,
+    # ordered by rounded rise so that sharded predictions merge identically
+    day_fraction = step_seconds / 86400.0
+    event_us = [_utc_microseconds(ts.tt_jd(t0.tt + events * day_fraction))
+                for events in (rise, culmination, set_)]
+    order = np.lexsort((station_idx, sat_idx, event_us[0]))
+    event_us = [events[order] for events in event_us]
+    norad_ids = np.array([satellite.model.satnum for satellite in satellites], dtype=np.int64)
+    return PassTable.from_columns(
+        event_us[0], event_us[2], event_us[1],
+        satellite=sat_idx[order], satellites=names, norad_id=norad_ids[sat_idx[order]],
+        station=station_idx[order], stations=station_names,
+        max_elevation_deg=np.round(max_elevation[order], 2),
+    )
+
+
+def find_passes_batch(satellites: List[EarthSatellite], ground_stations: List[Dict],
+                      days: int = 2, altitude_degrees: float = 10.0,
+                      step_seconds: float = 30.0, profile: bool = False,
+                      start: datetime = None, as_table: bool = False, end: datetime = None,
+                      snap_seconds: float = None):
+    """
+    Predicts the passes of many satellites over many ground stations in one call.
+
+    Altitude is evaluated on a single shared time grid for every satellite and
+    station pair using NumPy broadcasting, and rise/set crossings are
+    interpolated between samples, so passes shorter than `step_seconds` may be
+    missed.
+
+    Args:
+        satellites: Skyfield EarthSatellite objects to predict
+        ground_stations: Ground station dictionaries (name, latitude, longitude, elevation_m)
+        days: Length of the search window in days
+        altitude_degrees: Minimum altitude defining a pass
+        step_seconds: Spacing of the shared time grid
+        profile: Attach an elevation/range profile to each pass (see add_pass_profiles)
+        start: Start of the search window (default: now)
+        as_table: Return a PassTable instead of pass dictionaries
+        end: End of the search window (default: `days` after start)
+        snap_seconds: Snap the window to a grid of this spacing (see
+            prediction_window); identical inputs then give identical passes
+
+    Returns:
+        List of pass dictionaries sorted by rise time. In addition to the
+        legacy rise/culmination/set fields each pass carries the satellite,
+        NORAD ID, ground station and maximum elevation. With `as_table`, the
+        same passes as a PassTable, with no timestamp ever formatted.
+    """
+    start, end = prediction_window(start, end, days, snap_seconds)
+    table = _predict_passes(satellites, ground_stations, get_timescale().from_datetime(start),
+                            (end - start).total_seconds(), altitude_degrees, step_seconds)
+    if profile:
+        add_pass_profiles(table, satellites, ground_stations)
+    return table if as_table else table.to_dicts()
+
+
+# Shards per worker process, so a slow shard does not leave the others idle
+SHARDS_PER_WORKER = 4
+
+
+def find_passes_parallel(satellites: List[EarthSatellite], ground_stations: List[Dict],
+                         days: int = 2, altitude_degrees: float = 10.0,
+                         step_seconds: float = 30.0, profile: bool = False,
+                         start: datetime = None, as_table: bool = False, end: datetime = None,
+                         snap_seconds: float = None, workers: int = None):
+    """
+    find_passes_batch spread over worker processes.
+
+    Satellite x station pairs are split into shards, by satellite first
+    and by station as well when there are fewer satellites than shards.
+    Workers are forked after the timescale is built, so they inherit it
+    (and the inputs) instead of loading or unpickling them; only the
+    resulting PassTables travel back. The shards are merged into one table
+    in the same order as a single find_passes_batch call. Where fork is
+    unavailable, or with one worker, the shards run in this process.
+
+    Args:
+        workers: Worker processes (default: available cores)
+        Other arguments as for find_passes_batch
+
+    Returns:
+        The passes of find_passes_batch, as dictionaries or a PassTable
+    """
+    workers = max(1, workers or available_cores())
+    start, end = prediction_window(start, end, days, snap_seconds)
+    shards = _prediction_shards(len(satellites), len(ground_stations), workers * SHARDS_PER_WORKER)
+
+    global _shared_prediction
+    preload()
+    _shared_prediction = (satellites, ground_stations, dict(
+        altitude_degrees=altitude_degrees, step_seconds=step_seconds,
+        profile=profile, start=start, end=end, as_table=True))
+    try:
+        if workers > 1 and len(shards) > 1 and "fork" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("fork")
+            with ProcessPoolExecutor(max_workers=min(workers, len(shards)), mp_context=context) as pool:
+                tables = list(pool.map(_predict_shared_shard, shards))
+        else:
+            tables = [_predict_shared_shard(shard) for shard in shards]
+    finally:
+        _shared_prediction = None
+
+    merged = PassTable.concatenate(tables)
+    if not merged.satellites and not merged.stations:
+        merged.satellites = [satellite.name for satellite in satellites]
+        merged.stations = [station['name'] for station in ground_stations]
+    data = merged.data
+    merged = merged.take(np.lexsort((data["station"], data["satellite"], data["rise_us"])))
+    return merged if as_table else merged.to_dicts()
+
+
+def _prediction_shards(n_satellites: int, n_stations: int, target: int) -> List[Tuple[slice, slice]]:
+    """
+    About `target` (satellite slice, station slice) shards covering every
+    pair, satellite-major so that merged name lists keep the input order.
+    """
+    if n_satellites == 0 or n_stations == 0:
+        return [(slice(0, n_satellites), slice(0, n_stations))]
+    satellite_parts = min(n_satellites, target)
+    station_parts = min(n_stations, max(1, target // satellite_parts))
+    satellite_edges = np.linspace(0, n_satellites, satellite_parts + 1).astype(int).tolist()
+    station_edges = np.linspace(0, n_stations, station_parts + 1).astype(int).tolist()
+    return [(slice(s0, s1), slice(g0, g1))
+            for s0, s1 in zip(satellite_edges, satellite_edges[1:])
+            for g0, g1 in zip(station_edges, station_edges[1:])]
+
+
+# Satellites, stations and options shared with forked prediction workers (see find_passes_parallel)
+_shared_prediction = None
+
+def _predict_shared_shard(shard: Tuple[slice, slice]) -> PassTable:
+    """Predict the passes of one shard of the shared prediction job."""
+    satellites, ground_stations, options = _shared_prediction
+    satellite_slice, station_slice = shard
+    return find_passes_batch(satellites[satellite_slice], ground_stations[station_slice], **options)
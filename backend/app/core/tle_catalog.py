@@ -0,0 +1,307 @@
+"""
+In-memory TLE catalog.
+
+Bulk TLE files (CelesTrak-style, two- or three-line, tens of thousands of
+objects) are parsed once into a NumPy structured array sorted by NORAD ID
+and epoch, so every epoch of an object is one contiguous block found by
+binary search. The array is saved as a .npy snapshot and memory-mapped on
+later starts, which skips parsing altogether; Skyfield satellites are only
+built for the elements actually asked for.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+from skyfield.api import EarthSatellite
+
+from app.core.ephemeris import get_timescale
+
+logger = logging.getLogger(__name__)
+
+# Default directory of catalog snapshots, one per TLE file
+SNAPSHOT_DIR = Path(__file__).resolve().parent.parent.parent.parent / "data/cache/tles"
+
+TLE_DTYPE = np.dtype([
+    ("norad_id", np.int64),
+    ("epoch_us", np.int64),
+    ("name", "S32"),
+    ("line1", "S69"),
+    ("line2", "S69"),
+])
+
+# Alpha-5 leading characters of catalog numbers above 99999 (I and O are not used)
+_ALPHA5 = {letter: value for value, letter in enumerate("ABCDEFGHJKLMNPQRSTUVWXYZ", start=10)}
+
+
+def _encode_name(name: str) -> bytes:
+    """UTF-8 object name cut to the 32-byte name field at a character boundary."""
+    return name.strip().encode()[:32].decode(errors='ignore').encode()
+
+
+def _source_versions(paths: List[Path]) -> List[List]:
+    """Resolved path, mtime (ns) and size of each source file, as stored beside a snapshot."""
+    versions = []
+    for path in paths:
+        stat = path.stat()
+        versions.append([str(path.resolve()), stat.st_mtime_ns, stat.st_size])
+    return versions
+
+
+def _checksum_ok(line: str) -> bool:
+    """Modulo-10 checksum of a TLE line: digits count their value, minus signs count 1."""
+    if not line[68:69].isdigit():
+        return False
+    total = sum(int(c) if c.isdigit() else c == '-' for c in line[:68])
+    return total % 10 == int(line[68])
+
+
+def _catalog_number(field: str) -> int:
+    field = field.strip()
+    if field[:1] in _ALPHA5:
+        return _ALPHA5[field[0]] * 10000 + int(field[1:])
+    return int(field)
+
+
+def _epoch_us(line1: str) -> int:
+    """Epoch of a TLE (columns 19-32, YYDDD.DDDDDDDD) as epoch microseconds."""
+    year = int(line1[18:20])
+    year += 2000 if year < 57 else 1900
+    day = float(line1[20:32])
+    epoch = datetime(year, 1, 1, tzinfo=timezone.utc) + timedelta(days=day - 1)
+    return round(epoch.timestamp() * 1e6)
+
+
+def parse_tle_text(text: str, verify_checksums: bool = False) -> Tuple[np.ndarray, int]:
+    """
+    Parse two- or three-line element sets.
+
+    Blank lines, CRLF endings and '0 '-prefixed name lines are accepted. An
+    element set is skipped when its lines are malformed, their catalog
+    numbers differ, or (with `verify_checksums`) a checksum fails. Checksums
+    are not verified by default, as Skyfield does not verify them either and
+    hand-edited files often carry stale ones.
+
+    Returns:
+        (records with TLE_DTYPE in file order, number of skipped element sets)
+    """
+    lines = [line.rstrip() for line in text.splitlines()]
+    lines = [line for line in lines if line]
+    records, skipped = [], 0
+    name = ""
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        if not line.startswith('1 '):
+            if line.startswith('2 '):
+                skipped += 1
+            else:
+                name = line[2:] if line.startswith('0 ') else line
+            i += 1
+            continue
+        line2 = lines[i + 1] if i + 1 < len(lines) else ""
+        i += 2 if line2.startswith('2 ') else 1
+        try:
+            valid = (len(line) >= 69 and len(line2) >= 69 and line2.startswith('2 ')
+                     and line[2:7] == line2[2:7])
+            if valid and verify_checksums:
+                valid = _checksum_ok(line) and _checksum_ok(line2)
+            if valid:
+                records.append((_catalog_number(line[2:7]), _epoch_us(line), _encode_name(name),
+                                line[:69].encode(), line2[:69].encode()))
+            else:
+                skipped += 1
+        except ValueError:
+            skipped += 1
+        name = ""
+    return np.array(records, dtype=TLE_DTYPE), skipped
+
+
+class TLECatalog:
+    """
+    Element sets indexed by NORAD ID and name, several epochs per object.
+
+    Attributes:
+        data: TLE_DTYPE records sorted by (norad_id, epoch_us), one per
+            distinct epoch; possibly a read-only memory map
+    """
+
+    def __init__(self, data: np.ndarray):
+        self.data = data
+        self._names = None
+        self._satellites: Dict[int, EarthSatellite] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_records(cls, records: np.ndarray) -> "TLECatalog":
+        """Sort records and keep the last one seen for each (NORAD ID, epoch)."""
+        if len(records) == 0:
+            return cls(records)
+        order = np.lexsort((records["epoch_us"], records["norad_id"]))
+        records = records[order]
+        # lexsort is stable, so the last duplicate is the one read last
+        last = np.r_[(records["norad_id"][1:] != records["norad_id"][:-1]) |
+                     (records["epoch_us"][1:] != records["epoch_us"][:-1]), True]
+        return cls(records[last])
+
+    @classmethod
+    def from_files(cls, paths: Iterable, verify_checksums: bool = False) -> "TLECatalog":
+        """Parse and merge TLE files; a later file wins for an identical epoch."""
+        parts = []
+        for path in paths:
+            records, skipped = parse_tle_text(Path(path).read_text(errors='replace'), verify_checksums)
+            if skipped:
+                logger.warning(f"Skipped {skipped} malformed element sets in {path}")
+            parts.append(records)
+        return cls.from_records(np.concatenate(parts) if parts else np.empty(0, dtype=TLE_DTYPE))
+
+    def save(self, path):
+        """Write the catalog as a .npy snapshot, atomically."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(partial, 'wb') as f:
+            np.save(f, self.data)
+        os.replace(partial, path)
+
+    @classmethod
+    def load(cls, path, mmap: bool = True) -> "TLECatalog":
+        """Open a snapshot written by save(), memory-mapped unless `mmap` is False."""
+        return cls(np.load(path, mmap_mode='r' if mmap else None))
+
+    @classmethod
+    def open(cls, paths: Iterable, snapshot=None) -> "TLECatalog":
+        """
+        Catalog of the given TLE files, from `snapshot` when it was built
+        from exactly these files at their current mtime and size, otherwise
+        parsed and written to `snapshot`. The source versions are kept in a
+        .json file beside the snapshot.
+        """
+        paths = [Path(path) for path in paths]
+        versions = _source_versions(paths)
+        if snapshot is not None:
+            snapshot = Path(snapshot)
+            sources = snapshot.with_suffix(".json")
+            try:
+                if json.loads(sources.read_text()) == versions:
+                    return cls.load(snapshot)
+            except (OSError, ValueError):
+                pass
+        catalog = cls.from_files(paths)
+        if snapshot is not None:
+            try:
+                catalog.save(snapshot)
+                partial = sources.with_name(f"{sources.name}.{os.getpid()}.tmp")
+                partial.write_text(json.dumps(versions))
+                os.replace(partial, sources)
+            except OSError as e:
+                logger.warning(f"Could not write TLE snapshot {snapshot}: {e}")
+        return catalog
+
+    def __len__(self) -> int:
+        """Number of element sets (all epochs of all objects)."""
+        return len(self.data)
+
+    def __contains__(self, key) -> bool:
+        return self.resolve(key) is not None
+
+    @property
+    def norad_ids(self) -> np.ndarray:
+        """Distinct NORAD IDs, ascending."""
+        return np.unique(self.data["norad_id"])
+
+    def resolve(self, key: Union[int, str]) -> Optional[int]:
+        """
+        NORAD ID for a NORAD ID or an object name, or None. Any name an
+        element set of the object carries resolves; when two objects have
+        carried the same name, the one named so most recently wins.
+        """
+        if isinstance(key, str):
+            if self._names is None:
+                # Oldest element sets first, so later names overwrite earlier ones
+                order = np.argsort(self.data["epoch_us"], kind='stable')
+                self._names = {name.decode().strip(): norad for name, norad in
+                               zip(self.data["name"][order].tolist(), self.data["norad_id"][order].tolist())}
+                self._names.pop("", None)
+            return self._names.get(key.strip())
+        lo, hi = self._block(int(key))
+        return int(key) if hi > lo else None
+
+    def _block(self, norad_id: int) -> Tuple[int, int]:
+        column = self.data["norad_id"]
+        return (int(np.searchsorted(column, norad_id, side='left')),
+                int(np.searchsorted(column, norad_id, side='right')))
+
+    def epochs(self, key: Union[int, str]) -> List[datetime]:
+        """Epochs held for an object, oldest first."""
+        lo, hi = self._block(self._require(key))
+        return [datetime.fromtimestamp(us / 1e6, tz=timezone.utc) for us in self.data["epoch_us"][lo:hi].tolist()]
+
+    def _require(self, key) -> int:
+        norad_id = self.resolve(key)
+        if norad_id is None:
+            raise KeyError(f"No element sets for {key!r}")
+        return norad_id
+
+    def _row(self, norad_id: int, at_us: int) -> int:
+        """Row of the object's element set whose epoch is closest to `at_us`."""
+        lo, hi = self._block(norad_id)
+        epochs = self.data["epoch_us"][lo:hi]
+        k = int(np.searchsorted(epochs, at_us))
+        if k == len(epochs) or (k > 0 and at_us - epochs[k - 1] <= epochs[k] - at_us):
+            k -= 1
+        return lo + k
+
+    def satellite(self, key: Union[int, str], at: datetime = None) -> EarthSatellite:
+        """
+        Skyfield satellite for a NORAD ID or name, built from the element
+        set whose epoch is closest to `at` (default: now).
+        """
+        at = at or datetime.now(timezone.utc)
+        return self._satellite(self._row(self._require(key), round(at.timestamp() * 1e6)))
+
+    def satellites(self, keys: Iterable[Union[int, str]] = None, at: datetime = None) -> List[EarthSatellite]:
+        """
+        One satellite per object (every object, in NORAD order, when `keys`
+        is None), each from its element set closest to `at` (default: now).
+        """
+        at = at or datetime.now(timezone.utc)
+        at_us = round(at.timestamp() * 1e6)
+        norad_ids = self.norad_ids.tolist() if keys is None else [self._require(key) for key in keys]
+        return [self._satellite(self._row(norad_id, at_us)) for norad_id in norad_ids]
+
+    def _satellite(self, row: int) -> EarthSatellite:
+        with self._lock:
+            if row not in self._satellites:
+                record = self.data[row]
+                self._satellites[row] = EarthSatellite(record["line1"].decode(), record["line2"].decode(),
+                                                       record["name"].decode() or None, get_timescale())
+            return self._satellites[row]
+
+
+# Catalogs opened in this process, keyed by TLE path
+_catalogs: Dict[Path, Tuple[Tuple[float, int], TLECatalog]] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_catalog(tle_path, snapshot_dir=SNAPSHOT_DIR) -> TLECatalog:
+    """
+    Process-wide catalog of one TLE file, reopened only when the file
+    changes. The snapshot lives in `snapshot_dir` (None to disable).
+    """
+    tle_path = Path(tle_path).resolve()
+    stat = tle_path.stat()
+    version = (stat.st_mtime, stat.st_size)
+    with _catalogs_lock:
+        cached = _catalogs.get(tle_path)
+        if cached is None or cached[0] != version:
+            # Snapshots are named by the resolved path, so same-named files do not collide
+            digest = hashlib.sha1(str(tle_path).encode()).hexdigest()[:16]
+            snapshot = None if snapshot_dir is None else Path(snapshot_dir) / f"{tle_path.name}.{digest}.npy"
+            cached = _catalogs[tle_path] = (version, TLECatalog.open([tle_path], snapshot))
+    return cached[1]
@@ -0,0 +1,43 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+
+from app.core.ephemeris import get_timescale
+
+
+def available_cores() -> int:
+    """CPU cores this process may run on (respects affinity masks and container limits)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def create_executor(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Process pool for CPU-heavy Skyfield and CP-SAT work.
+
+    Workers are spawned rather than forked so they never inherit the
+    server's event loop or threads; the optimizer's own fork-based pools
+    still work inside them. Every worker is started and warmed up at once,
+    so the first request does not pay for interpreter start-up and imports.
+    """
+    executor = ProcessPoolExecutor(max_workers=max_workers,
+                                   mp_context=multiprocessing.get_context("spawn"))
+    for _ in range(max_workers):
+        executor.submit(warm_up)
+    return executor
+
+
+def warm_up():
+    """Import the scheduling stack and build the timescale in a worker."""
+    import app.core.satellite  # noqa: F401
+    import app.scheduling.optimizer  # noqa: F401
+    get_timescale()
+
+
+async def offload(executor: Executor, fn, *args, **kwargs):
+    """Run `fn` in the executor without blocking the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(executor, partial(fn, *args, **kwargs))
@@ -0,0 +1,57 @@
+"""
+HTTP API for pass prediction and scheduling.
+
+Run with `uvicorn app.main:app` from the backend directory. Settings come
+from the environment:
+
+    SCHEDULER_WORKERS  processes in the worker pool (default: usable cores)
+    PASS_CACHE_PATH    SQLite pass cache shared by the server and workers
+    CORS_ORIGINS       comma-separated origins allowed to call the API
+"""
+import multiprocessing
+import os
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+
+from app.api import passes, schedule
+from app.core.ground_station import load_ground_stations
+from app.core.pass_cache import CACHE_PATH, PassCache
+from app.core.workers import available_cores, create_executor
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    workers = int(os.environ.get("SCHEDULER_WORKERS", available_cores()))
+    app.state.pass_cache_path = os.environ.get("PASS_CACHE_PATH", str(CACHE_PATH))
+    app.state.pass_cache = PassCache(app.state.pass_cache_path)
+    app.state.ground_stations = load_ground_stations()
+    app.state.executor = create_executor(workers)
+    app.state.workers = workers
+    # Workers publish job progress through a manager queue they receive per task
+    manager = multiprocessing.get_context("spawn").Manager()
+    app.state.jobs = schedule.JobStore(manager.Queue())
+    try:
+        yield
+    finally:
+        app.state.executor.shutdown(wait=False, cancel_futures=True)
+        app.state.jobs.close()
+        manager.shutdown()
+        app.state.pass_cache.close()
+
+
+app = FastAPI(title="Ground Station Scheduler", lifespan=lifespan)
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=os.environ.get("CORS_ORIGINS", "http://localhost:3000").split(","),
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+app.include_router(passes.router)
+app.include_router(schedule.router)
+
+
+@app.get("/health")
+async def health():
+    return {"status": "ok", "workers": app.state.workers}
@@ -1,66 +1,253 @@
-from app.core.latency import estimate_transfer_time, LatencyEstimator
-from datetime import datetime, timedelta # <-- Add timedelta to this import line
+from app.core.latency import LatencyEstimator
+from app.scheduling.optimizer import DEFAULT_GROUND_STATION, _format_utc, _parse_utc, station_capacities
+from app.core.pass_table import NO_ID, as_pass_table, parse_timestamps
+from bisect import bisect_right
+from datetime import datetime, timezone
+import heapq
+import math
+import numpy as np
 
-def create_baseline_schedule(all_passes: list, data_demands: list):
+# Orders in which the greedy engine considers demands
+DEMAND_ORDERS = ("priority", "deadline", "size")
+
+
+class _Timeline:
+    """Busy intervals of one resource (an antenna or a satellite), kept sorted and disjoint."""
+    __slots__ = ("starts", "ends")
+
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+
+    def earliest_start(self, t: float, duration: float, latest: float):
+        """Earliest start >= t, and <= latest, of a free gap of `duration` seconds, or None."""
+        i = bisect_right(self.ends, t)
+        while i < len(self.starts) and self.starts[i] < t + duration:
+            t = self.ends[i]
+            if t > latest:
+                return None
+            i += 1
+        return t if t <= latest else None
+
+    def busy_between(self, lo: float, hi: float):
+        """Busy intervals overlapping [lo, hi]."""
+        i = bisect_right(self.ends, lo)
+        j = bisect_right(self.starts, hi)
+        return zip(self.starts[i:j], self.ends[i:j])
+
+    def add(self, start: float, end: float):
+        i = bisect_right(self.starts, start)
+        self.starts.insert(i, start)
+        self.ends.insert(i, end)
+
+
+def _timestamps(values) -> np.ndarray:
+    """Parse ISO timestamps into POSIX seconds, treating naive values as UTC."""
+    return parse_timestamps(values) / 1e6
+
+
+def _longest_gap(lo: float, hi: float, antennas: list, satellite: "_Timeline" = None) -> float:
+    """
+    Longest slot in [lo, hi] during which the satellite (if given) and at
+    least one of the station's antennas are both free.
+    """
+    longest = 0.0
+    for antenna in antennas:
+        busy = list(antenna.busy_between(lo, hi))
+        if satellite is not None:
+            busy = sorted(busy + list(satellite.busy_between(lo, hi)))
+        t = lo
+        for b_start, b_end in busy:
+            longest = max(longest, b_start - t)
+            t = max(t, b_end)
+        longest = max(longest, hi - t)
+    return longest
+
+
+def _open_passes(candidates: np.ndarray, head: int, stop: int, free_bound: np.ndarray,
+                 duration: float, chunk: int = 64):
+    """Yield candidates[head:stop] whose free-slot bound fits `duration`, a chunk at a time."""
+    for start in range(head, stop, chunk):
+        block = candidates[start:min(start + chunk, stop)]
+        yield from block[free_bound[block] >= duration].tolist()
+
+
+def _format_timestamps(values) -> list:
+    """Format POSIX seconds as ISO UTC timestamps, exactly as the optimizer does."""
+    return [_format_utc(datetime.fromtimestamp(value, tz=timezone.utc)) for value in values]
+
+
+def _demand_key(demand: dict, d_idx: int, order: str, deadline: float):
+    """Heap key: highest priority, earliest deadline (POSIX seconds) or largest demand first."""
+    priority = demand.get('priority', 1.0)
+    if order == "deadline":
+        return (deadline, -priority, d_idx)
+    if order == "size":
+        return (-demand['data_mb'], -priority, d_idx)
+    return (-priority, deadline, d_idx)
+
+
+def create_baseline_schedule(all_passes, data_demands: list, order: str = "priority",
+                             ground_stations: list = None):
     """
     Creates a simple, greedy, conflict-free schedule.
 
+    Demands are taken from a heap in the chosen order and each one is placed
+    at the earliest free slot long enough for it on a pass of its satellite.
+    A slot may start anywhere inside a pass, so one pass can carry several
+    contacts. Every station antenna and every satellite keeps a sorted list
+    of busy intervals, so checking a pass is a binary search rather than a
+    scan, and contact time is estimated once per demand.
+
+    Passes tagged with 'satellite' (or 'norad_id') only serve demands for
+    that satellite; untagged passes serve every demand. A demand with a
+    deadline may not start after it.
+
     Args:
-        all_passes (list): A list of all possible satellite passes.
+        all_passes: A PassTable, or a list of all possible satellite passes.
         data_demands (list): A list of data transfer demands to be scheduled.
+        order (str): Demand order, one of DEMAND_ORDERS.
+        ground_stations (list): Station definitions; an 'antennas' field sets
+            how many contacts a station can run at once.
 
     Returns:
         A tuple of (scheduled contacts, unscheduled demands).
     """
-    # Initialize enhanced latency estimator for better accuracy
+    if order not in DEMAND_ORDERS:
+        raise ValueError(f"Unknown demand order '{order}', expected one of {DEMAND_ORDERS}")
+
     latency_estimator = LatencyEstimator()
-    
-    # Sort passes by their rise time to process them chronologically
-    sorted_passes = sorted(all_passes, key=lambda p: p['rise_time'])
-    
-    # Keep a copy of demands to modify
-    remaining_demands = list(data_demands)
-    
+    capacities = station_capacities(ground_stations) if ground_stations else {}
+
+    table = as_pass_table(all_passes)
+    rises = table.rise_seconds
+    sets = table.set_seconds
+    satellite_ids = table.data["satellite"].tolist()
+    norad_ids = table.data["norad_id"].tolist()
+
+    # Passes of each satellite in rise order, as in the optimizer's pass index
+    groups = {}
+    for p_idx in np.argsort(rises, kind='stable').tolist():
+        if satellite_ids[p_idx] != NO_ID:
+            groups.setdefault(('name', table.satellites[satellite_ids[p_idx]]), []).append(p_idx)
+        else:
+            groups.setdefault(None, []).append(p_idx)
+        if norad_ids[p_idx] != NO_ID:
+            groups.setdefault(('norad', norad_ids[p_idx]), []).append(p_idx)
+    groups = {key: np.array(indices) for key, indices in groups.items()}
+    candidate_cache = {}
+
+    # Upper bound on the longest free slot of each pass. Busy time only
+    # grows, so a bound computed once stays valid; passes are re-measured
+    # only when a demand that fits the bound fails to find room.
+    free_bound = sets - rises
+
+    # Contact time does not depend on the pass: one vectorized estimate per demand
+    estimates = latency_estimator.estimate_batch(0.0, [d['data_mb'] for d in data_demands])
+    required = estimates['total_required_time_seconds'].tolist()
+    efficiencies = estimates['data_efficiency'].tolist()
+    rates = estimates['effective_data_rate_mbps'].tolist()
+    shortest = min(required, default=0.0)
+    deadlines = np.full(len(data_demands), math.inf)
+    with_deadline = [d_idx for d_idx, d in enumerate(data_demands) if d.get('deadline')]
+    # ISO strings are parsed in one call, datetime deadlines one by one
+    text = [d_idx for d_idx in with_deadline if isinstance(data_demands[d_idx]['deadline'], str)]
+    if text:
+        deadlines[text] = _timestamps([data_demands[i]['deadline'] for i in text])
+    for d_idx in with_deadline:
+        if not isinstance(data_demands[d_idx]['deadline'], str):
+            deadlines[d_idx] = _parse_utc(data_demands[d_idx]['deadline']).timestamp()
+
+    heap = [(_demand_key(d, d_idx, order, deadlines[d_idx]), d_idx) for d_idx, d in enumerate(data_demands)]
+    heapq.heapify(heap)
+
+    antennas = {}
+    satellite_busy = {}
     scheduled_contacts = []
-    # Track the end time of the last scheduled contact (timezone-naive for simple comparison)
-    station_busy_until = datetime.min
+    unscheduled_demands = []
+
+    while heap:
+        _, d_idx = heapq.heappop(heap)
+        demand = data_demands[d_idx]
+        duration = required[d_idx]
+        deadline = deadlines[d_idx]
 
-    for p in sorted_passes:
-        # If there are no more demands, we're done
-        if not remaining_demands:
-            break
+        cache_key = (demand['satellite'], demand.get('norad_id'))
+        if cache_key not in candidate_cache:
+            keys = [k for k in (None, ('name', cache_key[0]), ('norad', cache_key[1])) if k in groups]
+            merged = np.concatenate([groups[k] for k in keys]) if keys else np.array([], dtype=int)
+            if len(keys) > 1:
+                merged = merged[np.argsort(rises[merged], kind='stable')]
+            candidate_cache[cache_key] = [merged, rises[merged], 0]
+        entry = candidate_cache[cache_key]
+        candidates, candidate_rises, head = entry
         
-        # Convert pass rise time to a comparable datetime object (strip timezone info)
-        pass_rise_time = datetime.fromisoformat(p['rise_time']).replace(tzinfo=None)
-
-        # Check if the ground station is free
-        if pass_rise_time >= station_busy_until:
-            # Look for a demand that this pass can satisfy
-            for demand in remaining_demands:
-                # Use enhanced estimation for better accuracy
-                estimation = latency_estimator.estimate_transfer_time_detailed(p, demand['data_mb'])
-                
-                if estimation and estimation['is_feasible']:
-                    # Schedule this contact!
-                    contact_end_time = pass_rise_time + timedelta(seconds=estimation['total_required_time_seconds'])
-                    
-                    scheduled_contact = {
-                        "satellite": demand['satellite'],
-                        "ground_station": "ISTRAC Bangalore",
-                        "demand_mb": demand['data_mb'],
-                        "start_time": p['rise_time'],
-                        "end_time": contact_end_time.isoformat() + "Z",
-                        "duration_seconds": estimation['total_required_time_seconds'],
-                        "data_efficiency": estimation.get('data_efficiency', 0.0),
-                        "effective_data_rate_mbps": estimation.get('effective_data_rate_mbps', 0.0)
-                    }
-                    scheduled_contacts.append(scheduled_contact)
-
-                    # Update station busy time and remove the fulfilled demand
-                    station_busy_until = contact_end_time
-                    remaining_demands.remove(demand)
-                    
-                    # Move to the next pass, as this one is now allocated
-                    break 
-
-    return scheduled_contacts, remaining_demands
\ No newline at end of file
+        # Passes with no room for even the shortest demand never come back
+        while head < len(candidates) and free_bound[candidates[head]] < shortest:
+            head += 1
+        entry[2] = head
+        stop = np.searchsorted(candidate_rises, deadline, side='right')
+
+        sat_timeline = satellite_busy.setdefault(demand['satellite'], _Timeline())
+        placed = None
+        for p_idx in _open_passes(candidates, head, stop, free_bound, duration):
+            station = table.station_name(p_idx) or DEFAULT_GROUND_STATION
+            station_antennas = antennas.get(station)
+            if station_antennas is None:
+                station_antennas = antennas[station] = [_Timeline() for _ in range(capacities.get(station, 1))]
+
+            # Alternate between station and satellite until both are free
+            t = rises[p_idx]
+            latest = min(sets[p_idx] - duration, deadline)
+            while True:
+                options = [(tl.earliest_start(t, duration, latest), a) for a, tl in enumerate(station_antennas)]
+                options = [o for o in options if o[0] is not None]
+                if not options:
+                    break
+                start, antenna = min(options)
+                t = sat_timeline.earliest_start(start, duration, latest)
+                if t is None:
+                    break
+                if t == start:
+                    placed = (p_idx, station, antenna, start)
+                    break
+            if placed:
+                break
+            # Untagged passes serve several satellites, so only the station counts
+            free_bound[p_idx] = _longest_gap(rises[p_idx], sets[p_idx], station_antennas,
+                                             sat_timeline if satellite_ids[p_idx] != NO_ID else None)
+
+        if placed is None:
+            unscheduled_demands.append(demand)
+            continue
+
+        p_idx, station, antenna, start = placed
+        end = start + duration
+        antennas[station][antenna].add(start, end)
+        sat_timeline.add(start, end)
+
+        scheduled_contact = {
+            "satellite": demand['satellite'],
+            "ground_station": station,
+            "demand_mb": demand['data_mb'],
+            "start_time": None,
+            "end_time": None,
+            "duration_seconds": round(duration, 2),
+            "data_efficiency": round(efficiencies[d_idx], 3),
+            "effective_data_rate_mbps": round(rates[d_idx], 2),
+            "antenna": antenna,
+        }
+        if 'id' in demand:
+            scheduled_contact['demand_id'] = demand['id']
+        scheduled_contacts.append((start, end, p_idx, scheduled_contact))
+
+    # Timestamps are formatted once, in start order, at the end
+    scheduled_contacts.sort(key=lambda item: item[0])
+    start_times = _format_timestamps([item[0] for item in scheduled_contacts])
+    end_times = _format_timestamps([item[1] for item in scheduled_contacts])
+    contacts = []
+    for (_, _, _, contact), start_time, end_time in zip(scheduled_contacts, start_times, end_times):
+        contact['start_time'] = start_time
+        contact['end_time'] = end_time
+        contacts.append(contact)
+    return contacts, unscheduled_demands
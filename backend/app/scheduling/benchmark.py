@@ -0,0 +1,295 @@
+"""
+Scheduling benchmark suite.
+
+Times the stages of a planning cycle (pass prediction, serial and sharded
+over processes, preprocessing, model build, solve, the hybrid pipeline
+and the greedy baseline) on seeded synthetic scenarios, writes
+machine-readable reports, and compares a report against a stored baseline
+to flag regressions.
+"""
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List
+
+from app.core.satellite import find_passes_batch, find_passes_parallel
+from app.scheduling.baseline import create_baseline_schedule
+from app.core.workers import available_cores
+from app.scheduling.optimizer import AdvancedSchedulingOptimizer, station_capacities
+from app.scheduling.synthetic import (
+    EPOCH, SCALES, scale_instance, synthetic_constellation, synthetic_ground_stations
+)
+
+# Report format version, bumped when the result layout changes
+REPORT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """
+    One timed stage. `setup(scale, seed, options)` builds the untimed inputs
+    and `run(inputs)` is timed, returning counters describing the work done.
+    Scales beyond `max_scale` are skipped unless forced.
+    """
+    name: str
+    setup: Callable
+    run: Callable
+    max_scale: str
+
+
+def _scenario(cache: Dict, scale: str, seed: int) -> Dict:
+    """Instance and modeling inputs of a scale, shared between benchmarks."""
+    key = (scale, seed)
+    if key not in cache:
+        cache.clear()
+        cache[key] = {"instance": scale_instance(scale, seed)}
+    return cache[key]
+
+
+def _prepared(cache: Dict, scale: str, seed: int) -> Dict:
+    scenario = _scenario(cache, scale, seed)
+    if "assignments" not in scenario:
+        instance = scenario["instance"]
+        optimizer = AdvancedSchedulingOptimizer()
+        scenario["assignments"], _ = optimizer.preprocess_scheduling_data(instance["passes"], instance["demands"])
+        scenario["capacities"] = station_capacities(instance["ground_stations"])
+    return scenario
+
+
+def _setup_prediction(cache, scale, seed, options):
+    spec = SCALES[scale]
+    return {"satellites": synthetic_constellation(spec.satellites, seed),
+            "stations": synthetic_ground_stations(spec.stations, seed), "days": spec.days}
+
+
+def _run_prediction(inputs):
+    passes = find_passes_batch(inputs["satellites"], inputs["stations"], days=inputs["days"], start=EPOCH)
+    return {"satellites": len(inputs["satellites"]), "stations": len(inputs["stations"]), "passes": len(passes)}
+
+
+def _run_parallel_prediction(inputs):
+    passes = find_passes_parallel(inputs["satellites"], inputs["stations"], days=inputs["days"], start=EPOCH,
+                                  as_table=True)
+    return {"satellites": len(inputs["satellites"]), "stations": len(inputs["stations"]), "passes": len(passes),
+            "workers": available_cores()}
+
+
+def _setup_preprocessing(cache, scale, seed, options):
+    return {"instance": _scenario(cache, scale, seed)["instance"]}
+
+
+def _run_preprocessing(inputs):
+    instance = inputs["instance"]
+    assignments, _ = AdvancedSchedulingOptimizer().preprocess_scheduling_data(instance["passes"], instance["demands"])
+    return {"passes": len(instance["passes"]), "demands": len(instance["demands"]), "assignments": len(assignments)}
+
+
+def _setup_model_build(cache, scale, seed, options):
+    return _prepared(cache, scale, seed)
+
+
+def _run_model_build(inputs):
+    AdvancedSchedulingOptimizer().create_cp_sat_model(inputs["assignments"],
+                                                      station_capacities=inputs["capacities"])
+    return {"assignments": len(inputs["assignments"])}
+
+
+def _setup_solve(cache, scale, seed, options):
+    scenario = _prepared(cache, scale, seed)
+    model, variables = AdvancedSchedulingOptimizer().create_cp_sat_model(
+        scenario["assignments"], station_capacities=scenario["capacities"])
+    return {"model": model, "variables": variables, "seed": seed,
+            "profile": options.get("solver_profile", "balanced"),
+            "time_limit": options.get("solve_time_limit", 10)}
+
+
+def _run_solve(inputs):
+    optimizer = AdvancedSchedulingOptimizer(inputs["profile"], inputs["seed"])
+    optimizer.solver_timeout_seconds = inputs["time_limit"]
+    result = optimizer.solve_optimization_model(inputs["model"], inputs["variables"])
+    return {"assignments": len(inputs["variables"]["feasible_assignments"]),
+            "status": result.optimization_status, "objective": result.objective_value,
+            "contacts": len(result.scheduled_contacts)}
+
+
+def _setup_hybrid(cache, scale, seed, options):
+    return {"instance": _scenario(cache, scale, seed)["instance"], "seed": seed,
+            "profile": options.get("solver_profile", "balanced"),
+            "time_limit": options.get("solve_time_limit", 10)}
+
+
+def _run_hybrid(inputs):
+    instance = inputs["instance"]
+    optimizer = AdvancedSchedulingOptimizer(inputs["profile"], inputs["seed"])
+    result = optimizer.create_hybrid_schedule(instance["passes"], instance["demands"],
+                                              ground_stations=instance["ground_stations"],
+                                              time_budget_seconds=inputs["time_limit"])
+    pipeline = result.metadata["pipeline"]
+    return {"status": result.optimization_status, "objective": result.objective_value,
+            "greedy_objective": pipeline["greedy_objective"],
+            "first_plan_seconds": round(result.metadata["first_solution_seconds"], 4),
+            "neighborhoods": pipeline["iterations"], "contacts": len(result.scheduled_contacts)}
+
+
+def _setup_baseline(cache, scale, seed, options):
+    return {"instance": _scenario(cache, scale, seed)["instance"]}
+
+
+def _run_baseline(inputs):
+    instance = inputs["instance"]
+    contacts, unscheduled = create_baseline_schedule(instance["passes"], instance["demands"],
+                                                     ground_stations=instance["ground_stations"])
+    return {"contacts": len(contacts), "unscheduled": len(unscheduled),
+            "data_mb": sum(c['demand_mb'] for c in contacts)}
+
+
+BENCHMARKS = {
+    benchmark.name: benchmark for benchmark in (
+        Benchmark("pass_prediction", _setup_prediction, _run_prediction, max_scale="l"),
+        Benchmark("parallel_prediction", _setup_prediction, _run_parallel_prediction, max_scale="xl"),
+        Benchmark("preprocessing", _setup_preprocessing, _run_preprocessing, max_scale="l"),
+        Benchmark("model_build", _setup_model_build, _run_model_build, max_scale="l"),
+        Benchmark("solve", _setup_solve, _run_solve, max_scale="m"),
+        Benchmark("hybrid", _setup_hybrid, _run_hybrid, max_scale="m"),
+        Benchmark("baseline", _setup_baseline, _run_baseline, max_scale="xl"),
+    )
+}
+
+
+def environment() -> Dict:
+    """Machine and library versions recorded with every report."""
+    import numpy
+    import ortools
+    import skyfield
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=Path(__file__).parent, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cores": available_cores(),
+        "numpy": numpy.__version__,
+        "ortools": ortools.__version__,
+        "skyfield": skyfield.__version__,
+        "commit": commit,
+    }
+
+
+def run_benchmarks(scales: Iterable[str] = ("xs", "s", "m"), benchmarks: Iterable[str] = tuple(BENCHMARKS),
+                   repeat: int = 3, seed: int = 0, force: bool = False, **options) -> Dict:
+    """
+    Run benchmarks at the given scales and return a report.
+
+    Every (benchmark, scale) pair is set up once, then timed `repeat` times
+    with a garbage collection before each run. Scales above a benchmark's
+    `max_scale` are recorded as skipped unless `force` is set.
+
+    Args:
+        scales: Names from SCALES
+        benchmarks: Names from BENCHMARKS
+        repeat: Timed runs per pair
+        seed: Seed of the synthetic scenarios (and of the solver)
+        force: Run scales beyond each benchmark's max_scale
+        **options: solve_time_limit (seconds, default 10) and solver_profile
+            (default "balanced") for the solve and hybrid benchmarks
+
+    Returns:
+        Dictionary with 'version', 'environment', 'config' and 'results';
+        each result carries the benchmark, scale, every run time and their
+        min/median/mean/stdev, and the counters of the last run.
+    """
+    order = list(SCALES)
+    results = []
+    cache = {}
+    for scale in scales:
+        if scale not in SCALES:
+            raise ValueError(f"Unknown scale '{scale}', expected one of {order}")
+        for name in benchmarks:
+            benchmark = BENCHMARKS[name]
+            entry = {"benchmark": name, "scale": scale}
+            if not force and order.index(scale) > order.index(benchmark.max_scale):
+                results.append({**entry, "skipped": f"beyond max scale '{benchmark.max_scale}'"})
+                continue
+            inputs = benchmark.setup(cache, scale, seed, options)
+            times = []
+            for _ in range(repeat):
+                gc.collect()
+                start = time.perf_counter()
+                counters = benchmark.run(inputs)
+                times.append(time.perf_counter() - start)
+            results.append({
+                **entry,
+                "times": times,
+                "min_seconds": min(times),
+                "median_seconds": statistics.median(times),
+                "mean_seconds": statistics.fmean(times),
+                "stdev_seconds": statistics.stdev(times) if len(times) > 1 else 0.0,
+                "counters": counters,
+            })
+    return {
+        "version": REPORT_VERSION,
+        "environment": environment(),
+        "config": {"scales": list(scales), "benchmarks": list(benchmarks), "repeat": repeat,
+                   "seed": seed, **options},
+        "results": results,
+    }
+
+
+def save_report(report: Dict, path):
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+
+
+def load_report(path) -> Dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare_reports(current: Dict, baseline: Dict, threshold: float = 0.25,
+                    min_seconds: float = 0.005, metric: str = "median_seconds") -> List[Dict]:
+    """
+    Compare the results of two reports pair by pair.
+
+    A pair regresses when its time grew by more than `threshold` (a
+    fraction) and by more than `min_seconds`, which keeps millisecond noise
+    from failing a run; a symmetric drop counts as an improvement.
+
+    Returns:
+        One row per benchmark and scale in `current` with baseline and
+        current times, their ratio, and a status of 'regression',
+        'improvement', 'ok', 'new' (no baseline) or 'skipped'
+    """
+    reference = {(r["benchmark"], r["scale"]): r for r in baseline.get("results", [])}
+    rows = []
+    for result in current["results"]:
+        key = (result["benchmark"], result["scale"])
+        row = {"benchmark": key[0], "scale": key[1], "baseline_seconds": None,
+               "current_seconds": result.get(metric), "ratio": None}
+        before = reference.get(key)
+        if "skipped" in result:
+            row["status"] = "skipped"
+        elif before is None or metric not in before:
+            row["status"] = "new"
+        else:
+            row["baseline_seconds"] = before[metric]
+            row["ratio"] = result[metric] / before[metric] if before[metric] > 0 else float('inf')
+            change = result[metric] - before[metric]
+            if change > min_seconds and result[metric] > before[metric] * (1 + threshold):
+                row["status"] = "regression"
+            elif -change > min_seconds and result[metric] < before[metric] / (1 + threshold):
+                row["status"] = "improvement"
+            else:
+                row["status"] = "ok"
+        rows.append(row)
+    return rows
@@ -1,15 +1,129 @@
 from ortools.sat.python import cp_model
+import numpy as np
 from app.core.latency import LatencyEstimator, estimate_transfer_time
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple, Any
+from app.core.pass_table import NO_ID, PassTable, as_pass_table
+from app.core.workers import available_cores
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Dict, Optional, Tuple, Any
 import logging
-from dataclasses import dataclass
+import math
+import multiprocessing
+import random
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
 from enum import Enum
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Station assumed for passes that are not tagged with one (single-site legacy data)
+DEFAULT_GROUND_STATION = "ISTRAC Bangalore"
+
+def _parse_utc(value) -> datetime:
+    """Parse an ISO timestamp (or datetime), treating naive values as UTC."""
+    dt = datetime.fromisoformat(value) if isinstance(value, str) else value
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+def _format_utc(dt: datetime) -> str:
+    """Format a datetime as an ISO UTC timestamp with a trailing Z."""
+    return dt.astimezone(timezone.utc).replace(tzinfo=None).isoformat() + "Z"
+
+def _pass_bounds(assignment: Dict) -> Tuple[float, float]:
+    """Rise and set of an assignment's pass in POSIX seconds, parsed only for hand-built assignments."""
+    if 'rise_ts' in assignment:
+        return assignment['rise_ts'], assignment['set_ts']
+    return (_parse_utc(assignment['pass']['rise_time']).timestamp(),
+            _parse_utc(assignment['pass']['set_time']).timestamp())
+
+def station_capacities(ground_stations: List[Dict]) -> Dict[str, int]:
+    """Map station names to their number of antennas (default 1)."""
+    return {station['name']: int(station.get('antennas', 1)) for station in ground_stations}
+
+@dataclass(frozen=True)
+class TimeGrid:
+    """
+    Model time: integer ticks of `resolution` seconds counted from the POSIX
+    second `origin` (the start of the horizon), so CP-SAT sees small domains.
+    """
+    origin: int
+    resolution: int = 1
+
+    def ceil(self, posix):
+        """First tick at or after POSIX time(s) `posix`."""
+        return -((self.origin - np.asarray(posix, dtype=np.float64)) // self.resolution).astype(np.int64)
+
+    def floor(self, posix):
+        """Last tick at or before POSIX time(s) `posix`."""
+        return ((np.asarray(posix, dtype=np.float64) - self.origin) // self.resolution).astype(np.int64)
+
+    def nearest(self, posix: float) -> int:
+        return int(round((posix - self.origin) / self.resolution))
+
+    def length(self, seconds: float) -> int:
+        """Ticks covering `seconds`, rounded up."""
+        return int(math.ceil(seconds / self.resolution))
+
+    def to_posix(self, tick: int) -> int:
+        return self.origin + int(tick) * self.resolution
+
+@dataclass(frozen=True)
+class SolverProfile:
+    """
+    Named set of CP-SAT parameters.
+    
+    The search worker count follows the cores available to the process,
+    clamped to [min_workers, max_workers]; max_workers=None means every
+    core. Fields left at None keep the CP-SAT default.
+    """
+    name: str
+    min_workers: int = 1
+    max_workers: Optional[int] = None
+    linearization_level: int = 1
+    cp_model_presolve: bool = True
+    max_presolve_iterations: Optional[int] = None
+    symmetry_level: int = 2
+    random_seed: Optional[int] = None
+    
+    def workers(self) -> int:
+        cores = available_cores()
+        if self.max_workers is not None:
+            cores = min(cores, self.max_workers)
+        return max(self.min_workers, cores)
+    
+    def apply(self, parameters, num_workers: int = None):
+        """Copy the profile into CP-SAT parameters; `num_workers` overrides the worker count."""
+        parameters.num_search_workers = num_workers or self.workers()
+        parameters.linearization_level = self.linearization_level
+        parameters.cp_model_presolve = self.cp_model_presolve
+        if self.max_presolve_iterations is not None:
+            parameters.max_presolve_iterations = self.max_presolve_iterations
+        parameters.symmetry_level = self.symmetry_level
+        if self.random_seed is not None:
+            parameters.random_seed = self.random_seed
+
+SOLVER_PROFILES = {
+    # First solutions quickly: few workers, no LP relaxation, light presolve
+    "fast": SolverProfile("fast", min_workers=1, max_workers=8, linearization_level=0,
+                          max_presolve_iterations=1, symmetry_level=0),
+    # CP-SAT defaults; at least 4 workers so the portfolio includes LNS
+    "balanced": SolverProfile("balanced", min_workers=4, max_workers=16),
+    # Proving optimality on big machines: every core, full LP and symmetry handling
+    "thorough": SolverProfile("thorough", min_workers=8, linearization_level=2, symmetry_level=4),
+}
+
+def get_solver_profile(profile="balanced", random_seed: int = None) -> SolverProfile:
+    """Resolve a profile name (or SolverProfile), optionally with a fixed random seed."""
+    if not isinstance(profile, SolverProfile):
+        if profile not in SOLVER_PROFILES:
+            raise ValueError(f"Unknown solver profile '{profile}', expected one of {tuple(SOLVER_PROFILES)}")
+        profile = SOLVER_PROFILES[profile]
+    if random_seed is not None:
+        profile = replace(profile, random_seed=random_seed)
+    return profile
+
 class OptimizationObjective(Enum):
     """Enumeration of available optimization objectives."""
     MAXIMIZE_DATA_THROUGHPUT = "maximize_data"
@@ -38,6 +152,19 @@ class OptimizationResult:
     resource_utilization: float
     constraint_violations: List[str]
     solution_quality: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+@dataclass
+class SolutionUpdate:
+    """An improved incumbent reported while the solver is still searching."""
+    sequence: int
+    objective_value: float
+    best_bound: float
+    gap: float
+    elapsed_seconds: float
+    contact_count: int
+    contacts_added: List[Dict]
+    contacts_removed: List[str]
 
 class AdvancedSchedulingOptimizer:
     """
@@ -45,22 +172,79 @@ class AdvancedSchedulingOptimizer:
     Provides comprehensive optimization capabilities for satellite ground station scheduling.
     """
     
-    def __init__(self):
+    def __init__(self, solver_profile="balanced", random_seed: int = None):
         self.latency_estimator = LatencyEstimator()
         self.solver_timeout_seconds = 300  # 5 minutes default
+        self.time_resolution_seconds = 1
+        self.prune_dominated = True
+        # CP-SAT's own symmetry detection (see SolverProfile.symmetry_level)
+        # has handled identical demands better than explicit ordering
+        self.symmetry_breaking = False
+        self.solver_profile = get_solver_profile(solver_profile, random_seed)
         self.solution_pool_size = 10
         
-    def preprocess_scheduling_data(self, passes: List[Dict], demands: List[Dict]) -> Tuple[List[Dict], Dict]:
+    def _index_passes(self, table: PassTable) -> Dict[Any, Tuple[np.ndarray, np.ndarray]]:
+        """
+        Index passes by satellite, each group sorted by pass duration.
+        
+        Passes are grouped under their satellite name and NORAD ID when
+        present; untagged (legacy single-satellite) passes are grouped under
+        None and match every demand. Passes with an elevation profile are
+        left out: their required contact time depends on the pass (see
+        preprocess_scheduling_data).
+        
+        Returns:
+            Mapping of group key to (sorted durations, pass indices)
+        """
+        durations = table.duration_seconds
+        eligible = np.ones(len(table), dtype=bool)
+        if table.profiles is not None:
+            eligible[[i for i, profile in enumerate(table.profiles) if profile is not None]] = False
+        
+        index = {}
+        for column, to_key in (("satellite", lambda v: None if v == NO_ID else ('name', table.satellites[v])),
+                               ("norad_id", lambda v: None if v == NO_ID else ('norad', v))):
+            values = table.data[column]
+            rows = np.flatnonzero(eligible if column == "satellite" else eligible & (values != NO_ID))
+            # Group by column value, each group sorted by duration
+            order = rows[np.lexsort((durations[rows], values[rows]))]
+            groups, starts = np.unique(values[order], return_index=True)
+            for value, group in zip(groups.tolist(), np.split(order, starts[1:])):
+                index[to_key(value)] = (durations[group], group)
+        return index
+
+    def _pass_keys(self, table: PassTable, p_idx: int) -> List[Any]:
+        satellite = table.satellite_name(p_idx)
+        keys = [None if satellite is None else ('name', satellite)]
+        norad_id = int(table.data["norad_id"][p_idx])
+        if norad_id != NO_ID:
+            keys.append(('norad', norad_id))
+        return keys
+
+    def preprocess_scheduling_data(self, passes, demands: List[Dict]) -> Tuple[List[Dict], Dict]:
         """
         Preprocess and validate scheduling data.
         
+        A demand can only use passes of its own satellite (matched by name, or
+        by 'norad_id' when the demand carries one). Required contact time
+        does not depend on the pass, so it is computed once per demand and the
+        feasible passes are found by binary search in the duration-sorted
+        pass index instead of estimating every (pass, demand) pair. Passes
+        that carry an elevation profile get one vectorized estimate per pass
+        over the demands of their satellite instead.
+        
         Args:
-            passes: List of satellite passes
+            passes: PassTable, or list of satellite pass dictionaries
             demands: List of data demands
             
         Returns:
-            Tuple of (feasible_assignments, metadata)
+            Tuple of (feasible_assignments, metadata). Each assignment keeps
+            its pass as a dictionary under 'pass' (the caller's own for a
+            list) and its rise and set as POSIX seconds under 'rise_ts' and
+            'set_ts'. On profiled passes, 'start_slack_seconds' bounds how
+            long after rise the contact may start and still deliver its data.
         """
+        table = as_pass_table(passes)
         feasible_assignments = []
         metadata = {
             "total_passes": len(passes),
@@ -69,53 +253,312 @@ class AdvancedSchedulingOptimizer:
             "infeasible_combinations": 0
         }
         
-        for p_idx, pass_info in enumerate(passes):
-            for d_idx, demand in enumerate(demands):
-                # Use enhanced latency estimation
-                estimation = self.latency_estimator.estimate_transfer_time_detailed(
-                    pass_info, demand['data_mb']
-                )
-                
-                if estimation and estimation['is_feasible']:
-                    assignment = {
-                        "pass_idx": p_idx,
-                        "demand_idx": d_idx,
-                        "pass": pass_info,
-                        "demand": demand,
-                        "duration_seconds": int(estimation['total_required_time_seconds']),
-                        "data_efficiency": estimation['data_efficiency'],
-                        "pass_utilization": estimation['pass_utilization'],
-                        "effective_data_rate": estimation['effective_data_rate_mbps'],
-                        "priority": demand.get('priority', 1.0),
-                        "deadline": demand.get('deadline'),
-                        "estimation_details": estimation
-                    }
-                    feasible_assignments.append(assignment)
-                    metadata["feasible_combinations"] += 1
-                else:
-                    metadata["infeasible_combinations"] += 1
+        pass_index = self._index_passes(table)
+        
+        # Pass-independent requirements, one estimate per demand
+        requirements = [
+            self.latency_estimator.estimate_demand_requirements(demand['data_mb'])
+            for demand in demands
+        ]
+        required_times = np.array([r['total_required_time'] for r in requirements])
+        
+        # Demands grouped by the pass index keys they can use
+        demand_groups = {}
+        for d_idx, demand in enumerate(demands):
+            keys = {None, ('name', demand['satellite'])}
+            if 'norad_id' in demand:
+                keys.add(('norad', demand['norad_id']))
+            for key in keys:
+                demand_groups.setdefault(key, []).append(d_idx)
+        
+        candidates = {}
+        for key, d_indices in demand_groups.items():
+            if key not in pass_index:
+                continue
+            durations, p_indices = pass_index[key]
+            d_indices = np.asarray(d_indices)
+            # First pass long enough for each demand; everything after it fits too
+            first_fit = np.searchsorted(durations, required_times[d_indices], side='left')
+            for d_idx, start in zip(d_indices.tolist(), first_fit.tolist()):
+                for position in range(start, len(durations)):
+                    candidates[(int(p_indices[position]), d_idx)] = (float(durations[position]),
+                                                                     requirements[d_idx])
+        
+        # Profiled passes: throughput integrated over the pass for every demand at once
+        data_mb = np.array([demand['data_mb'] for demand in demands], dtype=np.float64)
+        durations = table.duration_seconds
+        for p_idx in range(len(table)) if table.profiles is not None else ():
+            if not table.has_profile(p_idx):
+                continue
+            duration = float(durations[p_idx])
+            d_indices = sorted({d_idx for key in self._pass_keys(table, p_idx)
+                                for d_idx in demand_groups.get(key, ())})
+            if not d_indices:
+                continue
+            profiled = self.latency_estimator.estimate_profile_requirements(
+                table.profiles[p_idx], data_mb[d_indices])
+            fitting = np.flatnonzero(profiled['total_required_time'] <= duration)
+            # Contact lengths hold from rise; later starts only while the profile still delivers
+            slack = self.latency_estimator.estimate_profile_start_slack(
+                table.profiles[p_idx], data_mb[d_indices][fitting],
+                np.floor(np.round(profiled['total_required_time'][fitting], 2)))
+            for position, start_slack in zip(fitting.tolist(), slack.tolist()):
+                candidates[(p_idx, d_indices[position])] = (duration, {
+                    **{key: float(value[position]) if np.ndim(value) else float(value)
+                       for key, value in profiled.items()},
+                    "start_slack_seconds": start_slack,
+                })
+        
+        # Legacy dictionaries only for the passes that are used
+        candidates = sorted(candidates.items())
+        used = sorted({p_idx for (p_idx, _), _ in candidates})
+        records = passes if isinstance(passes, list) else dict(zip(used, table.records(used)))
+        rises, sets = table.rise_seconds.tolist(), table.set_seconds.tolist()
+        
+        for (p_idx, d_idx), (duration, demand_requirements) in candidates:
+            pass_info = records[p_idx]
+            demand = demands[d_idx]
+            estimation = self.latency_estimator.format_estimation(demand_requirements, duration)
+            assignment = {
+                "pass_idx": p_idx,
+                "demand_idx": d_idx,
+                "ground_station": pass_info.get('ground_station', DEFAULT_GROUND_STATION),
+                "pass": pass_info,
+                "rise_ts": rises[p_idx],
+                "set_ts": sets[p_idx],
+                "demand": demand,
+                "duration_seconds": int(estimation['total_required_time_seconds']),
+                "data_efficiency": estimation['data_efficiency'],
+                "pass_utilization": estimation['pass_utilization'],
+                "effective_data_rate": estimation['effective_data_rate_mbps'],
+                "priority": demand.get('priority', 1.0),
+                "deadline": demand.get('deadline'),
+                "estimation_details": estimation
+            }
+            if 'start_slack_seconds' in demand_requirements:
+                assignment['start_slack_seconds'] = demand_requirements['start_slack_seconds']
+            feasible_assignments.append(assignment)
+        
+        metadata["feasible_combinations"] = len(feasible_assignments)
+        metadata["infeasible_combinations"] = len(passes) * len(demands) - len(feasible_assignments)
         
         logger.info(f"Preprocessing complete: {metadata['feasible_combinations']} feasible assignments from {metadata['total_passes']} passes and {metadata['total_demands']} demands")
         
         return feasible_assignments, metadata
 
+    def _start_windows(self, assignments: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Earliest and latest contact start of every assignment, in integer
+        POSIX seconds: from rise until the contact would overrun set, capped
+        at the demand's deadline and, on profiled passes, at the start slack
+        its link profile allows. Deadlines are parsed once per demand.
+        """
+        deadlines = {}
+        earliest = np.empty(len(assignments), dtype=np.int64)
+        latest = np.empty(len(assignments), dtype=np.int64)
+        for i, assignment in enumerate(assignments):
+            rise_ts, set_ts = _pass_bounds(assignment)
+            rise, set_ = math.ceil(rise_ts), math.floor(set_ts)
+            last = set_ - assignment['duration_seconds']
+            if 'start_slack_seconds' in assignment:
+                last = min(last, math.floor(rise_ts + assignment['start_slack_seconds']))
+            if assignment.get('deadline'):
+                d_idx = assignment['demand_idx']
+                if d_idx not in deadlines:
+                    deadlines[d_idx] = math.floor(_parse_utc(assignment['deadline']).timestamp())
+                last = min(last, deadlines[d_idx])
+            earliest[i] = rise
+            latest[i] = max(rise, last)
+        return earliest, latest
+
+    def _index_assignments(self, feasible_assignments: List[Dict]) -> Dict[str, Dict[Any, List[int]]]:
+        """
+        Group assignment positions by demand, pass, satellite and ground station
+        in a single pass, so that model construction stays linear.
+        """
+        index = {"by_demand": {}, "by_pass": {}, "by_satellite": {}, "by_station": {}}
+        by_demand, by_pass = index["by_demand"], index["by_pass"]
+        by_satellite, by_station = index["by_satellite"], index["by_station"]
+        for i, assignment in enumerate(feasible_assignments):
+            by_demand.setdefault(assignment['demand_idx'], []).append(i)
+            by_pass.setdefault(assignment['pass_idx'], []).append(i)
+            by_satellite.setdefault(assignment['demand']['satellite'], []).append(i)
+            by_station.setdefault(assignment['ground_station'], []).append(i)
+        return index
+
+    def prune_assignments(self, feasible_assignments: List[Dict]) -> Tuple[List[Dict], Dict[str, int]]:
+        """
+        Drop assignments that no optimal schedule needs.
+        
+        An assignment is removed when its pass rises after the demand's
+        deadline (the model could only fix it to zero), or when another
+        assignment of the same demand at the same ground station dominates
+        it: a start window containing its own, a contact no longer, and a
+        data efficiency no lower. Whatever schedule uses the dominated
+        assignment can use the dominating one at the same start instead,
+        since both occupy the same station and satellite and score at least
+        as well under every objective. Of identical assignments the first is
+        kept.
+        
+        Returns:
+            Tuple of (kept assignments in their original order, counts of
+            'candidates', 'late', 'dominated' and 'removed' assignments)
+        """
+        count = len(feasible_assignments)
+        keep = ~self._late_assignments(feasible_assignments)
+        earliest, latest = self._start_windows(feasible_assignments)
+        
+        groups = {}
+        for i in np.flatnonzero(keep).tolist():
+            assignment = feasible_assignments[i]
+            groups.setdefault((assignment['demand_idx'], assignment['ground_station']), []).append(i)
+        late = count - int(keep.sum())
+        
+        durations = np.array([a['duration_seconds'] for a in feasible_assignments], dtype=np.int64)
+        efficiency = np.array([a['data_efficiency'] for a in feasible_assignments], dtype=np.float64)
+        for positions in groups.values():
+            if len(positions) < 2:
+                continue
+            positions = np.asarray(positions)
+            e, l = earliest[positions], latest[positions]
+            dur, eff = durations[positions], efficiency[positions]
+            # covers[k, i]: assignment k can stand in for assignment i
+            covers = ((e[:, None] <= e) & (l[:, None] >= l) &
+                      (dur[:, None] <= dur) & (eff[:, None] >= eff))
+            identical = ((e[:, None] == e) & (l[:, None] == l) &
+                         (dur[:, None] == dur) & (eff[:, None] == eff))
+            first = positions[:, None] < positions
+            dominated = (covers & (~identical | first)).any(axis=0)
+            keep[positions[dominated]] = False
+        
+        kept = [a for a, k in zip(feasible_assignments, keep.tolist()) if k]
+        report = {
+            "candidates": count,
+            "late": late,
+            "dominated": count - late - len(kept),
+            "removed": count - len(kept),
+        }
+        logger.info(f"Pruned {report['removed']} of {count} assignments "
+                    f"({late} past deadline, {report['dominated']} dominated)")
+        return kept, report
+
+    def _late_assignments(self, feasible_assignments: List[Dict]) -> np.ndarray:
+        """Mask of assignments whose pass rises after their demand's deadline."""
+        deadlines = {}
+        late = np.zeros(len(feasible_assignments), dtype=bool)
+        for i, assignment in enumerate(feasible_assignments):
+            d_idx = assignment['demand_idx']
+            if d_idx not in deadlines:
+                deadline = assignment.get('deadline')
+                deadlines[d_idx] = _parse_utc(deadline).timestamp() if deadline else math.inf
+            late[i] = _pass_bounds(assignment)[0] > deadlines[d_idx]
+        return late
+
+    def _add_symmetry_breaking(self, model: cp_model.CpModel, assignment_vars: Dict,
+                               feasible_assignments: List[Dict], index: Dict,
+                               earliest: np.ndarray, latest: np.ndarray,
+                               bonus: Dict[int, int] = None) -> Dict[str, int]:
+        """
+        Order interchangeable demands.
+        
+        Demands of the same satellite, size, priority and deadline whose
+        assignments cover the same passes with the same windows can swap
+        places in any schedule. Within each such group a demand may only use
+        one of its first k passes if the demand before it does, for every k,
+        which leaves one of the otherwise equivalent permutations (scheduled
+        demands first, in pass order).
+        
+        Returns:
+            Counts of symmetric 'groups', the 'demands' in them and the
+            'constraints' added
+        """
+        bonus = bonus or {}
+        groups = {}
+        for d_idx, positions in index['by_demand'].items():
+            demand = feasible_assignments[positions[0]]['demand']
+            # Same rank in every demand of a group means the same pass
+            ranked = sorted(positions, key=lambda i: (earliest[i], feasible_assignments[i]['pass_idx']))
+            signature = (
+                demand['satellite'], demand.get('norad_id'), demand['data_mb'],
+                demand.get('priority', 1.0), demand.get('deadline'),
+                tuple((feasible_assignments[i]['pass_idx'], feasible_assignments[i]['duration_seconds'],
+                       int(earliest[i]), int(latest[i]), bonus.get(i, 0)) for i in ranked)
+            )
+            groups.setdefault(signature, []).append(ranked)
+        
+        stats = {"groups": 0, "demands": 0, "constraints": 0}
+        for members in groups.values():
+            if len(members) < 2:
+                continue
+            stats["groups"] += 1
+            stats["demands"] += len(members)
+            for before, after in zip(members, members[1:]):
+                for k in range(1, len(before) + 1):
+                    model.Add(cp_model.LinearExpr.Sum([assignment_vars[i] for i in before[:k]]) >=
+                              cp_model.LinearExpr.Sum([assignment_vars[i] for i in after[:k]]))
+                stats["constraints"] += len(before)
+        return stats
+
     def create_cp_sat_model(self, feasible_assignments: List[Dict], 
                            objective: OptimizationObjective = OptimizationObjective.MAXIMIZE_DATA_THROUGHPUT,
-                           constraints: List[SchedulingConstraint] = None) -> Tuple[cp_model.CpModel, Dict]:
+                           constraints: List[SchedulingConstraint] = None,
+                           station_capacities: Dict[str, int] = None,
+                           objective_bonus: Dict[int, int] = None,
+                           busy: Dict[Tuple[str, str], List[Tuple[float, float]]] = None,
+                           not_before: float = None,
+                           time_resolution: int = None) -> Tuple[cp_model.CpModel, Dict]:
         """
         Create a CP-SAT optimization model with advanced constraints and objectives.
         
+        Each contact may start anywhere in its pass that leaves room for it
+        (and no later than its demand's deadline), so several demands can
+        share a long pass back to back.
+        
+        Times are integer ticks from the earliest possible contact start
+        (see TimeGrid, stored in variables['time_grid']) rather than POSIX
+        seconds. A coarser resolution shrinks every domain further: starts
+        are rounded inward to the grid, contacts occupy whole ticks, and an
+        assignment whose start window holds no grid point is left out.
+        Solutions are decoded back to POSIX seconds by _solve_selection.
+        
+        With symmetry_breaking on, interchangeable demands are put in a
+        fixed order (see _add_symmetry_breaking) and the counts reported in
+        variables['symmetry'].
+        
+        Model construction is linear in the number of assignments: every
+        constraint group is built from indexes computed once up front. The
+        time spent in each phase is recorded in variables['build_profile'].
+        
         Args:
             feasible_assignments: List of feasible pass-demand assignments
             objective: Optimization objective
             constraints: Additional scheduling constraints
+            station_capacities: Number of antennas per ground station name (default 1)
+            objective_bonus: Extra objective weight per assignment position
+            busy: Time already taken outside the model, as (start, end) lists keyed
+                by ('station', name) and ('satellite', name)
+            not_before: Earliest POSIX time any contact may start
+            time_resolution: Seconds per model tick (default: time_resolution_seconds)
             
         Returns:
             Tuple of (model, variables_dict)
         """
+        profile = {}
+        phase_start = build_start = time.perf_counter()
+        
+        def mark(phase):
+            nonlocal phase_start
+            now = time.perf_counter()
+            profile[phase] = now - phase_start
+            phase_start = now
+        
         model = cp_model.CpModel()
         variables = {}
         
+        index = self._index_assignments(feasible_assignments)
+        variables['index'] = index
+        mark('index')
+        
         # Create assignment variables
         assignment_vars = {}
         for i, assignment in enumerate(feasible_assignments):
@@ -123,49 +566,110 @@ class AdvancedSchedulingOptimizer:
             assignment_vars[i] = model.NewBoolVar(var_name)
         
         variables['assignments'] = assignment_vars
+        mark('variables')
         
         # Constraint 1: Each demand can be scheduled at most once
         demand_constraints = {}
-        for d_idx in set(a['demand_idx'] for a in feasible_assignments):
-            relevant_assignments = [
-                assignment_vars[i] for i, a in enumerate(feasible_assignments) 
-                if a['demand_idx'] == d_idx
-            ]
+        for d_idx, positions in index['by_demand'].items():
+            relevant_assignments = [assignment_vars[i] for i in positions]
             model.AddAtMostOne(relevant_assignments)
             demand_constraints[d_idx] = relevant_assignments
+        mark('demand_constraints')
         
-        # Constraint 2: No overlapping contacts (ground station availability)
+        # Constraint 2: Ground station antenna availability, one resource per station
+        earliest, latest = self._start_windows(feasible_assignments)
+        if not_before is not None:
+            earliest = np.maximum(earliest, math.ceil(not_before))
+            latest = np.maximum(latest, earliest)
+        grid = TimeGrid(int(earliest.min()) if len(earliest) else 0,
+                        int(time_resolution or self.time_resolution_seconds))
+        first, last = grid.ceil(earliest).tolist(), grid.floor(latest).tolist()
+        start_vars = []
         intervals = []
+        off_grid = []
         for i, assignment in enumerate(feasible_assignments):
-            start_time = int(datetime.fromisoformat(assignment['pass']['rise_time']).timestamp())
-            duration = assignment['duration_seconds']
-            end_time = start_time + duration
-            
-            interval = model.NewOptionalIntervalVar(
-                start_time, duration, end_time, assignment_vars[i], f'interval_{i}'
+            if last[i] < first[i]:
+                off_grid.append(assignment_vars[i].Not())
+            start = model.NewIntVar(first[i], max(first[i], last[i]), f'start_{i}')
+            interval = model.NewOptionalFixedSizeIntervalVar(
+                start, grid.length(assignment['duration_seconds']), assignment_vars[i], f'interval_{i}'
             )
+            start_vars.append(start)
             intervals.append(interval)
+        if off_grid:
+            model.AddBoolAnd(off_grid)
+        
+        busy = busy or {}
+        fixed = {}
+        for key, windows in busy.items():
+            for b_start, b_end in windows:
+                b_start, b_end = int(grid.floor(b_start)), int(grid.ceil(b_end))
+                fixed.setdefault(key, []).append(
+                    model.NewIntervalVar(b_start, b_end - b_start, b_end, f'busy_{key[0]}_{b_start}'))
+        
+        station_intervals = {
+            station: [intervals[i] for i in positions]
+            for station, positions in index['by_station'].items()
+        }
+        station_capacities = station_capacities or {}
+        for station, station_ivs in station_intervals.items():
+            capacity = station_capacities.get(station, 1)
+            station_ivs = station_ivs + fixed.get(('station', station), [])
+            if capacity <= 1:
+                model.AddNoOverlap(station_ivs)
+            else:
+                # Every contact occupies one antenna
+                model.AddCumulative(station_ivs, [1] * len(station_ivs), capacity)
+        
+        # A satellite has a single downlink, so it cannot run two contacts at
+        # once; a single-antenna station already keeps its contacts apart
+        for satellite, positions in index['by_satellite'].items():
+            stations = {feasible_assignments[i]['ground_station'] for i in positions}
+            satellite_busy = fixed.get(('satellite', satellite), [])
+            if len(stations) > 1 or satellite_busy or any(
+                    station_capacities.get(station, 1) > 1 for station in stations):
+                model.AddNoOverlap([intervals[i] for i in positions] + satellite_busy)
         
-        model.AddNoOverlap(intervals)
+        variables['starts'] = start_vars
+        variables['time_grid'] = grid
         variables['intervals'] = intervals
+        variables['station_intervals'] = station_intervals
+        mark('resource_constraints')
+        
+        if self.symmetry_breaking:
+            variables['symmetry'] = self._add_symmetry_breaking(
+                model, assignment_vars, feasible_assignments, index, earliest, latest, objective_bonus)
+        mark('symmetry_breaking')
         
         # Constraint 3: Priority-based scheduling constraints
         if constraints:
-            self._add_custom_constraints(model, assignment_vars, feasible_assignments, constraints)
+            self._add_custom_constraints(model, assignment_vars, feasible_assignments, constraints, index)
+        mark('custom_constraints')
         
         # Constraint 4: Deadline constraints
-        self._add_deadline_constraints(model, assignment_vars, feasible_assignments)
+        self._add_deadline_constraints(model, assignment_vars, feasible_assignments, index)
+        mark('deadline_constraints')
         
         # Define objective based on selected strategy
-        self._set_optimization_objective(model, assignment_vars, feasible_assignments, objective)
+        self._set_optimization_objective(model, assignment_vars, feasible_assignments, objective,
+                                         objective_bonus)
+        mark('objective')
         
         variables['feasible_assignments'] = feasible_assignments
         
+        profile['total'] = time.perf_counter() - build_start
+        variables['build_profile'] = profile
+        logger.info(f"Model built: {len(feasible_assignments)} assignments in {profile['total']:.3f}s")
+        
         return model, variables
 
     def _add_custom_constraints(self, model: cp_model.CpModel, assignment_vars: Dict, 
-                               feasible_assignments: List[Dict], constraints: List[SchedulingConstraint]):
+                               feasible_assignments: List[Dict], constraints: List[SchedulingConstraint],
+                               index: Dict = None):
         """Add custom scheduling constraints to the model."""
+        if index is None:
+            index = self._index_assignments(feasible_assignments)
+        
         for constraint in constraints:
             if constraint.constraint_type == "minimum_gap":
                 # Minimum gap between consecutive contacts
@@ -175,16 +679,9 @@ class AdvancedSchedulingOptimizer:
             elif constraint.constraint_type == "maximum_contacts_per_satellite":
                 # Limit contacts per satellite
                 max_contacts = constraint.parameters.get("max_contacts", 5)
-                satellite_groups = {}
-                
-                for i, assignment in enumerate(feasible_assignments):
-                    sat_name = assignment['demand']['satellite']
-                    if sat_name not in satellite_groups:
-                        satellite_groups[sat_name] = []
-                    satellite_groups[sat_name].append(assignment_vars[i])
-                
-                for sat_name, sat_vars in satellite_groups.items():
-                    model.Add(sum(sat_vars) <= max_contacts)
+                for sat_name, positions in index['by_satellite'].items():
+                    sat_vars = [assignment_vars[i] for i in positions]
+                    model.Add(cp_model.LinearExpr.Sum(sat_vars) <= max_contacts)
             
             elif constraint.constraint_type == "priority_ordering":
                 # Higher priority demands should be scheduled first when possible
@@ -192,122 +689,143 @@ class AdvancedSchedulingOptimizer:
                 pass
 
     def _add_deadline_constraints(self, model: cp_model.CpModel, assignment_vars: Dict, 
-                                 feasible_assignments: List[Dict]):
+                                 feasible_assignments: List[Dict], index: Dict = None):
         """Add deadline constraints to ensure time-critical demands are met."""
-        current_time = datetime.now()
+        if index is None:
+            index = self._index_assignments(feasible_assignments)
         
-        for i, assignment in enumerate(feasible_assignments):
-            deadline = assignment['demand'].get('deadline')
-            if deadline:
-                deadline_dt = datetime.fromisoformat(deadline) if isinstance(deadline, str) else deadline
-                pass_time = datetime.fromisoformat(assignment['pass']['rise_time'])
-                
+        late = []
+        for d_idx, positions in index['by_demand'].items():
+            deadline = feasible_assignments[positions[0]]['demand'].get('deadline')
+            if not deadline:
+                continue
+            deadline_ts = _parse_utc(deadline).timestamp()
+            
+            for i in positions:
                 # If pass is after deadline, don't allow this assignment
-                if pass_time > deadline_dt:
-                    model.Add(assignment_vars[i] == 0)
-
-    def _set_optimization_objective(self, model: cp_model.CpModel, assignment_vars: Dict, 
-                                   feasible_assignments: List[Dict], objective: OptimizationObjective):
-        """Set the optimization objective based on the selected strategy."""
+                if _pass_bounds(feasible_assignments[i])[0] > deadline_ts:
+                    late.append(assignment_vars[i].Not())
         
+        if late:
+            model.AddBoolAnd(late)
+
+    def _objective_coefficients(self, feasible_assignments: List[Dict], objective: OptimizationObjective,
+                                bonus: Dict[int, int] = None) -> List[int]:
+        """Objective weight of every assignment for the selected strategy."""
         if objective == OptimizationObjective.MAXIMIZE_DATA_THROUGHPUT:
             # Maximize total data scheduled
-            total_data = sum(
-                int(assignment['demand']['data_mb']) * assignment_vars[i]
-                for i, assignment in enumerate(feasible_assignments)
-            )
-            model.Maximize(total_data)
+            coefficients = [int(a['demand']['data_mb']) for a in feasible_assignments]
             
         elif objective == OptimizationObjective.MAXIMIZE_PRIORITY_WEIGHTED:
             # Maximize priority-weighted data throughput
-            weighted_value = sum(
-                int(assignment['demand']['data_mb'] * assignment['priority']) * assignment_vars[i]
-                for i, assignment in enumerate(feasible_assignments)
-            )
-            model.Maximize(weighted_value)
+            coefficients = [int(a['demand']['data_mb'] * a['priority']) for a in feasible_assignments]
             
         elif objective == OptimizationObjective.BALANCE_EFFICIENCY_FAIRNESS:
-            # Balance between efficiency and fairness
-            efficiency_component = sum(
-                int(assignment['data_efficiency'] * 1000) * assignment_vars[i]
-                for i, assignment in enumerate(feasible_assignments)
-            )
-            
-            data_component = sum(
-                int(assignment['demand']['data_mb']) * assignment_vars[i]
-                for i, assignment in enumerate(feasible_assignments)
-            )
-            
-            # Weighted combination
-            model.Maximize(efficiency_component + data_component)
+            # Balance between efficiency and fairness: weighted combination of
+            # efficiency and data components
+            coefficients = [
+                int(a['data_efficiency'] * 1000) + int(a['demand']['data_mb'])
+                for a in feasible_assignments
+            ]
             
         else:  # Default to data throughput
-            total_data = sum(
-                int(assignment['demand']['data_mb']) * assignment_vars[i]
-                for i, assignment in enumerate(feasible_assignments)
-            )
-            model.Maximize(total_data)
+            coefficients = [int(a['demand']['data_mb']) for a in feasible_assignments]
+        
+        for i, extra in (bonus or {}).items():
+            coefficients[i] += extra
+        return coefficients
 
-    def solve_optimization_model(self, model: cp_model.CpModel, variables: Dict) -> OptimizationResult:
+    def _set_optimization_objective(self, model: cp_model.CpModel, assignment_vars: Dict, 
+                                   feasible_assignments: List[Dict], objective: OptimizationObjective,
+                                   bonus: Dict[int, int] = None):
+        """Set the optimization objective based on the selected strategy."""
+        variables = [assignment_vars[i] for i in range(len(feasible_assignments))]
+        coefficients = self._objective_coefficients(feasible_assignments, objective, bonus)
+        model.Maximize(cp_model.LinearExpr.WeightedSum(variables, coefficients))
+
+    def solve_optimization_model(self, model: cp_model.CpModel, variables: Dict,
+                                 on_solution: Callable[[SolutionUpdate], None] = None,
+                                 target_gap: float = None,
+                                 no_improvement_seconds: float = None) -> OptimizationResult:
         """
         Solve the optimization model and return comprehensive results.
         
+        With `on_solution`, every improved incumbent is reported as a
+        SolutionUpdate while the search goes on, its contacts given as a
+        delta against the previous incumbent. The search stops early once the
+        gap to the best bound is within `target_gap`, or when no better
+        solution has been found for `no_improvement_seconds`.
+        
         Args:
             model: The CP-SAT model to solve
             variables: Dictionary containing model variables
+            on_solution: Called with each improved incumbent
+            target_gap: Relative gap at which to stop
+            no_improvement_seconds: Stop after this long without an improvement
             
         Returns:
-            OptimizationResult with detailed solution information
+            OptimizationResult with detailed solution information;
+            metadata['best_bound'] is the solver's final objective bound
         """
-        solver = cp_model.CpSolver()
-        solver.parameters.max_time_in_seconds = self.solver_timeout_seconds
-        solver.parameters.num_search_workers = 4  # Parallel solving
+        callback = None
+        if on_solution or target_gap or no_improvement_seconds:
+            callback = _IncumbentCallback(variables, self._make_contact, on_solution,
+                                          target_gap, no_improvement_seconds)
+        status, status_name, objective_value, solve_time, selected, starts, best_bound = _solve_selection(
+            model, variables, self.solver_timeout_seconds,
+            relative_gap_limit=target_gap, callback=callback, profile=self.solver_profile
+        )
         
-        start_time = datetime.now()
-        status = solver.Solve(model)
-        solve_time = (datetime.now() - start_time).total_seconds()
+        result = self._build_result(variables, status, status_name,
+                                    objective_value, solve_time, selected, starts)
+        result.metadata['best_bound'] = best_bound
+        if callback is not None:
+            result.metadata['incumbents'] = callback.sequence
+            result.metadata['stop_reason'] = callback.stop_reason
+            result.metadata['first_solution_seconds'] = callback.first_solution_seconds
+        return result
+
+    def _build_result(self, variables: Dict, status: int, status_name: str, objective_value: float,
+                      solve_time: float, selected: List[int],
+                      starts: Dict[int, int] = None) -> OptimizationResult:
+        """
+        Turn the selected assignment positions of a solve into an OptimizationResult.
         
+        Args:
+            variables: Dictionary containing model variables
+            status: CP-SAT status code
+            status_name: CP-SAT status name
+            objective_value: Objective value of the solution (0 if none)
+            solve_time: Solver wall time in seconds
+            selected: Positions of the assignments chosen by the solver
+            starts: POSIX start of each selected contact (default: its pass rise)
+            
+        Returns:
+            OptimizationResult with detailed solution information
+        """
         # Extract solution
         scheduled_contacts = []
         scheduled_demand_indices = set()
         total_data_scheduled = 0
         
-        assignment_vars = variables['assignments']
         feasible_assignments = variables['feasible_assignments']
         
         if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
-            for i, assignment in enumerate(feasible_assignments):
-                if solver.BooleanValue(assignment_vars[i]):
-                    start_dt = datetime.fromisoformat(assignment['pass']['rise_time'])
-                    end_dt = start_dt + timedelta(seconds=assignment['duration_seconds'])
-                    
-                    contact = {
-                        "satellite": assignment['demand']['satellite'],
-                        "ground_station": "ISTRAC Bangalore",  # TODO: Make configurable
-                        "demand_mb": assignment['demand']['data_mb'],
-                        "start_time": assignment['pass']['rise_time'],
-                        "end_time": end_dt.isoformat() + "Z",
-                        "duration_seconds": assignment['duration_seconds'],
-                        "data_efficiency": assignment['data_efficiency'],
-                        "pass_utilization": assignment['pass_utilization'],
-                        "effective_data_rate_mbps": assignment['effective_data_rate'],
-                        "priority": assignment['priority'],
-                        "estimation_details": assignment['estimation_details']
-                    }
-                    
-                    scheduled_contacts.append(contact)
-                    scheduled_demand_indices.add(assignment['demand_idx'])
-                    total_data_scheduled += assignment['demand']['data_mb']
+            for i in selected:
+                assignment = feasible_assignments[i]
+                scheduled_contacts.append(self._make_contact(assignment, None if starts is None else starts[i]))
+                scheduled_demand_indices.add(assignment['demand_idx'])
+                total_data_scheduled += assignment['demand']['data_mb']
         
         # Identify unscheduled demands
-        all_demands = list(set(a['demand'] for a in feasible_assignments))
+        all_demands = {a['demand_idx']: a['demand'] for a in feasible_assignments}
         unscheduled_demands = [
-            demand for i, demand in enumerate(all_demands) 
-            if i not in scheduled_demand_indices
+            demand for d_idx, demand in all_demands.items()
+            if d_idx not in scheduled_demand_indices
         ]
         
         # Calculate metrics
-        total_possible_data = sum(d['data_mb'] for d in all_demands)
+        total_possible_data = sum(d['data_mb'] for d in all_demands.values())
         schedule_efficiency = total_data_scheduled / total_possible_data if total_possible_data > 0 else 0
         
         # Determine solution quality
@@ -318,11 +836,14 @@ class AdvancedSchedulingOptimizer:
         else:
             solution_quality = "INFEASIBLE"
         
+        scheduled_contacts.sort(key=lambda x: x['start_time'])
+        self._assign_antennas(scheduled_contacts)
+        
         return OptimizationResult(
-            scheduled_contacts=sorted(scheduled_contacts, key=lambda x: x['start_time']),
+            scheduled_contacts=scheduled_contacts,
             unscheduled_demands=unscheduled_demands,
-            optimization_status=solver.StatusName(status),
-            objective_value=solver.ObjectiveValue() if status in (cp_model.OPTIMAL, cp_model.FEASIBLE) else 0,
+            optimization_status=status_name,
+            objective_value=objective_value,
             solve_time_seconds=solve_time,
             total_data_scheduled=total_data_scheduled,
             schedule_efficiency=schedule_efficiency,
@@ -331,79 +852,1415 @@ class AdvancedSchedulingOptimizer:
             solution_quality=solution_quality
         )
 
+    def _make_contact(self, assignment: Dict, start: Optional[int] = None) -> Dict:
+        """Contact dictionary for an assignment starting at POSIX `start` (default: its pass rise)."""
+        rise_ts = _pass_bounds(assignment)[0]
+        start_ts = rise_ts if start is None else start
+        end_dt = datetime.fromtimestamp(start_ts, tz=timezone.utc) + timedelta(seconds=assignment['duration_seconds'])
+        
+        contact = {
+            "satellite": assignment['demand']['satellite'],
+            "ground_station": assignment['ground_station'],
+            "demand_mb": assignment['demand']['data_mb'],
+            "start_time": (assignment['pass']['rise_time'] if start_ts == rise_ts
+                           else _format_utc(datetime.fromtimestamp(start_ts, tz=timezone.utc))),
+            "end_time": _format_utc(end_dt),
+            "duration_seconds": assignment['duration_seconds'],
+            "data_efficiency": assignment['data_efficiency'],
+            "pass_utilization": assignment['pass_utilization'],
+            "effective_data_rate_mbps": assignment['effective_data_rate'],
+            "priority": assignment['priority'],
+            "estimation_details": assignment['estimation_details']
+        }
+        if 'id' in assignment['demand']:
+            contact['demand_id'] = assignment['demand']['id']
+        return contact
+
+    def _assign_antennas(self, contacts: List[Dict]):
+        """
+        Number the antenna used by each contact (in start-time order). The
+        station capacity constraint guarantees a free antenna always exists.
+        """
+        antenna_free_at = {}
+        for contact in contacts:
+            start = _parse_utc(contact['start_time'])
+            free_at = antenna_free_at.setdefault(contact['ground_station'], [])
+            for antenna, busy_until in enumerate(free_at):
+                if busy_until <= start:
+                    break
+            else:
+                antenna = len(free_at)
+                free_at.append(None)
+            free_at[antenna] = _parse_utc(contact['end_time'])
+            contact['antenna'] = antenna
+
     def create_advanced_schedule(self, passes: List[Dict], demands: List[Dict],
                                objective: OptimizationObjective = OptimizationObjective.MAXIMIZE_DATA_THROUGHPUT,
                                constraints: List[SchedulingConstraint] = None,
-                               solver_timeout: int = None) -> OptimizationResult:
+                               solver_timeout: int = None,
+                               ground_stations: List[Dict] = None,
+                               on_solution: Callable[[SolutionUpdate], None] = None,
+                               target_gap: float = None,
+                               no_improvement_seconds: float = None) -> OptimizationResult:
         """
         Create an advanced optimized schedule with comprehensive analysis.
         
         Args:
-            passes: List of satellite passes
+            passes: List of satellite passes, optionally tagged with 'ground_station'
             demands: List of data demands
             objective: Optimization objective
             constraints: Additional scheduling constraints
             solver_timeout: Solver timeout in seconds
+            ground_stations: Station definitions; an 'antennas' field sets how many
+                contacts a station can run at once
+            on_solution: Called with each improved incumbent (see solve_optimization_model)
+            target_gap: Stop once within this relative gap of the best bound
+            no_improvement_seconds: Stop after this long without a better solution
             
         Returns:
-            OptimizationResult with detailed scheduling solution
+            OptimizationResult with detailed scheduling solution; metadata
+            reports the assignments pruned before modeling ('pruning') and
+            the interchangeable demands ordered in the model ('symmetry', with
+            symmetry_breaking on)
         """
         if solver_timeout:
             self.solver_timeout_seconds = solver_timeout
         
         # Preprocess data
         feasible_assignments, metadata = self.preprocess_scheduling_data(passes, demands)
+        pruning = None
+        if self.prune_dominated:
+            feasible_assignments, pruning = self.prune_assignments(feasible_assignments)
         
         if not feasible_assignments:
             logger.warning("No feasible assignments found")
-            return OptimizationResult(
-                scheduled_contacts=[],
-                unscheduled_demands=demands,
-                optimization_status="NO_FEASIBLE_ASSIGNMENTS",
-                objective_value=0,
-                solve_time_seconds=0,
-                total_data_scheduled=0,
-                schedule_efficiency=0,
-                resource_utilization=0,
-                constraint_violations=[],
-                solution_quality="INFEASIBLE"
-            )
+            return self._no_feasible_result(demands)
         
         # Create and solve model
-        model, variables = self.create_cp_sat_model(feasible_assignments, objective, constraints)
-        result = self.solve_optimization_model(model, variables)
+        capacities = station_capacities(ground_stations) if ground_stations else None
+        model, variables = self.create_cp_sat_model(feasible_assignments, objective, constraints, capacities)
+        result = self.solve_optimization_model(model, variables, on_solution,
+                                               target_gap, no_improvement_seconds)
+        if pruning is not None:
+            result.metadata['pruning'] = pruning
+        if 'symmetry' in variables:
+            result.metadata['symmetry'] = variables['symmetry']
+        
+        # Demands with no feasible pass never entered the model
+        modeled = {a['demand_idx'] for a in feasible_assignments}
+        result.unscheduled_demands.extend(d for i, d in enumerate(demands) if i not in modeled)
         
         logger.info(f"Optimization complete: {result.solution_quality} solution with {len(result.scheduled_contacts)} contacts")
         logger.info(f"Data scheduled: {result.total_data_scheduled} MB, Efficiency: {result.schedule_efficiency:.2%}")
         
         return result
 
-    def compare_scheduling_strategies(self, passes: List[Dict], demands: List[Dict]) -> Dict[str, OptimizationResult]:
+    def _pass_link_budget(self, profile: Optional[Dict], duration: float) -> Tuple[float, float]:
+        """
+        Per-contact overhead (seconds) and mean effective data rate (Mbps) of a
+        pass. Profiled passes use the mean rate over their integrated profile.
+        """
+        if profile is not None:
+            link = self.latency_estimator.estimate_profile_requirements(profile, 0.0)
+            overhead = float(link['overhead_time'])
+            usable = duration - overhead
+            rate = link['pass_capacity_mb'] * 8 / usable if usable > 0 else 1.0
+            return overhead, max(rate, 1.0)
+        link = self.latency_estimator.estimate_demand_requirements(0.0)
+        return link['overhead_time'], link['effective_rate_mbps']
+
+    def create_split_schedule(self, passes, demands: List[Dict],
+                              objective: OptimizationObjective = OptimizationObjective.MAXIMIZE_DATA_THROUGHPUT,
+                              ground_stations: List[Dict] = None,
+                              min_chunk_mb: int = 50,
+                              allow_partial: bool = False,
+                              solver_timeout: int = None) -> OptimizationResult:
+        """
+        Schedule demands that may be split across several passes.
+        
+        Instead of one all-or-nothing boolean per (pass, demand) pair, the
+        model allocates an integer number of MB of each demand to each pass
+        of its satellite. Every chunk pays the contact overhead, and the
+        chunks in a pass must fit in it back to back, which is a linear
+        capacity constraint per pass. Chunks run in deadline order and each
+        must end by its demand's deadline. Each used pass occupies its station
+        (and satellite) from rise for as long as its chunks take, under the
+        same no-overlap and antenna constraints as create_advanced_schedule.
+        
+        Args:
+            passes: PassTable, or list of satellite passes optionally tagged with 'ground_station'
+            demands: List of data demands
+            objective: Optimization objective; data is valued pro rata per MB
+            ground_stations: Station definitions; an 'antennas' field sets how many
+                contacts a station can run at once
+            min_chunk_mb: Smallest amount of a demand worth a contact
+            allow_partial: Whether a demand may be delivered only in part;
+                otherwise it is delivered completely or not at all
+            solver_timeout: Solver timeout in seconds
+            
+        Returns:
+            OptimizationResult with one contact per chunk. Each contact's
+            'demand_mb' is the chunk size and 'total_demand_mb' the demand's.
+            metadata['partial_demands'] lists demands delivered in part.
+        """
+        if solver_timeout:
+            self.solver_timeout_seconds = solver_timeout
+        capacities = station_capacities(ground_stations) if ground_stations else {}
+        
+        table = as_pass_table(passes)
+        
+        # Link budget of every usable pass
+        budgets = {}
+        rises, durations = table.rise_seconds.tolist(), table.duration_seconds.tolist()
+        for p_idx in range(len(table)):
+            profile = table.profiles[p_idx] if table.has_profile(p_idx) else None
+            overhead, rate = self._pass_link_budget(profile, durations[p_idx])
+            if durations[p_idx] > overhead:
+                budgets[p_idx] = (datetime.fromtimestamp(rises[p_idx], tz=timezone.utc), int(durations[p_idx]),
+                                  overhead, rate)
+        
+        pass_groups = {}
+        for p_idx in budgets:
+            for key in self._pass_keys(table, p_idx):
+                pass_groups.setdefault(key, []).append(p_idx)
+        
+        # Candidate chunks: passes of the demand's satellite that start before its deadline
+        pairs = []
+        for d_idx, demand in enumerate(demands):
+            keys = [None, ('name', demand['satellite'])]
+            if 'norad_id' in demand:
+                keys.append(('norad', demand['norad_id']))
+            deadline = _parse_utc(demand['deadline']) if demand.get('deadline') else None
+            p_indices = sorted({p_idx for key in keys for p_idx in pass_groups.get(key, ())})
+            for p_idx in p_indices:
+                if deadline is None or budgets[p_idx][0] <= deadline:
+                    pairs.append((p_idx, d_idx))
+        
+        model = cp_model.CpModel()
+        allocated, used, busy = [], [], []
+        for i, (p_idx, d_idx) in enumerate(pairs):
+            _, duration, overhead, rate = budgets[p_idx]
+            data_mb = int(demands[d_idx]['data_mb'])
+            x = model.NewIntVar(0, data_mb, f'mb_{i}')
+            u = model.NewBoolVar(f'used_{i}')
+            seconds = model.NewIntVar(0, duration, f'seconds_{i}')
+            model.Add(x <= data_mb * u)
+            model.Add(x >= min(min_chunk_mb, data_mb) * u)
+            # seconds = ceil(overhead + 8x / rate), scaled to integers (rate in
+            # centi-Mbps), so a chunk holds the station no longer than it needs
+            # and an unused chunk holds it not at all
+            rate_centi = max(1, int(rate * 100))
+            needed = int(math.ceil(overhead)) * rate_centi * u + 800 * x
+            model.Add(seconds * rate_centi >= needed)
+            model.Add(seconds * rate_centi <= needed + rate_centi - 1)
+            allocated.append(x)
+            used.append(u)
+            busy.append(seconds)
+        
+        by_demand, by_pass = {}, {}
+        for i, (p_idx, d_idx) in enumerate(pairs):
+            by_demand.setdefault(d_idx, []).append(i)
+            by_pass.setdefault(p_idx, []).append(i)
+        
+        # Chunks of a pass run back to back from rise, earliest deadline
+        # first, and each must end by its demand's deadline
+        deadlines = {d_idx: _parse_utc(demand['deadline']).timestamp()
+                     for d_idx, demand in enumerate(demands) if demand.get('deadline')}
+        for p_idx, positions in by_pass.items():
+            positions.sort(key=lambda i: (deadlines.get(pairs[i][1], math.inf), i))
+            rise_ts = budgets[p_idx][0].timestamp()
+            for k, i in enumerate(positions):
+                d_idx = pairs[i][1]
+                if d_idx in deadlines:
+                    model.Add(cp_model.LinearExpr.Sum([busy[j] for j in positions[:k + 1]])
+                              <= max(0, math.floor(deadlines[d_idx] - rise_ts)))
+        
+        # Whole or partial delivery of each demand
+        for d_idx, positions in by_demand.items():
+            total = cp_model.LinearExpr.Sum([allocated[i] for i in positions])
+            if allow_partial:
+                model.Add(total <= int(demands[d_idx]['data_mb']))
+            else:
+                complete = model.NewBoolVar(f'complete_{d_idx}')
+                model.Add(total == int(demands[d_idx]['data_mb']) * complete)
+        
+        # One interval per pass, from rise for as long as its chunks take,
+        # in seconds from the first rise
+        intervals = {}
+        station_intervals, satellite_intervals = {}, {}
+        origin = min((int(budgets[p_idx][0].timestamp()) for p_idx in by_pass), default=0)
+        for p_idx, positions in by_pass.items():
+            rise, duration, _, _ = budgets[p_idx]
+            start = int(rise.timestamp()) - origin
+            active = model.NewBoolVar(f'active_{p_idx}')
+            model.AddMaxEquality(active, [used[i] for i in positions])
+            length = model.NewIntVar(0, duration, f'length_{p_idx}')
+            model.Add(length == cp_model.LinearExpr.Sum([busy[i] for i in positions]))
+            intervals[p_idx] = model.NewOptionalIntervalVar(
+                start, length, model.NewIntVar(start, start + duration, f'end_{p_idx}'),
+                active, f'pass_interval_{p_idx}')
+            station = table.station_name(p_idx) or DEFAULT_GROUND_STATION
+            station_intervals.setdefault(station, []).append(intervals[p_idx])
+            for d_idx in {pairs[i][1] for i in positions}:
+                satellite_intervals.setdefault(demands[d_idx]['satellite'], {}).setdefault(
+                    station, set()).add(p_idx)
+        
+        for station, station_ivs in station_intervals.items():
+            capacity = capacities.get(station, 1)
+            if capacity <= 1:
+                model.AddNoOverlap(station_ivs)
+            else:
+                model.AddCumulative(station_ivs, [1] * len(station_ivs), capacity)
+        for by_station in satellite_intervals.values():
+            if len(by_station) > 1:
+                model.AddNoOverlap([intervals[p_idx] for p_indices in by_station.values()
+                                    for p_idx in sorted(p_indices)])
+        
+        # Whole-demand objective weights spread over the demand's megabytes;
+        # a unit cost per chunk prefers fewer, larger contacts
+        whole = self._objective_coefficients(
+            [{"demand": demand, "priority": demand.get('priority', 1.0), "data_efficiency": 1.0}
+             for demand in demands], objective)
+        weights = [int(round(1000 * whole[d_idx] / max(1, demands[d_idx]['data_mb'])))
+                   for _, d_idx in pairs]
+        model.Maximize(cp_model.LinearExpr.WeightedSum(allocated, weights)
+                       - cp_model.LinearExpr.Sum(used))
+        
+        solver = cp_model.CpSolver()
+        solver.parameters.max_time_in_seconds = self.solver_timeout_seconds
+        self.solver_profile.apply(solver.parameters)
+        solve_start = time.perf_counter()
+        status = solver.Solve(model)
+        solve_time = time.perf_counter() - solve_start
+        
+        # Chunks of a pass run back to back from rise, in deadline order
+        rise_label = (lambda p_idx: passes[p_idx]['rise_time']) if isinstance(passes, list) else table.rise_time
+        scheduled_contacts = []
+        delivered = {}
+        if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            for p_idx, positions in sorted(by_pass.items()):
+                rise, duration, overhead, rate = budgets[p_idx]
+                offset = 0
+                for i in positions:
+                    chunk_mb = solver.Value(allocated[i])
+                    if chunk_mb == 0:
+                        continue
+                    d_idx = pairs[i][1]
+                    demand = demands[d_idx]
+                    seconds = solver.Value(busy[i])
+                    start_dt = rise + timedelta(seconds=offset)
+                    offset += seconds
+                    contact = {
+                        "satellite": demand['satellite'],
+                        "ground_station": table.station_name(p_idx) or DEFAULT_GROUND_STATION,
+                        "demand_mb": chunk_mb,
+                        "total_demand_mb": demand['data_mb'],
+                        "start_time": rise_label(p_idx) if offset == seconds else _format_utc(start_dt),
+                        "end_time": _format_utc(start_dt + timedelta(seconds=seconds)),
+                        "duration_seconds": seconds,
+                        "data_efficiency": round(chunk_mb * 8 / rate / seconds, 3),
+                        "pass_utilization": round(seconds / duration, 3),
+                        "effective_data_rate_mbps": round(rate, 2),
+                        "priority": demand.get('priority', 1.0),
+                    }
+                    if 'id' in demand:
+                        contact['demand_id'] = demand['id']
+                    scheduled_contacts.append(contact)
+                    delivered[d_idx] = delivered.get(d_idx, 0) + chunk_mb
+        
+        scheduled_contacts.sort(key=lambda x: x['start_time'])
+        self._assign_antennas(scheduled_contacts)
+        
+        total_data_scheduled = sum(delivered.values())
+        total_possible_data = sum(d['data_mb'] for d in demands)
+        partial_demands = [
+            {"demand": demands[d_idx], "scheduled_mb": mb}
+            for d_idx, mb in sorted(delivered.items()) if mb < demands[d_idx]['data_mb']
+        ]
+        chunk_count = {}
+        for contact in scheduled_contacts:
+            key = (contact['satellite'], contact.get('demand_id'), contact['total_demand_mb'])
+            chunk_count[key] = chunk_count.get(key, 0) + 1
+        
+        if status == cp_model.OPTIMAL:
+            solution_quality = "OPTIMAL"
+        elif status == cp_model.FEASIBLE:
+            solution_quality = "FEASIBLE"
+        else:
+            solution_quality = "INFEASIBLE"
+        
+        logger.info(f"Split scheduling complete: {solution_quality} solution with {len(scheduled_contacts)} chunks, {total_data_scheduled} MB")
+        
+        return OptimizationResult(
+            scheduled_contacts=scheduled_contacts,
+            unscheduled_demands=[d for d_idx, d in enumerate(demands) if d_idx not in delivered],
+            optimization_status=solver.StatusName(status),
+            objective_value=solver.ObjectiveValue() if status in (cp_model.OPTIMAL, cp_model.FEASIBLE) else 0,
+            solve_time_seconds=solve_time,
+            total_data_scheduled=total_data_scheduled,
+            schedule_efficiency=total_data_scheduled / total_possible_data if total_possible_data > 0 else 0,
+            resource_utilization=len(scheduled_contacts) / len(pairs) if pairs else 0,
+            constraint_violations=[],
+            solution_quality=solution_quality,
+            metadata={
+                "candidate_chunks": len(pairs),
+                "partial_demands": partial_demands,
+                "split_demands": sum(1 for count in chunk_count.values() if count > 1),
+            }
+        )
+
+    def _demand_key(self, satellite: str, demand_id, data_mb) -> Tuple:
+        """Identity used to recognise a demand across planning cycles."""
+        return (satellite, 'id', demand_id) if demand_id is not None else (satellite, 'mb', data_mb)
+
+    def _match_previous_contacts(self, previous_contacts: List[Dict], feasible_assignments: List[Dict],
+                                 tolerance_seconds: float) -> Dict[int, int]:
+        """
+        Map previous contacts to assignments of the new instance.
+        
+        A contact matches an assignment of the same satellite, station and
+        demand whose contact could start within `tolerance_seconds` of the
+        previous contact start, so contacts survive the small shifts a TLE
+        update causes.
+        Each demand is matched at most once.
+        
+        Returns:
+            Mapping of previous contact position to assignment position
+        """
+        candidates = {}
+        for i, assignment in enumerate(feasible_assignments):
+            demand = assignment['demand']
+            key = (assignment['ground_station'],
+                   self._demand_key(demand['satellite'], demand.get('id'), demand['data_mb']))
+            candidates.setdefault(key, []).append(i)
+        
+        earliest, latest = self._start_windows(feasible_assignments)
+        matches = {}
+        used_demands = set()
+        for c_idx, contact in enumerate(previous_contacts):
+            key = (contact['ground_station'],
+                   self._demand_key(contact['satellite'], contact.get('demand_id'), contact['demand_mb']))
+            contact_start = _parse_utc(contact['start_time']).timestamp()
+            best, best_offset = None, tolerance_seconds
+            for i in candidates.get(key, []):
+                assignment = feasible_assignments[i]
+                if assignment['demand_idx'] in used_demands:
+                    continue
+                offset = max(earliest[i] - contact_start, contact_start - latest[i], 0)
+                if offset <= best_offset:
+                    best, best_offset = i, offset
+            if best is not None:
+                matches[c_idx] = best
+                used_demands.add(feasible_assignments[best]['demand_idx'])
+        return matches
+
+    def reoptimize_schedule(self, passes: List[Dict], demands: List[Dict],
+                            previous_result: OptimizationResult,
+                            frozen_window_seconds: int = 1800,
+                            now: datetime = None,
+                            objective: OptimizationObjective = OptimizationObjective.MAXIMIZE_DATA_THROUGHPUT,
+                            constraints: List[SchedulingConstraint] = None,
+                            solver_timeout: int = None,
+                            ground_stations: List[Dict] = None,
+                            match_tolerance_seconds: float = 120,
+                            stability_bonus: int = 1) -> OptimizationResult:
+        """
+        Re-plan after demands or passes change, starting from a previous result.
+        
+        Previous contacts starting before `now + frozen_window_seconds` are
+        carried over unchanged: their demands are treated as served, they
+        keep their station and satellite busy, and no new contact may start
+        inside the frozen window. Only the remaining assignments are
+        modeled, with every surviving previous contact passed to CP-SAT as a
+        solution hint so the solver starts from the old plan.
+        
+        Args:
+            passes: Current list of satellite passes
+            demands: Current list of data demands
+            previous_result: Result of the previous planning cycle
+            frozen_window_seconds: Length of the near-term window that may not change
+            now: Current time (defaults to the wall clock, UTC)
+            objective: Optimization objective
+            constraints: Additional scheduling constraints
+            solver_timeout: Solver timeout in seconds
+            ground_stations: Station definitions with optional antenna counts
+            match_tolerance_seconds: Allowed shift of a contact's pass between cycles
+            stability_bonus: Objective bonus for keeping a previous contact, used to
+                break ties in favour of the old plan (0 disables)
+            
+        Returns:
+            OptimizationResult whose metadata reports frozen, hinted and changed contacts
+        """
+        if solver_timeout:
+            self.solver_timeout_seconds = solver_timeout
+        
+        now = _parse_utc(now) if now is not None else datetime.now(timezone.utc)
+        freeze_until = (now + timedelta(seconds=frozen_window_seconds)).timestamp()
+        
+        feasible_assignments, _ = self.preprocess_scheduling_data(passes, demands)
+        previous_contacts = previous_result.scheduled_contacts
+        matches = self._match_previous_contacts(previous_contacts, feasible_assignments,
+                                                match_tolerance_seconds)
+        
+        frozen_contacts = [c_idx for c_idx, c in enumerate(previous_contacts)
+                           if _parse_utc(c['start_time']).timestamp() < freeze_until]
+        frozen = [previous_contacts[c_idx] for c_idx in frozen_contacts]
+        
+        # Demands already served by a frozen contact are done
+        served_demands = {feasible_assignments[matches[c_idx]]['demand_idx']
+                          for c_idx in frozen_contacts if c_idx in matches}
+        unmatched_keys = [self._demand_key(previous_contacts[c_idx]['satellite'],
+                                           previous_contacts[c_idx].get('demand_id'),
+                                           previous_contacts[c_idx]['demand_mb'])
+                          for c_idx in frozen_contacts if c_idx not in matches]
+        for d_idx, demand in enumerate(demands):
+            key = self._demand_key(demand['satellite'], demand.get('id'), demand['data_mb'])
+            if key in unmatched_keys and d_idx not in served_demands:
+                unmatched_keys.remove(key)
+                served_demands.add(d_idx)
+        
+        # Frozen contacts keep their station and satellite busy
+        blocked = {}
+        for contact in frozen:
+            window = (_parse_utc(contact['start_time']).timestamp(),
+                      _parse_utc(contact['end_time']).timestamp())
+            blocked.setdefault(('station', contact['ground_station']), []).append(window)
+            blocked.setdefault(('satellite', contact['satellite']), []).append(window)
+        
+        # Only the delta goes into the model: assignments of open demands that
+        # can still start after the frozen window. Frozen contacts enter as
+        # busy time, so new contacts may fit around them in the same pass.
+        earliest, latest = self._start_windows(feasible_assignments)
+        previous_of = {i: c_idx for c_idx, i in matches.items()}
+        kept_positions = [
+            i for i, assignment in enumerate(feasible_assignments)
+            if assignment['demand_idx'] not in served_demands and latest[i] >= freeze_until
+        ]
+        kept = [feasible_assignments[i] for i in kept_positions]
+        hints = {}
+        for j, i in enumerate(kept_positions):
+            if i in previous_of:
+                previous_start = _parse_utc(previous_contacts[previous_of[i]]['start_time']).timestamp()
+                lower = max(earliest[i], math.ceil(freeze_until))
+                hints[j] = int(min(max(round(previous_start), lower), max(latest[i], lower)))
+        
+        selected = []
+        if kept:
+            capacities = station_capacities(ground_stations) if ground_stations else None
+            bonus = {j: stability_bonus for j in hints} if stability_bonus else None
+            model, variables = self.create_cp_sat_model(kept, objective, constraints, capacities, bonus,
+                                                        busy=blocked, not_before=freeze_until)
+            for j, var in variables['assignments'].items():
+                model.AddHint(var, 1 if j in hints else 0)
+            for j, start in hints.items():
+                model.AddHint(variables['starts'][j], variables['time_grid'].nearest(start))
+            status, status_name, objective_value, solve_time, selected, starts, _ = _solve_selection(
+                model, variables, self.solver_timeout_seconds, profile=self.solver_profile
+            )
+            result = self._build_result(variables, status, status_name, objective_value,
+                                        solve_time, selected, starts)
+        else:
+            result = OptimizationResult(
+                scheduled_contacts=[], unscheduled_demands=[], optimization_status="OPTIMAL",
+                objective_value=0, solve_time_seconds=0, total_data_scheduled=0,
+                schedule_efficiency=0, resource_utilization=0, constraint_violations=[],
+                solution_quality="OPTIMAL"
+            )
+        
+        # Frozen contacts are part of the plan even though the model never saw them
+        result.scheduled_contacts.extend(dict(c) for c in frozen)
+        result.scheduled_contacts.sort(key=lambda c: c['start_time'])
+        result.total_data_scheduled += sum(c['demand_mb'] for c in frozen)
+        total_possible_data = sum(d['data_mb'] for d in demands)
+        result.schedule_efficiency = (result.total_data_scheduled / total_possible_data
+                                      if total_possible_data > 0 else 0)
+        result.resource_utilization = (len(result.scheduled_contacts) / len(feasible_assignments)
+                                       if feasible_assignments else 0)
+        modeled = {a['demand_idx'] for a in kept}
+        result.unscheduled_demands.extend(
+            d for i, d in enumerate(demands) if i not in modeled and i not in served_demands
+        )
+        
+        # Previous contacts beyond the frozen window whose assignment was not chosen again
+        surviving = len(set(hints) & set(selected))
+        changed = len(previous_contacts) - len(frozen) - surviving
+        result.metadata.update({
+            "frozen_contacts": len(frozen),
+            "hinted_contacts": len(hints),
+            "changed_contacts": changed,
+            "modeled_assignments": len(kept),
+        })
+        
+        logger.info(f"Re-optimization complete: {len(frozen)} frozen, {len(hints)} hinted, "
+                    f"{changed} previous contacts changed")
+
+        return result
+
+    def _no_feasible_result(self, demands: List[Dict]) -> OptimizationResult:
+        """Empty result for demands that no pass can serve."""
+        return OptimizationResult(
+            scheduled_contacts=[],
+            unscheduled_demands=list(demands),
+            optimization_status="NO_FEASIBLE_ASSIGNMENTS",
+            objective_value=0,
+            solve_time_seconds=0,
+            total_data_scheduled=0,
+            schedule_efficiency=0,
+            resource_utilization=0,
+            constraint_violations=[],
+            solution_quality="INFEASIBLE"
+        )
+    
+    def compare_scheduling_strategies(self, passes: List[Dict], demands: List[Dict],
+                                      ground_stations: List[Dict] = None,
+                                      time_budget_seconds: float = None,
+                                      parallel: bool = True) -> Dict[str, OptimizationResult]:
         """
         Compare different scheduling strategies and return results for analysis.
         
+        Feasibility preprocessing and model construction run once; only the
+        objective differs between strategies. The solves run concurrently in
+        forked worker processes that inherit the built model, and all of them
+        share one wall-clock budget. Where fork is unavailable the solves run
+        one after another on the same model and split the budget between them.
+        
         Args:
             passes: List of satellite passes
             demands: List of data demands
+            ground_stations: Station definitions with optional antenna counts
+            time_budget_seconds: Total wall-clock budget for the comparison
+                (defaults to the solver timeout)
+            parallel: Solve the strategies in a process pool
             
         Returns:
-            Dictionary mapping strategy names to OptimizationResult objects
+            Dictionary mapping strategy names to OptimizationResult objects,
+            each with a metadata['timings'] breakdown
         """
         strategies = {
             "maximize_data": OptimizationObjective.MAXIMIZE_DATA_THROUGHPUT,
             "priority_weighted": OptimizationObjective.MAXIMIZE_PRIORITY_WEIGHTED,
             "balanced_efficiency": OptimizationObjective.BALANCE_EFFICIENCY_FAIRNESS
         }
+        budget = time_budget_seconds or self.solver_timeout_seconds
+        comparison_start = time.perf_counter()
+        
+        feasible_assignments, _ = self.preprocess_scheduling_data(passes, demands)
+        if self.prune_dominated:
+            feasible_assignments, _ = self.prune_assignments(feasible_assignments)
+        preprocess_time = time.perf_counter() - comparison_start
+        
+        if not feasible_assignments:
+            logger.warning("No feasible assignments found")
+            return {name: self._no_feasible_result(demands) for name in strategies}
+        
+        # Build the shared model once; each strategy only swaps the objective in
+        build_start = time.perf_counter()
+        capacities = station_capacities(ground_stations) if ground_stations else None
+        model, variables = self.create_cp_sat_model(feasible_assignments, constraints=None,
+                                                    station_capacities=capacities)
+        coefficients = {name: self._objective_coefficients(feasible_assignments, objective)
+                        for name, objective in strategies.items()}
+        build_time = time.perf_counter() - build_start
+        
+        remaining = max(budget - (time.perf_counter() - comparison_start), 0.0)
+        fork_available = "fork" in multiprocessing.get_all_start_methods()
+        workers_per_solve = max(1, available_cores() // len(strategies))
+        
+        global _shared_comparison
+        _shared_comparison = (model, variables)
+        solutions = {}
+        try:
+            if parallel and fork_available:
+                logger.info(f"Solving {len(strategies)} strategies in parallel, budget {remaining:.1f}s")
+                context = multiprocessing.get_context("fork")
+                with ProcessPoolExecutor(max_workers=len(strategies), mp_context=context) as pool:
+                    futures = {
+                        name: pool.submit(_solve_shared_strategy, coefficients[name],
+                                          remaining, workers_per_solve, self.solver_profile)
+                        for name in strategies
+                    }
+                    for name, future in futures.items():
+                        solutions[name] = future.result()
+            else:
+                # Share what is left of the budget evenly between the remaining solves
+                for position, name in enumerate(strategies):
+                    left = max(budget - (time.perf_counter() - comparison_start), 0.0)
+                    share = left / (len(strategies) - position)
+                    solutions[name] = _solve_shared_strategy(coefficients[name], share, None,
+                                                             self.solver_profile)
+        finally:
+            _shared_comparison = None
+        
+        # Demands with no feasible pass never entered the model
+        modeled = {a['demand_idx'] for a in feasible_assignments}
+        never_modeled = [d for i, d in enumerate(demands) if i not in modeled]
         
         results = {}
-        for strategy_name, objective in strategies.items():
-            logger.info(f"Testing strategy: {strategy_name}")
-            result = self.create_advanced_schedule(passes, demands, objective)
-            results[strategy_name] = result
+        for name, (status, status_name, objective_value, solve_time, selected, starts, _,
+                   wall_time) in solutions.items():
+            result = self._build_result(variables, status, status_name, objective_value,
+                                        solve_time, selected, starts)
+            result.unscheduled_demands.extend(never_modeled)
+            result.metadata['timings'] = {
+                "preprocess_seconds": preprocess_time,
+                "model_build_seconds": build_time,
+                "solve_seconds": solve_time,
+                "worker_seconds": wall_time,
+            }
+            logger.info(f"Strategy {name}: {result.solution_quality}, "
+                        f"{result.total_data_scheduled} MB in {solve_time:.2f}s")
+            results[name] = result
         
+        logger.info(f"Strategy comparison finished in {time.perf_counter() - comparison_start:.2f}s")
         return results
 
 
+    def create_decomposed_schedule(self, passes: List[Dict], demands: List[Dict],
+                                   objective: OptimizationObjective = OptimizationObjective.MAXIMIZE_DATA_THROUGHPUT,
+                                   constraints: List[SchedulingConstraint] = None,
+                                   ground_stations: List[Dict] = None,
+                                   window_hours: float = 24,
+                                   overlap_hours: float = 3,
+                                   window_timeout: float = 2,
+                                   window_gap_limit: float = 0.005,
+                                   parallel: bool = True) -> OptimizationResult:
+        """
+        Schedule a long horizon by rolling over overlapping time windows.
+        
+        The horizon is cut into windows of `window_hours`. Each window is
+        solved as its own small CP-SAT model that also sees the passes of the
+        next `overlap_hours` as lookahead, but only contacts starting inside
+        the window are committed. Demands a window leaves unmet roll over to
+        later windows, and committed contacts that run past the window edge
+        keep their station and satellite busy in the next one. A demand in
+        the last window before its deadline gets double objective weight
+        there, so the window does not spend that capacity on demands that
+        could still wait.
+        
+        Windows linked by a demand that can be served in either of them must
+        be solved in order; unlinked runs of windows (e.g. when deadlines keep
+        demands local) are independent and solved in parallel worker
+        processes. Conflicts at the edges between independent runs are
+        removed afterwards and the affected demands re-planned in one small
+        repair model.
+        
+        Custom constraints are enforced per window, not across the horizon.
+        
+        Args:
+            passes: List of satellite passes
+            demands: List of data demands
+            objective: Optimization objective
+            constraints: Additional scheduling constraints (applied per window)
+            ground_stations: Station definitions with optional antenna counts
+            window_hours: Length of each committed window
+            overlap_hours: Lookahead beyond each window
+            window_timeout: Solver timeout per window in seconds
+            window_gap_limit: Relative optimality gap at which a window solve stops
+            parallel: Solve independent windows in a process pool
+            
+        Returns:
+            OptimizationResult whose metadata describes every window
+        """
+        decomposition_start = time.perf_counter()
+        feasible_assignments, _ = self.preprocess_scheduling_data(passes, demands)
+        if self.prune_dominated:
+            feasible_assignments, _ = self.prune_assignments(feasible_assignments)
+        if not feasible_assignments:
+            logger.warning("No feasible assignments found")
+            return self._no_feasible_result(demands)
+        
+        # Windows are assigned by pass rise; contacts may start later in the pass
+        starts, latest = self._start_windows(feasible_assignments)
+        
+        window_seconds = window_hours * 3600
+        horizon_start = starts.min()
+        window_of = ((starts - horizon_start) // window_seconds).astype(int)
+        windows = [(horizon_start + k * window_seconds, horizon_start + (k + 1) * window_seconds)
+                   for k in range(window_of.max() + 1)]
+        
+        # Assignments rising after their demand's deadline can never be chosen
+        index = self._index_assignments(feasible_assignments)
+        usable = {}
+        for d_idx, positions in index['by_demand'].items():
+            positions = np.array(positions)
+            deadline = feasible_assignments[positions[0]]['demand'].get('deadline')
+            if deadline:
+                positions = positions[starts[positions] <= _parse_utc(deadline).timestamp()]
+            if len(positions):
+                usable[d_idx] = positions
+        last_window = {d_idx: window_of[positions].max() for d_idx, positions in usable.items()}
+        
+        # Windows sharing a demand form a chain that must roll forward in order
+        spans = sorted(
+            (window_of[positions].min(), last_window[d_idx], d_idx)
+            for d_idx, positions in usable.items()
+        )
+        chains = []
+        for first, last, d_idx in spans:
+            if chains and first <= chains[-1][1]:
+                chains[-1][1] = max(chains[-1][1], last)
+                chains[-1][2].append(d_idx)
+            else:
+                chains.append([first, last, [d_idx]])
+        tasks = [
+            (first, last, np.sort(np.concatenate([usable[d] for d in chain_demands])))
+            for first, last, chain_demands in chains
+        ]
+        
+        capacities = station_capacities(ground_stations) if ground_stations else {}
+        context = {
+            "feasible_assignments": feasible_assignments, "starts": starts, "latest": latest,
+            "windows": windows, "overlap_seconds": overlap_hours * 3600,
+            "objective": objective, "constraints": constraints, "capacities": capacities,
+            "window_timeout": window_timeout, "window_gap_limit": window_gap_limit,
+            "last_window": last_window, "num_workers": None, "profile": self.solver_profile,
+        }
+        
+        global _shared_decomposition
+        _shared_decomposition = (self, context)
+        try:
+            if parallel and len(tasks) > 1 and "fork" in multiprocessing.get_all_start_methods():
+                processes = min(len(tasks), available_cores())
+                context["num_workers"] = max(1, available_cores() // processes)
+                logger.info(f"Solving {len(windows)} windows in {len(tasks)} independent chains "
+                            f"on {processes} processes")
+                pool_context = multiprocessing.get_context("fork")
+                with ProcessPoolExecutor(max_workers=processes, mp_context=pool_context) as pool:
+                    chain_results = list(pool.map(_solve_shared_chain, tasks))
+            else:
+                chain_results = [_solve_shared_chain(task) for task in tasks]
+        finally:
+            _shared_decomposition = None
+        
+        # Stitch the chains together; they can only clash at their edges
+        committed = sorted(((i, start) for contacts, _ in chain_results for i, start in contacts),
+                           key=lambda item: item[1])
+        kept, dropped_demands, blocked = {}, set(), {}
+        for i, start in committed:
+            assignment = feasible_assignments[i]
+            end = start + assignment['duration_seconds']
+            if self._is_blocked(start, end, assignment, blocked, capacities):
+                dropped_demands.add(assignment['demand_idx'])
+                continue
+            kept[i] = start
+            self._block(start, end, assignment, blocked)
+        
+        repaired = {}
+        if dropped_demands:
+            candidates = [
+                i for d_idx in dropped_demands for i in usable[d_idx]
+                if self._earliest_free_start(feasible_assignments[i], starts[i], latest[i],
+                                             blocked, capacities) is not None
+            ]
+            if candidates:
+                subset = [feasible_assignments[i] for i in candidates]
+                model, variables = self.create_cp_sat_model(subset, objective, constraints, capacities,
+                                                            busy=blocked)
+                _, _, _, _, selected, solved_starts, _ = _solve_selection(
+                    model, variables, window_timeout, None, window_gap_limit, profile=self.solver_profile)
+                repaired = {candidates[j]: solved_starts[j] for j in selected}
+            logger.info(f"Repaired {len(dropped_demands)} demands dropped at window edges, "
+                        f"{len(repaired)} rescheduled")
+        
+        contact_starts = {**kept, **repaired}
+        selected = sorted(contact_starts)
+        coefficients = self._objective_coefficients(feasible_assignments, objective)
+        wall_time = time.perf_counter() - decomposition_start
+        # Stitched window optima are a feasible plan, not a proven global optimum
+        result = self._build_result(
+            {"feasible_assignments": feasible_assignments}, cp_model.FEASIBLE, "FEASIBLE",
+            sum(coefficients[i] for i in selected), wall_time, selected, contact_starts
+        )
+        
+        modeled = set(index['by_demand'])
+        result.unscheduled_demands.extend(d for i, d in enumerate(demands) if i not in modeled)
+        result.metadata.update({
+            "windows": [stats for _, chain_stats in chain_results for stats in chain_stats],
+            "chains": len(tasks),
+            "boundary_conflicts": len(dropped_demands),
+            "repaired_contacts": len(repaired),
+        })
+        
+        logger.info(f"Decomposed schedule: {len(windows)} windows, {len(result.scheduled_contacts)} contacts, "
+                    f"{result.total_data_scheduled} MB in {wall_time:.2f}s")
+        return result
+
+    def _solve_window_chain(self, context: Dict, first: int, last: int,
+                            positions: np.ndarray) -> Tuple[List[Tuple[int, int]], List[Dict]]:
+        """
+        Roll through windows `first`..`last`, committing each window's contacts
+        and carrying unmet demands forward.
+        
+        Args:
+            context: Shared decomposition state (see create_decomposed_schedule)
+            first: First window of the chain
+            last: Last window of the chain
+            positions: Assignment positions belonging to the chain's demands
+            
+        Returns:
+            Tuple of (committed (assignment position, contact start) pairs,
+            per-window statistics)
+        """
+        feasible_assignments = context['feasible_assignments']
+        starts, latest = context['starts'], context['latest']
+        capacities = context['capacities']
+        chain_starts = starts[positions]
+        
+        committed = []
+        served = set()
+        blocked = {}
+        window_stats = []
+        for k in range(first, last + 1):
+            core_start, core_end = context['windows'][k]
+            
+            # Only contacts still running at the window start can get in the way
+            blocked = {key: [w for w in busy if w[1] > core_start] for key, busy in blocked.items()}
+            
+            in_window = positions[(chain_starts >= core_start) &
+                                  (chain_starts < core_end + context['overlap_seconds'])]
+            kept = [
+                i for i in in_window
+                if feasible_assignments[i]['demand_idx'] not in served
+                and self._earliest_free_start(feasible_assignments[i], starts[i], latest[i],
+                                              blocked, capacities) is not None
+            ]
+            stats = {"window": k, "start": _format_utc(datetime.fromtimestamp(core_start, tz=timezone.utc)),
+                     "assignments": len(kept), "committed": 0, "status": "EMPTY", "solve_seconds": 0.0}
+            window_stats.append(stats)
+            if not kept:
+                continue
+            
+            subset = [feasible_assignments[i] for i in kept]
+            coefficients = self._objective_coefficients(subset, context['objective'])
+            urgent = {j: coefficients[j] for j, i in enumerate(kept)
+                      if context['last_window'][feasible_assignments[i]['demand_idx']] == k}
+            model, variables = self.create_cp_sat_model(subset, context['objective'],
+                                                        context['constraints'], capacities, urgent,
+                                                        busy=blocked)
+            
+            # Start the search from a greedy plan so that even short window
+            # timeouts end with a good solution
+            for j, urgency in urgent.items():
+                coefficients[j] += urgency
+            greedy = self._greedy_selection(subset, coefficients, starts[kept], latest[kept],
+                                            blocked, capacities)
+            for j, var in variables['assignments'].items():
+                model.AddHint(var, 1 if j in greedy else 0)
+            for j, start in greedy.items():
+                model.AddHint(variables['starts'][j], variables['time_grid'].nearest(start))
+            
+            _, status_name, _, solve_time, selected, solved_starts, _ = _solve_selection(
+                model, variables, context['window_timeout'], context['num_workers'],
+                context['window_gap_limit'], profile=context['profile']
+            )
+            
+            # Lookahead passes are only provisional; the next window decides them
+            for j in selected:
+                i = kept[j]
+                if starts[i] < core_end:
+                    start = solved_starts[j]
+                    committed.append((int(i), start))
+                    served.add(feasible_assignments[i]['demand_idx'])
+                    self._block(start, start + feasible_assignments[i]['duration_seconds'],
+                                feasible_assignments[i], blocked)
+                    stats["committed"] += 1
+            stats.update({"status": status_name, "solve_seconds": solve_time})
+        
+        return committed, window_stats
+
+    def create_hybrid_schedule(self, passes, demands: List[Dict],
+                               objective: OptimizationObjective = OptimizationObjective.MAXIMIZE_DATA_THROUGHPUT,
+                               constraints: List[SchedulingConstraint] = None,
+                               ground_stations: List[Dict] = None,
+                               time_budget_seconds: float = 30,
+                               neighborhood_seconds: float = 1,
+                               neighborhood_fraction: float = 0.1,
+                               on_solution: Callable[[SolutionUpdate], None] = None) -> OptimizationResult:
+        """
+        Schedule with a greedy start, large-neighborhood search and, when the
+        instance allows it, a full CP-SAT solve, all within one time budget.
+        
+        The greedy plan (see _greedy_selection) comes first, in well under a
+        second on instances whose full model CP-SAT cannot close, so there is
+        always a valid schedule to return. Large-neighborhood search then
+        keeps improving it: each step frees the contacts of a random time
+        window or a random subset of satellites, keeps every other contact
+        as busy time, and re-solves the freed part with CP-SAT, hinted with
+        the current plan, for at most `neighborhood_seconds`. A result at
+        least as good replaces the freed contacts. Neighborhoods grow while
+        their solves prove optimal and shrink when they time out; once one
+        covers the whole instance it is solved with the rest of the budget,
+        and the search stops early if that solve proves optimality.
+        
+        Assignments are pruned first (see prune_assignments); with
+        prune_dominated off, late ones are still dropped, since the greedy
+        plan relies on their absence. The search stops as soon as the plan
+        reaches the trivial bound of every demand at its best assignment,
+        and a neighborhood with nothing to re-plan is redrawn larger. With a
+        'maximum_contacts_per_satellite' constraint only satellite
+        neighborhoods are used, so that every contact a limit counts is
+        freed together. Steps draw from a generator seeded with the solver
+        profile's random seed.
+        
+        Args:
+            passes: List of satellite passes
+            demands: List of data demands
+            objective: Optimization objective
+            constraints: Additional scheduling constraints
+            ground_stations: Station definitions with optional antenna counts
+            time_budget_seconds: Wall-clock budget from the call to the result
+            neighborhood_seconds: Solver time limit per neighborhood
+            neighborhood_fraction: Initial share of the horizon (or of the
+                satellites) freed per step
+            on_solution: Called with the greedy plan and every improvement,
+                as SolutionUpdates against the trivial bound of every demand
+                at its best assignment
+            
+        Returns:
+            OptimizationResult whose metadata['pipeline'] describes the search
+        """
+        pipeline_start = time.perf_counter()
+        deadline = pipeline_start + time_budget_seconds
+        feasible_assignments, _ = self.preprocess_scheduling_data(passes, demands)
+        pruning = None
+        if self.prune_dominated:
+            feasible_assignments, pruning = self.prune_assignments(feasible_assignments)
+        else:
+            # The greedy plan has no deadline constraint to stop it taking these
+            late = self._late_assignments(feasible_assignments).tolist()
+            feasible_assignments = [a for a, is_late in zip(feasible_assignments, late) if not is_late]
+        if not feasible_assignments:
+            logger.warning("No feasible assignments found")
+            return self._no_feasible_result(demands)
+        
+        capacities = station_capacities(ground_stations) if ground_stations else {}
+        earliest, latest = self._start_windows(feasible_assignments)
+        coefficients = self._objective_coefficients(feasible_assignments, objective)
+        index = self._index_assignments(feasible_assignments)
+        bound = sum(max(coefficients[i] for i in positions) for positions in index['by_demand'].values())
+        satellite_limit = None
+        for constraint in constraints or ():
+            if constraint.constraint_type == "maximum_contacts_per_satellite":
+                limit = constraint.parameters.get("max_contacts", 5)
+                satellite_limit = limit if satellite_limit is None else min(satellite_limit, limit)
+        
+        incumbent = self._greedy_selection(feasible_assignments, coefficients, earliest, latest,
+                                           {}, capacities, satellite_limit)
+        value = greedy_value = sum(coefficients[j] for j in incumbent)
+        greedy_seconds = time.perf_counter() - pipeline_start
+        
+        sequence = 0
+        published = {}
+        
+        def publish():
+            nonlocal sequence, published
+            sequence += 1
+            current = {f"{j}@{start}": (j, start) for j, start in incumbent.items()}
+            if on_solution is not None:
+                added = []
+                for contact_id, (j, start) in current.items():
+                    if contact_id not in published:
+                        contact = self._make_contact(feasible_assignments[j], start)
+                        contact['contact_id'] = contact_id
+                        added.append(contact)
+                try:
+                    on_solution(SolutionUpdate(
+                        sequence=sequence, objective_value=value, best_bound=bound,
+                        gap=abs(bound - value) / max(1.0, abs(value)),
+                        elapsed_seconds=time.perf_counter() - pipeline_start, contact_count=len(current),
+                        contacts_added=added, contacts_removed=[c for c in published if c not in current]
+                    ))
+                except Exception:
+                    logger.exception("Solution callback failed")
+            published = current
+        
+        publish()
+        logger.info(f"Hybrid schedule: greedy plan of {len(incumbent)} contacts, objective {value}, "
+                    f"in {greedy_seconds:.2f}s")
+        
+        rng = random.Random(self.solver_profile.random_seed)
+        kinds = ("satellites",) if satellite_limit is not None else ("window", "satellites")
+        satellites = sorted(index['by_satellite'])
+        demand_satellites = [a['demand']['satellite'] for a in feasible_assignments]
+        horizon_start, horizon_end = float(earliest.min()), float(latest.max())
+        fraction = min(max(neighborhood_fraction, 0.0), 1.0)
+        min_fraction = min(fraction, 0.02)
+        stats = {"iterations": 0, "improvements": 0, "accepted": 0,
+                 "neighborhoods": {kind: 0 for kind in kinds}}
+        proven_optimal = value >= bound
+        
+        while not proven_optimal:
+            remaining = deadline - time.perf_counter()
+            if remaining < 0.1:
+                break
+            kind = rng.choice(kinds)
+            whole = fraction >= 1
+            if kind == "window":
+                length = fraction * (horizon_end - horizon_start)
+                window_start = rng.uniform(horizon_start, max(horizon_start, horizon_end - length))
+                inside = (earliest >= window_start) & (earliest <= window_start + length)
+            else:
+                chosen = set(rng.sample(satellites, max(1, round(fraction * len(satellites)))))
+                inside = np.array([satellite in chosen for satellite in demand_satellites])
+            
+            # Everything outside the neighborhood stays as it is
+            blocked, served = {}, set()
+            released = {}
+            for j, start in incumbent.items():
+                if inside[j]:
+                    released[j] = start
+                else:
+                    served.add(feasible_assignments[j]['demand_idx'])
+                    self._block(start, start + feasible_assignments[j]['duration_seconds'],
+                                feasible_assignments[j], blocked)
+            candidates = [
+                j for j in np.flatnonzero(inside).tolist()
+                if feasible_assignments[j]['demand_idx'] not in served
+                and (not blocked or self._earliest_free_start(feasible_assignments[j], earliest[j], latest[j],
+                                                              blocked, capacities) is not None)
+            ]
+            stats["iterations"] += 1
+            stats["neighborhoods"][kind] += 1
+            if not candidates:
+                fraction = min(1.0, fraction * 1.5)
+                continue
+            
+            subset = [feasible_assignments[j] for j in candidates]
+            model, variables = self.create_cp_sat_model(subset, objective, constraints, capacities or None,
+                                                        busy=blocked)
+            for k, var in variables['assignments'].items():
+                model.AddHint(var, 1 if candidates[k] in released else 0)
+            for k, j in enumerate(candidates):
+                if j in released:
+                    model.AddHint(variables['starts'][k], variables['time_grid'].nearest(released[j]))
+            time_limit = deadline - time.perf_counter() if whole else min(neighborhood_seconds, remaining)
+            status, _, _, _, selected, starts, _ = _solve_selection(
+                model, variables, max(time_limit, 0.05), profile=self.solver_profile)
+            
+            if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+                old_value = sum(coefficients[j] for j in released)
+                new_value = sum(coefficients[candidates[k]] for k in selected)
+                if new_value >= old_value:
+                    for j in released:
+                        del incumbent[j]
+                    incumbent.update({candidates[k]: starts[k] for k in selected})
+                    stats["accepted"] += 1
+                    if new_value > old_value:
+                        value += new_value - old_value
+                        stats["improvements"] += 1
+                        publish()
+                        proven_optimal = value >= bound
+            logger.debug(f"Neighborhood {stats['iterations']} ({kind}, {fraction:.3f}): "
+                         f"{len(candidates)} assignments, {len(released)} freed, status {status}")
+            if status == cp_model.OPTIMAL:
+                proven_optimal = proven_optimal or (whole and len(candidates) == len(feasible_assignments))
+                fraction = min(1.0, fraction * 1.5)
+            else:
+                fraction = max(min_fraction, fraction / 1.5)
+        
+        wall_time = time.perf_counter() - pipeline_start
+        status, status_name = (cp_model.OPTIMAL, "OPTIMAL") if proven_optimal else (cp_model.FEASIBLE, "FEASIBLE")
+        selected = sorted(incumbent)
+        result = self._build_result({"feasible_assignments": feasible_assignments}, status, status_name,
+                                    value, wall_time, selected, incumbent)
+        modeled = set(index['by_demand'])
+        result.unscheduled_demands.extend(d for i, d in enumerate(demands) if i not in modeled)
+        result.metadata.update({
+            "pruning": pruning,
+            "incumbents": sequence,
+            "first_solution_seconds": greedy_seconds,
+            "stop_reason": "optimal" if proven_optimal else "time_budget",
+            "pipeline": {
+                "greedy_objective": greedy_value,
+                "greedy_seconds": greedy_seconds,
+                **stats,
+                "final_fraction": fraction,
+            },
+        })
+        
+        logger.info(f"Hybrid schedule: {stats['iterations']} neighborhoods, {stats['improvements']} "
+                    f"improvements, objective {greedy_value} -> {value} in {wall_time:.2f}s")
+        return result
+
+    def _greedy_selection(self, assignments: List[Dict], coefficients: List[int],
+                          earliest: np.ndarray, latest: np.ndarray,
+                          blocked: Dict, capacities: Dict[str, int],
+                          satellite_limit: int = None) -> Dict[int, int]:
+        """
+        Pick assignments by decreasing objective weight at their earliest free
+        start, skipping any whose demand is already served, that no longer
+        fits in its pass, or whose satellite already has `satellite_limit`
+        contacts.
+        
+        Returns:
+            Mapping of picked assignment position to contact start
+        """
+        blocked = {key: list(busy) for key, busy in blocked.items()}
+        served = set()
+        satellite_contacts = {}
+        selected = {}
+        for j in sorted(range(len(assignments)), key=lambda j: -coefficients[j]):
+            assignment = assignments[j]
+            if assignment['demand_idx'] in served:
+                continue
+            satellite = assignment['demand']['satellite']
+            if satellite_limit is not None and satellite_contacts.get(satellite, 0) >= satellite_limit:
+                continue
+            start = self._earliest_free_start(assignment, earliest[j], latest[j], blocked, capacities)
+            if start is None:
+                continue
+            selected[j] = start
+            served.add(assignment['demand_idx'])
+            satellite_contacts[satellite] = satellite_contacts.get(satellite, 0) + 1
+            self._block(start, start + assignment['duration_seconds'], assignment, blocked)
+        return selected
+
+    def _earliest_free_start(self, assignment: Dict, earliest: int, latest: int,
+                             blocked: Dict, capacities: Dict[str, int]) -> Optional[int]:
+        """
+        Earliest start in [earliest, latest] at which an assignment's contact
+        avoids the committed contacts, or None. Only the window start and the
+        ends of busy intervals can be the first free instant.
+        """
+        duration = assignment['duration_seconds']
+        ends = {math.ceil(b_end)
+                for key in (('station', assignment['ground_station']),
+                            ('satellite', assignment['demand']['satellite']))
+                for _, b_end in blocked.get(key, ()) if earliest < b_end <= latest + 1}
+        for start in [int(earliest)] + sorted(end for end in ends if end <= latest):
+            if not self._is_blocked(start, start + duration, assignment, blocked, capacities):
+                return start
+        return None
+
+    def _block(self, start: float, end: float, assignment: Dict, blocked: Dict):
+        """Record a committed contact as busy time for its station and satellite."""
+        blocked.setdefault(('station', assignment['ground_station']), []).append((start, end))
+        blocked.setdefault(('satellite', assignment['demand']['satellite']), []).append((start, end))
+
+    def _is_blocked(self, start: float, end: float, assignment: Dict, blocked: Dict,
+                    capacities: Dict[str, int]) -> bool:
+        """
+        Whether an assignment collides with committed contacts: any overlap on
+        its satellite, or all of its station's antennas busy at some instant.
+        """
+        satellite_busy = blocked.get(('satellite', assignment['demand']['satellite']), ())
+        if any(start < b_end and b_start < end for b_start, b_end in satellite_busy):
+            return True
+        
+        station = assignment['ground_station']
+        capacity = capacities.get(station, 1)
+        busy = [(max(b_start, start), min(b_end, end))
+                for b_start, b_end in blocked.get(('station', station), ())
+                if start < b_end and b_start < end]
+        if len(busy) < capacity:
+            return False
+        
+        # Peak number of antennas in use while the assignment would run
+        depth = 0
+        for _, delta in sorted([(s, 1) for s, _ in busy] + [(e, -1) for _, e in busy]):
+            depth += delta
+            if depth >= capacity:
+                return True
+        return False
+
+
+# Model and variables shared with forked comparison workers (see compare_scheduling_strategies)
+_shared_comparison = None
+
+def _solve_shared_strategy(coefficients: List[int], time_limit: float, num_workers: Optional[int],
+                           profile: SolverProfile = None
+                           ) -> Tuple[int, str, float, float, List[int], Dict[int, int],
+                                      Optional[float], float]:
+    """
+    Solve the shared comparison model under one objective.
+    
+    Runs either in a forked worker, which owns a copy-on-write copy of the
+    model, or in the calling process.
+    
+    Returns:
+        Tuple of (status, status name, objective value, solve seconds,
+        selected assignment positions, their contact starts, best bound,
+        total seconds in this call)
+    """
+    call_start = time.perf_counter()
+    model, variables = _shared_comparison
+    assignment_vars = variables['assignments']
+    count = len(variables['feasible_assignments'])
+    
+    model.Maximize(cp_model.LinearExpr.WeightedSum(
+        [assignment_vars[i] for i in range(count)], coefficients
+    ))
+    
+    return _solve_selection(model, variables, time_limit, num_workers, profile=profile) + \
+        (time.perf_counter() - call_start,)
+
+
+# Optimizer and decomposition state shared with forked window-chain workers
+_shared_decomposition = None
+
+def _solve_shared_chain(task: Tuple[int, int, np.ndarray]) -> Tuple[List[int], List[Dict]]:
+    """Solve one chain of windows of the shared decomposition."""
+    optimizer, context = _shared_decomposition
+    return optimizer._solve_window_chain(context, *task)
+
+
+class _IncumbentCallback(cp_model.CpSolverSolutionCallback):
+    """
+    Report each improved incumbent of a selection model and apply early-stop rules.
+    
+    The solver calls this from its search threads. Contacts are diffed
+    against the previous incumbent, keyed by assignment position and start,
+    reading the solution as one array so only assignments whose selection or
+    start changed are visited. The no-improvement rule runs on a timer,
+    restarted at each solution, that stops the solver from outside the
+    search; once closed the timer can no longer fire.
+    """
+    
+    def __init__(self, variables: Dict, make_contact: Callable[[Dict, int], Dict],
+                 on_solution: Callable[[SolutionUpdate], None] = None,
+                 target_gap: float = None, no_improvement_seconds: float = None):
+        super().__init__()
+        self.variables = variables
+        self.make_contact = make_contact
+        self.on_solution = on_solution
+        self.target_gap = target_gap
+        self.no_improvement_seconds = no_improvement_seconds
+        self.sequence = 0
+        self.stop_reason = None
+        self.first_solution_seconds = None
+        count = len(variables['feasible_assignments'])
+        self._assignment_index = np.array([variables['assignments'][i].Index() for i in range(count)],
+                                          dtype=np.int64)
+        self._start_index = np.array([variables['starts'][i].Index() for i in range(count)], dtype=np.int64)
+        self._chosen = np.zeros(count, dtype=bool)
+        self._ticks = np.zeros(count, dtype=np.int64)
+        self._solver = None
+        self._timer = None
+        self._lock = threading.Lock()
+        self._closed = False
+    
+    def attach(self, solver: cp_model.CpSolver):
+        self._solver = solver
+    
+    def close(self):
+        with self._lock:
+            self._closed = True
+            if self._timer is not None:
+                self._timer.cancel()
+    
+    def _stalled(self):
+        with self._lock:
+            if self._closed:
+                return
+            self.stop_reason = "no_improvement"
+            self._solver.StopSearch()
+    
+    def on_solution_callback(self):
+        solution = np.array(self.Response().solution, dtype=np.int64)
+        chosen = solution[self._assignment_index].astype(bool)
+        ticks = solution[self._start_index]
+        
+        objective = self.ObjectiveValue()
+        bound = self.BestObjectiveBound()
+        gap = abs(bound - objective) / max(1.0, abs(objective))
+        elapsed = self.WallTime()
+        self.sequence += 1
+        if self.first_solution_seconds is None:
+            self.first_solution_seconds = elapsed
+        
+        if self.on_solution is not None:
+            grid = self.variables['time_grid']
+            feasible_assignments = self.variables['feasible_assignments']
+            moved = (chosen != self._chosen) | (chosen & (ticks != self._ticks))
+            changed = np.flatnonzero(moved)
+            added = []
+            for i in changed[chosen[changed]].tolist():
+                start = grid.to_posix(int(ticks[i]))
+                contact = self.make_contact(feasible_assignments[i], start)
+                contact['contact_id'] = f"{i}@{start}"
+                added.append(contact)
+            removed = [f"{i}@{grid.to_posix(int(self._ticks[i]))}"
+                       for i in changed[self._chosen[changed]].tolist()]
+            try:
+                self.on_solution(SolutionUpdate(
+                    sequence=self.sequence, objective_value=objective, best_bound=bound, gap=gap,
+                    elapsed_seconds=elapsed, contact_count=int(chosen.sum()),
+                    contacts_added=added, contacts_removed=removed
+                ))
+            except Exception:
+                logger.exception("Solution callback failed")
+        self._chosen, self._ticks = chosen, ticks
+        
+        if self.target_gap is not None and gap <= self.target_gap:
+            self.stop_reason = "target_gap"
+            self.StopSearch()
+        elif self.no_improvement_seconds and self._solver is not None:
+            with self._lock:
+                if self._closed:
+                    return
+                if self._timer is not None:
+                    self._timer.cancel()
+                self._timer = threading.Timer(self.no_improvement_seconds, self._stalled)
+                self._timer.daemon = True
+                self._timer.start()
+
+
+def _solve_selection(model: cp_model.CpModel, variables: Dict, time_limit: float,
+                     num_workers: Optional[int] = None, relative_gap_limit: float = None,
+                     callback: _IncumbentCallback = None, profile: SolverProfile = None
+                     ) -> Tuple[int, str, float, float, List[int], Dict[int, int], Optional[float]]:
+    """
+    Solve a scheduling model and read back which assignments were chosen.
+    
+    With `relative_gap_limit` the search stops as soon as the solution is
+    proven within that fraction of the optimum. A `callback` sees every
+    improved incumbent during the search. Solver settings come from
+    `profile` (default: balanced); `num_workers` overrides its worker count.
+    
+    Returns:
+        Tuple of (status, status name, objective value, solve seconds,
+        selected assignment positions, POSIX contact start of each selected
+        position, best objective bound or None without a solution)
+    """
+    assignment_vars = variables['assignments']
+    count = len(variables['feasible_assignments'])
+    
+    solver = cp_model.CpSolver()
+    solver.parameters.max_time_in_seconds = time_limit
+    (profile or SOLVER_PROFILES["balanced"]).apply(solver.parameters, num_workers)
+    if relative_gap_limit:
+        solver.parameters.relative_gap_limit = relative_gap_limit
+    
+    solve_start = time.perf_counter()
+    if callback is None:
+        status = solver.Solve(model)
+    else:
+        callback.attach(solver)
+        try:
+            status = solver.Solve(model, callback)
+        finally:
+            callback.close()
+        if callback.stop_reason is None and relative_gap_limit and status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            # The solver itself may stop on the gap after a bound improvement
+            gap = abs(solver.BestObjectiveBound() - solver.ObjectiveValue()) / max(1.0, abs(solver.ObjectiveValue()))
+            if 0 < gap <= relative_gap_limit:
+                callback.stop_reason = "target_gap"
+    solve_time = time.perf_counter() - solve_start
+    
+    selected = []
+    starts = {}
+    objective_value = 0
+    best_bound = None
+    if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+        selected = [i for i in range(count) if solver.BooleanValue(assignment_vars[i])]
+        grid = variables['time_grid']
+        starts = {i: grid.to_posix(solver.Value(variables['starts'][i])) for i in selected}
+        objective_value = solver.ObjectiveValue()
+        best_bound = solver.BestObjectiveBound()
+    
+    return status, solver.StatusName(status), objective_value, solve_time, selected, starts, best_bound
+
+
 # Maintain backward compatibility
 def create_optimized_schedule(all_passes: List[Dict], data_demands: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
     """
@@ -0,0 +1,172 @@
+"""
+Seeded synthetic scenarios for tests, tuning and benchmarks.
+
+Everything is reproducible from a seed: a constellation of SGP4 satellites
+on circular low Earth orbits, ground stations, geometric passes that skip
+propagation, and demands with mixed sizes, priorities and deadlines.
+"""
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+import numpy as np
+from sgp4.api import WGS72, Satrec
+from skyfield.api import EarthSatellite
+
+from app.core.ephemeris import get_timescale
+from app.scheduling.optimizer import OptimizationObjective
+
+# Start of every synthetic horizon, and epoch of the synthetic elements
+EPOCH = datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+EARTH_RADIUS_KM = 6378.135
+EARTH_MU_KM3_S2 = 398600.8
+
+# Orbit families of the synthetic constellation: (inclination deg, altitude range km)
+ORBIT_SHELLS = ((53.0, (540, 560)), (70.0, (600, 700)), (97.6, (500, 800)))
+
+
+@dataclass(frozen=True)
+class Scale:
+    """Size of a synthetic scenario."""
+    name: str
+    satellites: int
+    stations: int
+    days: float
+    demands: int
+
+
+SCALES = {
+    "xs": Scale("xs", satellites=2, stations=1, days=1, demands=10),
+    "s": Scale("s", satellites=5, stations=2, days=1, demands=100),
+    "m": Scale("m", satellites=20, stations=4, days=2, demands=1_000),
+    "l": Scale("l", satellites=100, stations=8, days=3, demands=10_000),
+    "xl": Scale("xl", satellites=400, stations=16, days=7, demands=100_000),
+}
+
+
+def synthetic_constellation(count: int, seed: int = 0) -> List[EarthSatellite]:
+    """
+    `count` satellites on circular orbits spread over ORBIT_SHELLS, with
+    random planes and phases. Drag terms are zero, so propagation stays
+    well behaved far from the epoch.
+    """
+    rng = np.random.default_rng(seed)
+    ts = get_timescale()
+    epoch = (EPOCH - datetime(1949, 12, 31, tzinfo=timezone.utc)).total_seconds() / 86400
+    satellites = []
+    for i in range(count):
+        inclination, (low, high) = ORBIT_SHELLS[i % len(ORBIT_SHELLS)]
+        semi_major_axis = EARTH_RADIUS_KM + rng.uniform(low, high)
+        mean_motion = math.sqrt(EARTH_MU_KM3_S2 / semi_major_axis ** 3) * 60  # rad/min
+        satrec = Satrec()
+        satrec.sgp4init(WGS72, 'i', 90000 + i, epoch, 0.0, 0.0, 0.0, 1e-4, 0.0,
+                        math.radians(inclination), rng.uniform(0, 2 * math.pi), mean_motion,
+                        rng.uniform(0, 2 * math.pi))
+        satellite = EarthSatellite.from_satrec(satrec, ts)
+        satellite.name = f"SAT-{i:04d}"
+        satellites.append(satellite)
+    return satellites
+
+
+def synthetic_ground_stations(count: int, seed: int = 0) -> List[Dict]:
+    """`count` stations between 60°S and 70°N with one or two antennas."""
+    rng = np.random.default_rng(seed + 1)
+    return [
+        {"name": f"GS-{k:02d}", "latitude": round(float(rng.uniform(-60, 70)), 4),
+         "longitude": round(float(rng.uniform(-180, 180)), 4),
+         "elevation_m": round(float(rng.uniform(0, 2000)), 1), "antennas": int(rng.integers(1, 3))}
+        for k in range(count)
+    ]
+
+
+def _iso(seconds: np.ndarray) -> List[str]:
+    stamps = (np.datetime64(EPOCH.replace(tzinfo=None), 'us')
+              + np.round(seconds * 1e6).astype('timedelta64[us]'))
+    return [stamp + "Z" for stamp in np.datetime_as_string(stamps, unit='s').tolist()]
+
+
+def synthetic_passes(satellites: int, ground_stations: List[Dict], days: float, seed: int = 0,
+                     visibility: float = 0.35) -> List[Dict]:
+    """
+    Geometric passes without propagation: each satellite orbits every
+    90-100 minutes, and on each orbit is visible from each station with
+    probability `visibility`, for 4-12 minutes with a 10-85° peak.
+    Passes are sorted by rise time.
+    """
+    rng = np.random.default_rng(seed + 2)
+    horizon = days * 86400
+    satellite_ids, station_ids, rises = [], [], []
+    for s in range(satellites):
+        period = rng.uniform(90, 100) * 60
+        orbits = np.arange(rng.uniform(0, period), horizon, period)
+        for g in range(len(ground_stations)):
+            visible = orbits[rng.random(len(orbits)) < visibility]
+            rises.append(visible + rng.uniform(0, 600, len(visible)))
+            satellite_ids.append(np.full(len(visible), s))
+            station_ids.append(np.full(len(visible), g))
+    if not rises:
+        return []
+    rises = np.concatenate(rises)
+    satellite_ids = np.concatenate(satellite_ids)
+    station_ids = np.concatenate(station_ids)
+    durations = rng.uniform(240, 720, len(rises))
+    peaks = rng.uniform(10, 85, len(rises))
+    keep = rises + durations <= horizon
+    order = np.argsort(rises[keep], kind='stable')
+    rises, durations, peaks = rises[keep][order], durations[keep][order], peaks[keep][order]
+    satellite_ids, station_ids = satellite_ids[keep][order], station_ids[keep][order]
+
+    rise_times = _iso(rises)
+    culmination_times = _iso(rises + durations / 2)
+    set_times = _iso(rises + durations)
+    return [
+        {"satellite": f"SAT-{s:04d}", "norad_id": 90000 + s,
+         "ground_station": ground_stations[g]['name'], "rise_time": rise, "culmination_time": culmination,
+         "set_time": set_, "max_elevation_deg": round(peak, 2)}
+        for s, g, rise, culmination, set_, peak in zip(
+            satellite_ids.tolist(), station_ids.tolist(), rise_times, culmination_times, set_times,
+            peaks.tolist())
+    ]
+
+
+def synthetic_demands(count: int, satellites: int, days: float, seed: int = 0,
+                      deadline_share: float = 0.6) -> List[Dict]:
+    """
+    `count` demands spread uniformly over the satellites. Sizes range from
+    50 to 2000 MB, priorities from 1 to 5, and `deadline_share` of them
+    carry a deadline at least 6 hours into the horizon.
+    """
+    rng = np.random.default_rng(seed + 3)
+    owners = rng.integers(0, satellites, count).tolist()
+    sizes = rng.choice([50, 100, 200, 400, 800, 1200, 2000], count).tolist()
+    priorities = rng.integers(1, 6, count).tolist()
+    has_deadline = (rng.random(count) < deadline_share).tolist()
+    deadlines = rng.uniform(6 * 3600, max(days * 86400, 6 * 3600 + 1), count).tolist()
+    demands = []
+    for i in range(count):
+        demand = {"id": i, "satellite": f"SAT-{owners[i]:04d}", "norad_id": 90000 + owners[i],
+                  "data_mb": sizes[i], "priority": priorities[i]}
+        if has_deadline[i]:
+            demand["deadline"] = (EPOCH + timedelta(seconds=deadlines[i])).replace(tzinfo=None).isoformat()
+        demands.append(demand)
+    return demands
+
+
+def synthetic_instance(satellites: int = 6, stations: int = 2, days: float = 2,
+                       demands: int = 120, seed: int = 0) -> Dict:
+    """A complete scheduling instance (passes, demands, ground stations, objective)."""
+    ground_stations = synthetic_ground_stations(stations, seed)
+    return {
+        "passes": synthetic_passes(satellites, ground_stations, days, seed),
+        "demands": synthetic_demands(demands, satellites, days, seed),
+        "ground_stations": ground_stations,
+        "objective": OptimizationObjective.MAXIMIZE_DATA_THROUGHPUT.value,
+    }
+
+
+def scale_instance(scale, seed: int = 0) -> Dict:
+    """The synthetic instance of a named Scale (or Scale object)."""
+    scale = SCALES[scale] if isinstance(scale, str) else scale
+    return synthetic_instance(scale.satellites, scale.stations, scale.days, scale.demands, seed)
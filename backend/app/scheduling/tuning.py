@@ -0,0 +1,123 @@
+"""
+Solver tuning harness.
+
+Runs a corpus of saved scheduling instances against solver profiles and
+reports, for every run, how long the profile took to find a first feasible
+schedule and whether (and how fast) it proved optimality.
+"""
+import json
+import statistics
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from app.scheduling.optimizer import (
+    SOLVER_PROFILES, AdvancedSchedulingOptimizer, OptimizationObjective, station_capacities
+)
+
+
+def save_instance(path, passes: List[Dict], demands: List[Dict], ground_stations: List[Dict] = None,
+                  objective: OptimizationObjective = OptimizationObjective.MAXIMIZE_DATA_THROUGHPUT):
+    """Save a scheduling instance as JSON so it can join a tuning corpus."""
+    instance = {"passes": passes, "demands": demands, "objective": objective.value}
+    if ground_stations:
+        instance["ground_stations"] = ground_stations
+    with open(path, 'w') as f:
+        json.dump(instance, f)
+
+
+def load_corpus(directory) -> Dict[str, Dict]:
+    """Load every *.json instance in a directory, keyed by file stem."""
+    corpus = {}
+    for path in sorted(Path(directory).glob("*.json")):
+        with open(path) as f:
+            corpus[path.stem] = json.load(f)
+    return corpus
+
+
+def tune(corpus: Dict[str, Dict], profiles: Iterable = tuple(SOLVER_PROFILES),
+         time_limit: float = 60, seeds: Sequence[Optional[int]] = (None,)) -> List[Dict]:
+    """
+    Solve every instance with every profile (and seed).
+
+    Each instance is preprocessed and modeled once; all runs then solve the
+    same CP-SAT model, so differences come from the solver settings alone.
+
+    Args:
+        corpus: Instances keyed by name (see load_corpus)
+        profiles: Profile names or SolverProfile objects
+        time_limit: Solver time limit per run, in seconds
+        seeds: Random seeds to try per profile; None keeps the solver default
+
+    Returns:
+        One row per run with status, objective, best bound, gap,
+        first_feasible_seconds, optimal_seconds (None unless proven
+        optimal), solve_seconds and incumbents
+    """
+    rows = []
+    for name, instance in corpus.items():
+        objective = OptimizationObjective(instance.get("objective", "maximize_data"))
+        ground_stations = instance.get("ground_stations")
+        modeler = AdvancedSchedulingOptimizer()
+        feasible_assignments, _ = modeler.preprocess_scheduling_data(instance["passes"], instance["demands"])
+        if not feasible_assignments:
+            continue
+        capacities = station_capacities(ground_stations) if ground_stations else None
+        model, variables = modeler.create_cp_sat_model(feasible_assignments, objective,
+                                                       station_capacities=capacities)
+
+        for profile in profiles:
+            for seed in seeds:
+                optimizer = AdvancedSchedulingOptimizer(profile, seed)
+                optimizer.solver_timeout_seconds = time_limit
+                # A no-op listener still records incumbent count and first-solution time
+                result = optimizer.solve_optimization_model(model, variables, on_solution=lambda update: None)
+                optimal = result.optimization_status == "OPTIMAL"
+                bound = result.metadata['best_bound']
+                gap = None
+                if bound is not None:
+                    gap = abs(bound - result.objective_value) / max(1.0, abs(result.objective_value))
+                rows.append({
+                    "instance": name,
+                    "profile": optimizer.solver_profile.name,
+                    "seed": seed,
+                    "workers": optimizer.solver_profile.workers(),
+                    "assignments": len(feasible_assignments),
+                    "status": result.optimization_status,
+                    "objective": result.objective_value,
+                    "best_bound": bound,
+                    "gap": gap,
+                    "first_feasible_seconds": result.metadata.get('first_solution_seconds'),
+                    "optimal_seconds": result.solve_time_seconds if optimal else None,
+                    "solve_seconds": result.solve_time_seconds,
+                    "incumbents": result.metadata.get('incumbents', 0),
+                })
+    return rows
+
+
+def summarize(rows: List[Dict]) -> Dict[str, Dict]:
+    """
+    Per-profile summary of tuning runs: how many runs found a schedule and
+    proved optimality, median time to first feasible and to optimal, mean
+    final gap, and on how many instances the profile reached the best
+    objective of all runs.
+    """
+    best = {}
+    for row in rows:
+        best[row["instance"]] = max(best.get(row["instance"], float('-inf')), row["objective"])
+
+    summary = {}
+    for profile in dict.fromkeys(row["profile"] for row in rows):
+        runs = [row for row in rows if row["profile"] == profile]
+        first = [r["first_feasible_seconds"] for r in runs if r["first_feasible_seconds"] is not None]
+        optimal = [r["optimal_seconds"] for r in runs if r["optimal_seconds"] is not None]
+        gaps = [r["gap"] for r in runs if r["gap"] is not None]
+        summary[profile] = {
+            "runs": len(runs),
+            "feasible": len(first),
+            "optimal": len(optimal),
+            "median_first_feasible_seconds": statistics.median(first) if first else None,
+            "median_optimal_seconds": statistics.median(optimal) if optimal else None,
+            "mean_gap": statistics.fmean(gaps) if gaps else None,
+            "best_objective": sum(1 for r in runs if r["objective"] >= best[r["instance"]] - 1e-6),
+        }
+    return summary
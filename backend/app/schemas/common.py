@@ -0,0 +1,172 @@
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from app.scheduling.optimizer import SOLVER_PROFILES, OptimizationObjective
+
+
+class GroundStation(BaseModel):
+    """A ground station site."""
+    name: str
+    latitude: float = Field(ge=-90, le=90)
+    longitude: float = Field(ge=-180, le=180)
+    elevation_m: float = 0.0
+    antennas: int = Field(1, ge=1, description="Contacts the station can run at once")
+
+
+class PassQuery(BaseModel):
+    """Which passes to predict: a TLE file over some stations, from `start` (default: now) on."""
+    tle_file: str = "iss.txt"
+    satellites: Optional[List[str]] = Field(
+        None, description="NORAD IDs or names from the TLE file; every satellite in it if omitted")
+    stations: Optional[List[str]] = Field(None, description="Station names; all known stations if omitted")
+    start: Optional[datetime] = Field(None, description="Window start; naive times are UTC")
+    days: float = Field(1.0, gt=0, le=14)
+    snap_seconds: Optional[float] = Field(
+        None, gt=0, le=86400, description="Snap the window to this grid so repeated queries share it")
+    altitude_degrees: float = Field(10.0, ge=0, lt=90)
+
+    @field_validator('tle_file')
+    @classmethod
+    def _plain_file_name(cls, value: str) -> str:
+        if not value or '/' in value or '\\' in value or value.startswith('.'):
+            raise ValueError("tle_file must be a file name inside the TLE data directory")
+        return value
+
+
+class SatellitePass(BaseModel):
+    """A predicted pass of a satellite over a ground station."""
+    model_config = ConfigDict(extra='allow')
+
+    satellite: Optional[str] = None
+    norad_id: Optional[int] = None
+    ground_station: Optional[str] = None
+    rise_time: str
+    culmination_time: Optional[str] = None
+    set_time: str
+    max_elevation_deg: Optional[float] = None
+
+
+class PassResponse(BaseModel):
+    """Passes answering a PassQuery."""
+    passes: List[SatellitePass]
+    count: int
+    cached: bool = Field(description="Served from the pass cache without propagating")
+    elapsed_ms: float
+
+
+class Demand(BaseModel):
+    """A data transfer demand."""
+    model_config = ConfigDict(extra='allow')
+
+    id: Optional[Union[int, str]] = None
+    satellite: str
+    norad_id: Optional[int] = None
+    data_mb: float = Field(gt=0)
+    priority: float = Field(1.0, gt=0)
+    deadline: Optional[str] = None
+
+    @field_validator('deadline')
+    @classmethod
+    def _iso_deadline(cls, value: Optional[str]) -> Optional[str]:
+        if value is not None:
+            datetime.fromisoformat(value)
+        return value
+
+
+class ScheduleMode(str, Enum):
+    """Scheduling engine used for a request."""
+    OPTIMIZED = "optimized"
+    SPLIT = "split"
+    DECOMPOSED = "decomposed"
+    HYBRID = "hybrid"
+    BASELINE = "baseline"
+
+
+class ScheduleRequest(BaseModel):
+    """
+    Demands to schedule, over either explicit passes or the passes of a
+    PassQuery (predicted in the worker when `passes` is omitted).
+    """
+    demands: List[Demand] = Field(min_length=1)
+    passes: Optional[List[SatellitePass]] = None
+    pass_query: PassQuery = Field(default_factory=PassQuery)
+    mode: ScheduleMode = ScheduleMode.OPTIMIZED
+    objective: OptimizationObjective = OptimizationObjective.MAXIMIZE_DATA_THROUGHPUT
+    ground_stations: Optional[List[GroundStation]] = None
+    solver_timeout: Optional[float] = Field(
+        None, gt=0, le=3600,
+        description="Seconds; its meaning depends on the mode. Optimized and split: the CP-SAT "
+                    "solve limit. Decomposed: the limit per time window. Hybrid: the total time "
+                    "budget. Baseline: ignored"
+    )
+    solver_profile: str = Field("balanced", description=f"One of {', '.join(SOLVER_PROFILES)}")
+    random_seed: Optional[int] = Field(None, ge=0)
+    target_gap: Optional[float] = Field(None, gt=0, lt=1, description="Optimized mode: stop within this relative gap")
+    no_improvement_seconds: Optional[float] = Field(
+        None, gt=0, description="Optimized mode: stop after this long without a better solution"
+    )
+    time_resolution_seconds: int = Field(
+        1, ge=1, le=300, description="Contact starts are placed on a grid of this many seconds"
+    )
+
+    @field_validator('solver_profile')
+    @classmethod
+    def _known_profile(cls, value: str) -> str:
+        if value not in SOLVER_PROFILES:
+            raise ValueError(f"solver_profile must be one of {list(SOLVER_PROFILES)}")
+        return value
+
+
+class Contact(BaseModel):
+    """A scheduled contact; engine-specific details are kept as extra fields."""
+    model_config = ConfigDict(extra='allow')
+
+    satellite: str
+    ground_station: str
+    demand_mb: float
+    start_time: str
+    end_time: str
+    duration_seconds: float
+    antenna: Optional[int] = None
+    demand_id: Optional[Union[int, str]] = None
+
+
+class ScheduleResult(BaseModel):
+    """Outcome of a scheduling run."""
+    mode: ScheduleMode
+    status: str
+    solution_quality: str
+    objective_value: float
+    solve_time_seconds: float
+    total_data_scheduled: float
+    schedule_efficiency: float
+    scheduled_contacts: List[Contact]
+    unscheduled_demands: List[Demand]
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+
+
+class JobStatus(str, Enum):
+    """Lifecycle of an asynchronous scheduling job."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class Job(BaseModel):
+    """State of an asynchronous scheduling job."""
+    job_id: str
+    status: JobStatus
+    mode: ScheduleMode
+    submitted_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    incumbents: int = Field(0, description="Improved solutions found so far")
+    best_objective: Optional[float] = None
+    gap: Optional[float] = None
+    result: Optional[ScheduleResult] = None
+    error: Optional[str] = None
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Run the scheduling benchmark suite on synthetic scenarios.
+
+    python run_benchmarks.py [--scales xs s m] [--benchmarks solve baseline]
+                             [--repeat 3] [--output report.json]
+                             [--baseline baseline.json --threshold 0.25]
+
+With --baseline, the run is compared with a stored report and the exit
+status is 1 when any benchmark regressed.
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+from app.scheduling.benchmark import BENCHMARKS, compare_reports, load_report, run_benchmarks, save_report
+from app.scheduling.optimizer import SOLVER_PROFILES
+from app.scheduling.synthetic import SCALES
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", nargs="+", default=["xs", "s", "m"], choices=list(SCALES))
+    parser.add_argument("--benchmarks", nargs="+", default=list(BENCHMARKS), choices=list(BENCHMARKS))
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per benchmark and scale")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--time-limit", type=float, default=10,
+                        help="Solver seconds for the solve benchmark, total budget for the hybrid one")
+    parser.add_argument("--profile", default="balanced", choices=list(SOLVER_PROFILES),
+                        help="Solver profile for the solve and hybrid benchmarks")
+    parser.add_argument("--force", action="store_true", help="Run scales beyond each benchmark's limit")
+    parser.add_argument("--output", type=Path, help="Write the report as JSON")
+    parser.add_argument("--baseline", type=Path, help="Stored report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown before a regression")
+    args = parser.parse_args()
+
+    # Keep per-solve optimizer logging out of the timing table
+    logging.getLogger("app.scheduling.optimizer").setLevel(logging.WARNING)
+
+    report = run_benchmarks(args.scales, args.benchmarks, repeat=args.repeat, seed=args.seed, force=args.force,
+                            solve_time_limit=args.time_limit, solver_profile=args.profile)
+    env = report["environment"]
+    print(f"Python {env['python']}, OR-Tools {env['ortools']}, {env['cores']} cores, commit {env['commit']}")
+    print(f"\n{'benchmark':<16} {'scale':<6} {'median':>10} {'min':>10} {'stdev':>9}  counters")
+    for result in report["results"]:
+        if "skipped" in result:
+            print(f"{result['benchmark']:<16} {result['scale']:<6} {'skipped':>10}  ({result['skipped']})")
+            continue
+        print(f"{result['benchmark']:<16} {result['scale']:<6} {result['median_seconds']:>9.4f}s "
+              f"{result['min_seconds']:>9.4f}s {result['stdev_seconds']:>8.4f}s  {result['counters']}")
+
+    if args.output:
+        save_report(report, args.output)
+        print(f"\nReport written to {args.output}")
+
+    if args.baseline:
+        rows = compare_reports(report, load_report(args.baseline), threshold=args.threshold)
+        print(f"\nAgainst {args.baseline} (threshold {args.threshold:.0%}):")
+        for row in rows:
+            ratio = "-" if row["ratio"] is None else f"{row['ratio']:.2f}x"
+            print(f"  {row['benchmark']:<16} {row['scale']:<6} {ratio:>7}  {row['status']}")
+        regressions = [row for row in rows if row["status"] == "regression"]
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s)")
+            sys.exit(1)
+        print("\n✅ No regressions")
+
+if __name__ == "__main__":
+    main()
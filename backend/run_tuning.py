@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Compare CP-SAT solver profiles on a corpus of saved scheduling instances.
+
+    python run_tuning.py CORPUS_DIR [--profiles fast balanced thorough]
+                         [--time-limit 60] [--seeds 1 2 3] [--output report.json]
+    python run_tuning.py CORPUS_DIR --generate 5   # write a synthetic corpus first
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from app.scheduling.optimizer import SOLVER_PROFILES, available_cores
+from app.scheduling.synthetic import synthetic_instance
+from app.scheduling.tuning import load_corpus, save_instance, summarize, tune
+
+def _seconds(value):
+    return "-" if value is None else f"{value:.2f}s"
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("corpus", type=Path, help="Directory of instance JSON files")
+    parser.add_argument("--profiles", nargs="+", default=list(SOLVER_PROFILES), choices=list(SOLVER_PROFILES))
+    parser.add_argument("--time-limit", type=float, default=60, help="Seconds per solve")
+    parser.add_argument("--seeds", nargs="+", type=int, default=None, help="Random seeds per profile")
+    parser.add_argument("--generate", type=int, default=0, metavar="N",
+                        help="Write N synthetic instances of growing size into the corpus first")
+    parser.add_argument("--output", type=Path, help="Write runs and summary as JSON")
+    args = parser.parse_args()
+
+    if args.generate:
+        args.corpus.mkdir(parents=True, exist_ok=True)
+        for i in range(args.generate):
+            instance = synthetic_instance(satellites=4 + 2 * i, days=1 + i, demands=80 * (i + 1), seed=i)
+            save_instance(args.corpus / f"synthetic_{i:02d}.json", instance["passes"], instance["demands"],
+                          instance["ground_stations"])
+
+    corpus = load_corpus(args.corpus)
+    print(f"{len(corpus)} instances, profiles {args.profiles}, {available_cores()} cores, "
+          f"{args.time_limit:g}s per solve")
+    rows = tune(corpus, args.profiles, args.time_limit, args.seeds or (None,))
+
+    print(f"\n{'instance':<20} {'profile':<10} {'seed':>5} {'status':<9} {'objective':>12} "
+          f"{'gap':>7} {'first':>8} {'optimal':>8}")
+    for row in rows:
+        gap = "-" if row["gap"] is None else f"{row['gap']:.2%}"
+        print(f"{row['instance']:<20} {row['profile']:<10} {str(row['seed']):>5} {row['status']:<9} "
+              f"{row['objective']:>12.0f} {gap:>7} {_seconds(row['first_feasible_seconds']):>8} "
+              f"{_seconds(row['optimal_seconds']):>8}")
+
+    summary = summarize(rows)
+    print(f"\n{'profile':<10} {'feasible':>9} {'optimal':>8} {'best':>5} {'first (med)':>12} {'optimal (med)':>14}")
+    for profile, stats in summary.items():
+        print(f"{profile:<10} {stats['feasible']:>4}/{stats['runs']:<4} {stats['optimal']:>8} "
+              f"{stats['best_objective']:>5} {_seconds(stats['median_first_feasible_seconds']):>12} "
+              f"{_seconds(stats['median_optimal_seconds']):>14}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({"runs": rows, "summary": summary}, f, indent=2)
+        print(f"\nReport written to {args.output}")
+
+if __name__ == "__main__":
+    main()
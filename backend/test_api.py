@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Test suite for the HTTP API.
+Runs the app under uvicorn on a free port, with a temporary pass cache and
+a one-process worker pool, and talks to it over real HTTP.
+"""
+
+from contextlib import contextmanager
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+
+import requests
+import uvicorn
+
+SATELLITE = "ISS (ZARYA)"
+
+@contextmanager
+def _running_api():
+    """Serve app.main on a free port; yields the base URL."""
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["PASS_CACHE_PATH"] = os.path.join(tmp, "passes.sqlite3")
+        os.environ["SCHEDULER_WORKERS"] = "1"
+        from app.main import app
+
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+        thread = threading.Thread(target=server.run, daemon=True)
+        thread.start()
+        base_url = f"http://127.0.0.1:{port}"
+        try:
+            deadline = time.time() + 30
+            while not server.started:
+                assert time.time() < deadline, "API did not start"
+                time.sleep(0.05)
+            yield base_url
+        finally:
+            server.should_exit = True
+            thread.join(timeout=30)
+            for key in ("PASS_CACHE_PATH", "SCHEDULER_WORKERS"):
+                os.environ.pop(key, None)
+
+def _wait_for_job(base_url, job_id, timeout=120):
+    deadline = time.time() + timeout
+    while True:
+        job = requests.get(f"{base_url}/api/schedule/jobs/{job_id}").json()
+        if job["status"] in ("completed", "failed", "cancelled"):
+            return job
+        assert time.time() < deadline, f"Job {job_id} did not finish"
+        time.sleep(0.2)
+
+def test_pass_queries():
+    """Test pass queries: the first propagates in a worker, repeats come from the cache."""
+    print("=== Testing Pass Query Endpoint ===")
+
+    with _running_api() as base_url:
+        health = requests.get(f"{base_url}/health").json()
+        assert health["status"] == "ok"
+
+        stations = requests.get(f"{base_url}/api/ground-stations").json()
+        assert stations and all("latitude" in s for s in stations)
+
+        first = requests.get(f"{base_url}/api/passes", params={"days": 1}).json()
+        second = requests.get(f"{base_url}/api/passes", params={"days": 1}).json()
+        print(f"  Miss: {first['count']} passes in {first['elapsed_ms']:.1f} ms")
+        print(f"  Hit:  {second['count']} passes in {second['elapsed_ms']:.1f} ms")
+
+        assert not first["cached"] and second["cached"]
+        assert first["count"] > 0
+        assert [p["rise_time"][:16] for p in first["passes"]] == [p["rise_time"][:16] for p in second["passes"]]
+        assert second["elapsed_ms"] < 100
+
+        # The horizon margin lets a slightly longer window hit the cache too
+        longer = requests.get(f"{base_url}/api/passes", params={"days": 1.1}).json()
+        assert longer["cached"]
+
+        # Snapped windows anchored at a fixed start are shared by later queries
+        anchored = {"days": 1, "start": "2030-01-01T00:02:10Z", "snap_seconds": 300}
+        first_anchored = requests.get(f"{base_url}/api/passes", params=anchored).json()
+        again = requests.get(f"{base_url}/api/passes", params={**anchored, "start": "2030-01-01T00:04:00Z"}).json()
+        assert not first_anchored["cached"] and again["cached"]
+        assert again["passes"] == first_anchored["passes"]
+
+        # With several epochs, lookups and predictions use the one closest to the window start
+        from app.core.satellite import TLE_DATA_PATH
+        iss = (TLE_DATA_PATH / "iss.txt").read_text().splitlines()
+        multi_epoch = TLE_DATA_PATH / "_multi_epoch_test.txt"
+        multi_epoch.write_text("\n".join(iss + [iss[0], iss[1][:18] + "30001.00000000" + iss[1][32:], iss[2]]))
+        try:
+            query = {"days": 1, "start": "2030-01-01T00:00:00Z", "tle_file": multi_epoch.name}
+            assert not requests.get(f"{base_url}/api/passes", params=query).json()["cached"]
+            assert requests.get(f"{base_url}/api/passes", params=query).json()["cached"]
+        finally:
+            multi_epoch.unlink()
+
+        # Satellites of the TLE file can be picked by NORAD ID or name
+        by_id = requests.get(f"{base_url}/api/passes", params={"days": 1, "satellites": "25544"}).json()
+        by_name = requests.get(f"{base_url}/api/passes", params={"days": 1, "satellites": "ISS (ZARYA)"}).json()
+        assert by_id["count"] == by_name["count"] == first["count"]
+
+        # Bad input is rejected before any work is done
+        assert requests.get(f"{base_url}/api/passes", params={"days": 0}).status_code == 422
+        assert requests.get(f"{base_url}/api/passes", params={"tle_file": "../secrets"}).status_code == 422
+        assert requests.get(f"{base_url}/api/passes", params={"tle_file": "missing.txt"}).status_code == 404
+        assert requests.get(f"{base_url}/api/passes", params={"stations": "Nowhere"}).status_code == 404
+        assert requests.get(f"{base_url}/api/passes", params={"satellites": "99999"}).status_code == 404
+
+    print("✅ Cached pass queries skip propagation")
+
+def test_schedule_jobs():
+    """Test synchronous schedules, job polling, event streams and cheap queries during a solve."""
+    print("=== Testing Schedule Jobs ===")
+
+    with _running_api() as base_url:
+        demands = [{"id": i, "satellite": SATELLITE, "data_mb": 400 + 100 * i, "priority": 1 + i % 3}
+                   for i in range(6)]
+        body = {"demands": demands, "pass_query": {"days": 2}, "solver_timeout": 5}
+
+        # Synchronous request; it also fills the pass cache
+        response = requests.post(f"{base_url}/api/schedule", json=body)
+        assert response.status_code == 200, response.text
+        result = response.json()
+        print(f"  Optimized: {len(result['scheduled_contacts'])} contacts, "
+              f"{result['total_data_scheduled']:.0f} MB ({result['status']})")
+        assert result["mode"] == "optimized"
+        assert result["scheduled_contacts"]
+        assert len(result["scheduled_contacts"]) + len(result["unscheduled_demands"]) == len(demands)
+
+        baseline = requests.post(f"{base_url}/api/schedule", json={**body, "mode": "baseline"}).json()
+        assert baseline["solution_quality"] == "GREEDY"
+        assert baseline["total_data_scheduled"] <= result["total_data_scheduled"] + 1e-6
+
+        hybrid = requests.post(f"{base_url}/api/schedule", json={**body, "mode": "hybrid"}).json()
+        assert hybrid["mode"] == "hybrid" and "pipeline" in hybrid["metadata"]
+        assert hybrid["total_data_scheduled"] >= baseline["total_data_scheduled"] - 1e-6
+
+        # Asynchronous job, followed through its event stream
+        submitted = requests.post(f"{base_url}/api/schedule/jobs", json={**body, "mode": "split"})
+        assert submitted.status_code == 202
+        job_id = submitted.json()["job_id"]
+
+        # Cached pass queries are answered while the solve occupies the pool
+        t0 = time.perf_counter()
+        passes = requests.get(f"{base_url}/api/passes", params={"days": 2}).json()
+        query_time = time.perf_counter() - t0
+        print(f"  Pass query during solve: {query_time * 1000:.1f} ms (cached={passes['cached']})")
+        assert passes["cached"] and query_time < 0.5
+
+        statuses = []
+        final = None
+        with requests.get(f"{base_url}/api/schedule/jobs/{job_id}/events", stream=True, timeout=120) as stream:
+            for line in stream.iter_lines(decode_unicode=True):
+                if line.startswith("data: "):
+                    event = json.loads(line[len("data: "):])
+                    statuses.append(event["status"])
+                    final = event
+        print(f"  Job events: {statuses}")
+        assert statuses[-1] == "completed"
+        assert final["result"]["mode"] == "split"
+
+        job = _wait_for_job(base_url, job_id)
+        assert job["status"] == "completed" and job["finished_at"]
+        assert any(j["job_id"] == job_id for j in requests.get(f"{base_url}/api/schedule/jobs").json())
+
+        # Optimized jobs stream their incumbents and honour early-stop settings
+        submitted = requests.post(f"{base_url}/api/schedule/jobs",
+                                  json={**body, "no_improvement_seconds": 1, "target_gap": 0.01,
+                                        "solver_profile": "fast", "random_seed": 5})
+        job_id = submitted.json()["job_id"]
+        incumbents = []
+        with requests.get(f"{base_url}/api/schedule/jobs/{job_id}/events", stream=True, timeout=120) as stream:
+            event = None
+            for line in stream.iter_lines(decode_unicode=True):
+                if line.startswith("event: "):
+                    event = line[len("event: "):]
+                elif line.startswith("data: ") and event == "incumbent":
+                    incumbents.append(json.loads(line[len("data: "):]))
+        job = _wait_for_job(base_url, job_id)
+        print(f"  Incumbent events: {[u['objective_value'] for u in incumbents]}")
+        assert incumbents and job["incumbents"] == len(incumbents)
+        assert job["best_objective"] == job["result"]["objective_value"]
+        assert all("contact_id" in c for c in incumbents[0]["contacts_added"])
+        incumbent = requests.get(f"{base_url}/api/schedule/jobs/{job_id}/incumbent").json()
+        assert len(incumbent) == len(job["result"]["scheduled_contacts"])
+
+        assert requests.get(f"{base_url}/api/schedule/jobs/nope").status_code == 404
+        assert requests.post(f"{base_url}/api/schedule", json={"demands": []}).status_code == 422
+        assert requests.post(f"{base_url}/api/schedule",
+                             json={**body, "solver_profile": "reckless"}).status_code == 422
+
+    print("✅ Schedules run in the worker pool without blocking the API")
+
+def main():
+    """Run all API tests."""
+    print("=" * 60)
+    print("API TEST SUITE")
+    print("=" * 60)
+
+    try:
+        test_pass_queries()
+        test_schedule_jobs()
+
+        print("\n" + "=" * 60)
+        print("ALL API TESTS COMPLETED SUCCESSFULLY")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+
+if __name__ == "__main__":
+    main()
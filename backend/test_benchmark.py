@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Test suite for the synthetic scenario generator and the benchmark suite.
+"""
+
+from app.scheduling.benchmark import BENCHMARKS, compare_reports, load_report, run_benchmarks, save_report
+from app.scheduling.synthetic import (
+    EPOCH, SCALES, scale_instance, synthetic_constellation, synthetic_ground_stations
+)
+from app.core.satellite import find_passes_batch
+import copy
+import json
+import os
+import tempfile
+
+def test_synthetic_generator():
+    """Test that scenarios are reproducible from a seed and scale as specified."""
+    print("=== Testing Synthetic Scenario Generator ===")
+
+    first = scale_instance("s", seed=4)
+    assert first == scale_instance("s", seed=4), "Same seed must give the same scenario"
+    assert first != scale_instance("s", seed=5)
+
+    for name in ("xs", "s", "m"):
+        instance = scale_instance(name)
+        spec = SCALES[name]
+        satellites = {p['satellite'] for p in instance['passes']}
+        assert len(instance['demands']) == spec.demands
+        assert len(instance['ground_stations']) == spec.stations
+        assert satellites <= {f"SAT-{s:04d}" for s in range(spec.satellites)}
+        rises = [p['rise_time'] for p in instance['passes']]
+        assert rises == sorted(rises)
+        assert all(p['rise_time'] < p['set_time'] for p in instance['passes'])
+        print(f"  {name}: {len(instance['passes'])} passes, {len(instance['demands'])} demands")
+
+    # The synthetic constellation propagates like real TLEs
+    satellites = synthetic_constellation(3, seed=1)
+    stations = synthetic_ground_stations(2, seed=1)
+    passes = find_passes_batch(satellites, stations, days=1, start=EPOCH)
+    assert passes and {p['satellite'] for p in passes} <= {s.name for s in satellites}
+    assert [p['rise_time'] for p in passes] == [p['rise_time'] for p in
+                                                  find_passes_batch(satellites, stations, days=1, start=EPOCH)]
+
+    print(f"✅ Seeded scenarios; constellation gives {len(passes)} predicted passes")
+
+def test_benchmark_suite():
+    """Test benchmark reports, skipping beyond max scale, and regression comparison."""
+    print("=== Testing Benchmark Suite ===")
+
+    report = run_benchmarks(scales=["xs"], repeat=2, solve_time_limit=5)
+    assert json.loads(json.dumps(report)) == report, "Reports must be plain JSON"
+    assert [r["benchmark"] for r in report["results"]] == list(BENCHMARKS)
+    for result in report["results"]:
+        assert len(result["times"]) == 2
+        assert result["min_seconds"] <= result["median_seconds"]
+        print(f"  {result['benchmark']}: {result['median_seconds'] * 1000:.1f} ms {result['counters']}")
+    assert report["environment"]["cores"] >= 1
+
+    skipped = run_benchmarks(scales=["xl"], benchmarks=["solve"], repeat=1)
+    assert "skipped" in skipped["results"][0]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "baseline.json")
+        save_report(report, path)
+        baseline = load_report(path)
+    assert all(row["status"] == "ok" for row in compare_reports(report, baseline))
+
+    # Make the baseline 10x faster (then slower) than the current run
+    faster = copy.deepcopy(baseline)
+    slower = copy.deepcopy(baseline)
+    for fast, slow in zip(faster["results"], slower["results"]):
+        fast["median_seconds"] /= 10
+        slow["median_seconds"] *= 10
+    statuses = {row["benchmark"]: row["status"] for row in compare_reports(report, faster, min_seconds=0)}
+    assert set(statuses.values()) == {"regression"}
+    statuses = {row["benchmark"]: row["status"] for row in compare_reports(report, slower, min_seconds=0)}
+    assert set(statuses.values()) == {"improvement"}
+
+    # Millisecond noise does not count as a regression
+    noisy = {row["status"] for row in compare_reports(report, faster, min_seconds=60)}
+    assert noisy == {"ok"}
+    assert compare_reports(skipped, baseline)[0]["status"] == "skipped"
+    assert compare_reports(report, {"results": []})[0]["status"] == "new"
+
+    print("✅ Reports round-trip and regressions are flagged")
+
+def main():
+    """Run all benchmark tests."""
+    print("=" * 60)
+    print("BENCHMARK SUITE TESTS")
+    print("=" * 60)
+
+    try:
+        test_synthetic_generator()
+        test_benchmark_suite()
+
+        print("\n" + "=" * 60)
+        print("ALL BENCHMARK TESTS COMPLETED SUCCESSFULLY")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,8 @@ Tests all new features and ensures backward compatibility.
 from app.core.latency import LatencyEstimator, estimate_transfer_time
 from datetime import datetime, timedelta
 import json
+import time
+import numpy as np
 
 def test_basic_latency_estimation():
     """Test basic latency estimation functionality."""
@@ -188,6 +190,97 @@ def test_edge_cases():
     if result:
         print(f"Large data test: Feasible={result['is_feasible']}, Time={result['total_required_time_seconds']:.2f}s")
 
+def test_batch_estimation():
+    """Test the vectorized batch API against the scalar estimator."""
+    print("\n=== Testing Batch Estimation ===")
+    
+    estimator = LatencyEstimator()
+    
+    now = datetime.now()
+    durations = [120, 300, 600, 900]
+    data_sizes = [0, 150, 500, 1200]
+    weather = ['clear', 'rain', 'storm']
+    
+    # Every (duration, size, weather) combination through broadcasting
+    batch = estimator.estimate_batch(
+        np.array(durations)[:, None, None],
+        np.array(data_sizes)[None, :, None],
+        weather_codes=estimator.encode_weather(weather)[None, None, :]
+    )
+    assert batch.shape == (4, 4, 3)
+    
+    for i, duration in enumerate(durations):
+        pass_info = {
+            'rise_time': now.isoformat() + 'Z',
+            'set_time': (now + timedelta(seconds=duration)).isoformat() + 'Z'
+        }
+        for j, data_mb in enumerate(data_sizes):
+            for k, condition in enumerate(weather):
+                scalar = estimator.estimate_transfer_time_detailed(
+                    pass_info, data_mb, weather_condition=condition)
+                row = batch[i, j, k]
+                assert bool(row['is_feasible']) == scalar['is_feasible']
+                assert round(float(row['total_required_time_seconds']), 2) == scalar['total_required_time_seconds']
+                assert round(float(row['pass_utilization']), 3) == scalar['pass_utilization']
+    print("✅ Batch results match scalar estimation")
+    
+    # A million combinations with per-element elevation and altitude
+    n = 1_000_000
+    rng = np.random.default_rng(0)
+    start = time.time()
+    results = estimator.estimate_batch(
+        rng.uniform(60, 900, n), rng.uniform(50, 2000, n),
+        elevations_deg=rng.uniform(10, 90, n), altitudes_km=rng.uniform(400, 1200, n),
+        weather_codes=rng.integers(0, 5, n)
+    )
+    elapsed = time.time() - start
+    print(f"  {n:,} estimates in {elapsed*1000:.1f} ms, {results['is_feasible'].mean():.1%} feasible")
+
+def _synthetic_profile(peak_deg, duration_s, samples=16):
+    """Elevation rising from 10° to `peak_deg` and back, with a matching slant range."""
+    offsets = np.linspace(0, duration_s, samples, dtype=np.float32)
+    elevation = 10 + (peak_deg - 10) * np.sin(np.pi * offsets / duration_s)
+    range_km = 408 / np.sin(np.radians(elevation + 5))
+    return {"offsets_s": offsets, "elevation_deg": elevation.astype(np.float32),
+            "range_km": range_km.astype(np.float32)}
+
+def test_profile_estimation():
+    """Test throughput integration over per-pass elevation profiles."""
+    print("\n=== Testing Elevation Profile Estimation ===")
+    
+    estimator = LatencyEstimator()
+    
+    now = datetime.now()
+    pass_info = {
+        'rise_time': now.isoformat() + 'Z',
+        'set_time': (now + timedelta(seconds=600)).isoformat() + 'Z'
+    }
+    grazing = dict(pass_info, profile=_synthetic_profile(15, 600))
+    overhead = dict(pass_info, profile=_synthetic_profile(85, 600))
+    
+    for data_mb in [500, 1000, 3000]:
+        flat = estimator.estimate_transfer_time_detailed(pass_info, data_mb)
+        low = estimator.estimate_transfer_time_detailed(grazing, data_mb)
+        high = estimator.estimate_transfer_time_detailed(overhead, data_mb)
+        print(f"  {data_mb} MB: 45° {flat['total_required_time_seconds']}s, "
+              f"grazing {low['total_required_time_seconds']}s, overhead {high['total_required_time_seconds']}s")
+        assert high['total_required_time_seconds'] < low['total_required_time_seconds']
+        assert low['estimated_elevation_deg'] < 15 < high['estimated_elevation_deg']
+    
+    # Pass capacity separates what fits from what does not
+    capacity = estimator.estimate_transfer_time_detailed(overhead, 0)['pass_capacity_mb']
+    assert estimator.estimate_transfer_time_detailed(overhead, capacity * 0.99)['is_feasible']
+    assert not estimator.estimate_transfer_time_detailed(overhead, capacity * 1.01)['is_feasible']
+    print(f"✅ Overhead pass capacity {capacity:.0f} MB")
+    
+    # Vectorized over demands, matching the scalar path
+    sizes = np.array([0, 50, 500, 5000])
+    batch = estimator.estimate_profile_requirements(overhead['profile'], sizes)
+    for data_mb, required in zip(sizes, batch['total_required_time']):
+        scalar = estimator.estimate_transfer_time_detailed(overhead, data_mb)
+        assert round(float(required), 2) == scalar['total_required_time_seconds']
+    print("✅ Profile estimates integrate throughput per pass")
+
 def main():
     """Run all latency estimation tests."""
     print("=" * 60)
@@ -201,6 +294,8 @@ def main():
         test_signal_propagation()
         test_backward_compatibility()
         test_edge_cases()
+        test_batch_estimation()
+        test_profile_estimation()
         
         print("\n" + "=" * 60)
         print("ALL TESTS COMPLETED SUCCESSFULLY")
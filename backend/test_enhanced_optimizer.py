@@ -13,6 +13,7 @@ from app.scheduling.optimizer import (
     create_optimized_schedule
 )
 from datetime import datetime, timedelta
+import math
 import time
 
 def test_basic_optimization():
@@ -323,6 +324,623 @@ def test_performance():
     print(f"  Status: {result_timeout.optimization_status}")
     print(f"  Quality: {result_timeout.solution_quality}")
 
+def _synthetic_pass(satellite, station, start, minutes=10):
+    """Build a pass dictionary tagged with satellite and station."""
+    return {
+        "satellite": satellite,
+        "ground_station": station,
+        "rise_time": start.isoformat() + 'Z',
+        "culmination_time": (start + timedelta(minutes=minutes / 2)).isoformat() + 'Z',
+        "set_time": (start + timedelta(minutes=minutes)).isoformat() + 'Z'
+    }
+
+def test_multi_station_resources():
+    """Test that each ground station (and antenna) is modeled as its own resource."""
+    print("\n=== Testing Multi-Station Resources ===")
+
+    start = datetime(2030, 1, 1, 12, 0, 0)
+    # Each contact needs most of a ten-minute pass, so two cannot share one
+    demands = [
+        {"satellite": "SAT-A", "data_mb": 3000},
+        {"satellite": "SAT-B", "data_mb": 3000},
+    ]
+    optimizer = AdvancedSchedulingOptimizer()
+
+    # Simultaneous passes over two different stations can both be used
+    passes = [
+        _synthetic_pass("SAT-A", "Station North", start),
+        _synthetic_pass("SAT-B", "Station South", start),
+    ]
+    result = optimizer.create_advanced_schedule(passes, demands)
+    assert len(result.scheduled_contacts) == 2, "Two stations should serve two contacts at once"
+    assert {c['ground_station'] for c in result.scheduled_contacts} == {"Station North", "Station South"}
+
+    # Simultaneous passes over one single-antenna station conflict...
+    passes = [
+        _synthetic_pass("SAT-A", "Station North", start),
+        _synthetic_pass("SAT-B", "Station North", start),
+    ]
+    result = optimizer.create_advanced_schedule(passes, demands)
+    assert len(result.scheduled_contacts) == 1, "One antenna should serve one contact at a time"
+
+    # ...unless the station has a second antenna
+    stations = [{"name": "Station North", "antennas": 2}]
+    result = optimizer.create_advanced_schedule(passes, demands, ground_stations=stations)
+    assert len(result.scheduled_contacts) == 2, "Two antennas should serve two contacts at once"
+    assert sorted(c['antenna'] for c in result.scheduled_contacts) == [0, 1]
+
+    print("✅ Stations and antennas modeled as separate resources")
+
+def test_indexed_preprocessing():
+    """Test that indexed preprocessing matches per-pair estimation."""
+    print("\n=== Testing Indexed Preprocessing ===")
+
+    start = datetime(2030, 1, 1, 12, 0, 0)
+    passes = [
+        _synthetic_pass("SAT-A" if i % 2 else "SAT-B", "Station North",
+                        start + timedelta(hours=i), minutes=2 + i)
+        for i in range(8)
+    ]
+    demands = [
+        {"satellite": "SAT-A", "data_mb": 400},
+        {"satellite": "SAT-B", "data_mb": 900},
+        {"satellite": "SAT-C", "data_mb": 100},
+    ]
+
+    optimizer = AdvancedSchedulingOptimizer()
+    assignments, metadata = optimizer.preprocess_scheduling_data(passes, demands)
+
+    expected = []
+    for p_idx, pass_info in enumerate(passes):
+        for d_idx, demand in enumerate(demands):
+            if pass_info['satellite'] != demand['satellite']:
+                continue
+            estimation = optimizer.latency_estimator.estimate_transfer_time_detailed(
+                pass_info, demand['data_mb'])
+            if estimation['is_feasible']:
+                expected.append((p_idx, d_idx, estimation))
+
+    actual = [(a['pass_idx'], a['demand_idx'], a['estimation_details']) for a in assignments]
+    assert actual == expected, "Indexed preprocessing should match per-pair estimation"
+    assert all(a['demand']['satellite'] == a['pass']['satellite'] for a in assignments)
+    assert metadata['feasible_combinations'] == len(expected)
+
+    print(f"✅ {len(assignments)} feasible assignments match per-pair estimation")
+
+def test_model_build_scaling():
+    """Benchmark CP-SAT model construction on its own at growing sizes."""
+    print("\n=== Testing Model Build Scaling ===")
+
+    start = datetime(2030, 1, 1)
+    optimizer = AdvancedSchedulingOptimizer()
+    constraints = [SchedulingConstraint("maximum_contacts_per_satellite", {"max_contacts": 5})]
+
+    print(f"{'Assignments':>12} {'Build (s)':>10} {'us/assignment':>14}")
+    per_assignment = []
+    for n_satellites in (10, 40):
+        passes = [
+            _synthetic_pass(f"SAT-{s}", f"Station {k % 4}",
+                            start + timedelta(minutes=97 * k + 7 * s), minutes=10)
+            for s in range(n_satellites) for k in range(25)
+        ]
+        demands = [
+            {"satellite": f"SAT-{i % n_satellites}", "data_mb": 100 + (i * 37) % 900,
+             "deadline": (start + timedelta(days=1)).isoformat()}
+            for i in range(n_satellites * 20)
+        ]
+        assignments, _ = optimizer.preprocess_scheduling_data(passes, demands)
+        model, variables = optimizer.create_cp_sat_model(assignments, constraints=constraints)
+        profile = variables['build_profile']
+        assert set(profile) >= {'index', 'variables', 'demand_constraints', 'objective', 'total'}
+        per_assignment.append(profile['total'] / len(assignments))
+        print(f"{len(assignments):>12} {profile['total']:>10.3f} {per_assignment[-1] * 1e6:>14.1f}")
+
+    # Linear construction: cost per assignment should not grow with size
+    assert per_assignment[-1] < per_assignment[0] * 4, "Model build is not scaling linearly"
+    print("✅ Model build time grows linearly")
+
+def test_incremental_reoptimization():
+    """Test warm-started re-optimization with a frozen near-term window."""
+    print("\n=== Testing Incremental Re-optimization ===")
+
+    start = datetime(2030, 1, 1)
+    passes = [
+        _synthetic_pass(f"SAT-{s}", f"Station {k % 3}",
+                        start + timedelta(minutes=45 * k + 11 * s), minutes=10)
+        for s in range(3) for k in range(20)
+    ]
+    demands = [
+        {"id": i, "satellite": f"SAT-{i % 3}", "data_mb": 150 + 50 * (i % 5)}
+        for i in range(12)
+    ]
+
+    optimizer = AdvancedSchedulingOptimizer()
+    previous = optimizer.create_advanced_schedule(passes, demands)
+    assert len(previous.scheduled_contacts) == len(demands)
+
+    # A new demand arrives and the TLE update shifts every pass by 20 seconds
+    shifted = [
+        {**p,
+         "rise_time": (datetime.fromisoformat(p['rise_time'][:-1]) + timedelta(seconds=20)).isoformat() + 'Z',
+         "set_time": (datetime.fromisoformat(p['set_time'][:-1]) + timedelta(seconds=20)).isoformat() + 'Z'}
+        for p in passes
+    ]
+    new_demands = demands + [{"id": 99, "satellite": "SAT-1", "data_mb": 400}]
+    now = datetime.fromisoformat(previous.scheduled_contacts[3]['start_time'][:-1])
+
+    result = optimizer.reoptimize_schedule(shifted, new_demands, previous,
+                                           frozen_window_seconds=600, now=now)
+    freeze_until = (now + timedelta(seconds=600)).isoformat()
+
+    frozen = [c for c in previous.scheduled_contacts if c['start_time'] < freeze_until]
+    assert all(c in result.scheduled_contacts for c in frozen), "Frozen contacts must not change"
+    new_in_window = [c for c in result.scheduled_contacts
+                     if c['start_time'] < freeze_until and c not in frozen]
+    assert not new_in_window, "No new contacts may start inside the frozen window"
+    assert result.metadata['frozen_contacts'] == len(frozen)
+    assert result.metadata['hinted_contacts'] == len(previous.scheduled_contacts) - len(frozen)
+    assert result.metadata['changed_contacts'] == 0, "Unaffected contacts should not churn"
+    assert 99 in {c.get('demand_id') for c in result.scheduled_contacts}
+    assert result.schedule_efficiency == result.total_data_scheduled / sum(d['data_mb'] for d in new_demands)
+
+    # With every contact frozen nothing is modeled, but the frozen data still counts
+    all_frozen = optimizer.reoptimize_schedule(passes, demands, previous,
+                                               frozen_window_seconds=7 * 86400, now=start)
+    assert all_frozen.metadata['modeled_assignments'] == 0
+    assert all_frozen.total_data_scheduled == previous.total_data_scheduled
+    assert all_frozen.schedule_efficiency == previous.schedule_efficiency == 1.0
+
+    print(f"✅ {len(frozen)} frozen, {result.metadata['hinted_contacts']} hinted, "
+          f"{result.metadata['changed_contacts']} changed, new demand scheduled")
+
+def test_parallel_strategy_comparison():
+    """Test that strategies share preprocessing and solve within one budget."""
+    print("\n=== Testing Parallel Strategy Comparison ===")
+
+    start = datetime(2030, 1, 1)
+    passes = [
+        _synthetic_pass(f"SAT-{s}", f"Station {k % 2}",
+                        start + timedelta(minutes=30 * k + 7 * s), minutes=8)
+        for s in range(4) for k in range(12)
+    ]
+    demands = [
+        {"satellite": f"SAT-{i % 4}", "data_mb": 100 + 40 * (i % 7), "priority": 1 + i % 3}
+        for i in range(30)
+    ] + [{"satellite": "SAT-9", "data_mb": 100}]
+
+    optimizer = AdvancedSchedulingOptimizer()
+    wall_start = time.time()
+    parallel = optimizer.compare_scheduling_strategies(passes, demands, time_budget_seconds=20)
+    wall_time = time.time() - wall_start
+    sequential = optimizer.compare_scheduling_strategies(passes, demands, time_budget_seconds=20,
+                                                         parallel=False)
+
+    assert set(parallel) == {"maximize_data", "priority_weighted", "balanced_efficiency"}
+    assert wall_time < 20 + 5, "Comparison should respect the shared budget"
+    for name, result in parallel.items():
+        assert result.solution_quality == "OPTIMAL"
+        assert result.objective_value == sequential[name].objective_value, \
+            f"{name}: parallel and sequential solves disagree"
+        assert {"preprocess_seconds", "model_build_seconds", "solve_seconds"} <= set(result.metadata['timings'])
+        assert demands[-1] in result.unscheduled_demands, "Unmatched demand should be reported"
+        print(f"  {name}: {result.total_data_scheduled} MB, "
+              f"solve {result.metadata['timings']['solve_seconds']:.3f}s")
+
+    # Without a feasible pass every strategy reports the demands unscheduled
+    unmatched = [{"satellite": "SAT-9", "data_mb": 100}]
+    empty = optimizer.compare_scheduling_strategies(passes, unmatched,
+                                                    ground_stations=[{"name": "Station 0", "antennas": 2}])
+    assert set(empty) == set(parallel)
+    for result in empty.values():
+        assert result.optimization_status == "NO_FEASIBLE_ASSIGNMENTS"
+        assert result.unscheduled_demands == unmatched and not result.scheduled_contacts
+
+    print(f"✅ Three strategies compared in {wall_time:.2f}s")
+
+def test_decomposed_schedule():
+    """Test rolling-horizon decomposition, chain detection and edge stitching."""
+    print("\n=== Testing Time-Window Decomposition ===")
+
+    start = datetime(2030, 1, 1)
+    # SAT-0 is only visible on day one and SAT-1 only on day two, so the two
+    # windows share no demand; SAT-0's last contact runs past midnight into
+    # SAT-1's first pass at the same station, and each contact needs most of
+    # its pass, so the clash cannot be shifted away.
+    passes = [_synthetic_pass("SAT-0", "Station 0", start + timedelta(hours=h, minutes=m))
+              for h, m in [(0, 0), (12, 0), (23, 58)]]
+    passes += [_synthetic_pass("SAT-1", "Station 0", start + timedelta(hours=h))
+               for h in [24, 36]]
+    demands = [{"id": i, "satellite": "SAT-0", "data_mb": 4000} for i in range(3)]
+    demands += [{"id": 10 + i, "satellite": "SAT-1", "data_mb": 4000} for i in range(2)]
+
+    optimizer = AdvancedSchedulingOptimizer()
+    result = optimizer.create_decomposed_schedule(passes, demands, window_hours=24, overlap_hours=1)
+    sequential = optimizer.create_decomposed_schedule(passes, demands, window_hours=24, overlap_hours=1,
+                                                      parallel=False)
+
+    assert result.metadata['chains'] == 2, "Windows without shared demands should be independent"
+    assert [w['committed'] for w in result.metadata['windows']] == [3, 2]
+    assert result.metadata['boundary_conflicts'] == 1, "Clash at the window edge should be detected"
+    assert len(result.scheduled_contacts) == 4
+    assert [d['id'] for d in result.unscheduled_demands] in ([10], [11])
+    assert len(sequential.scheduled_contacts) == len(result.scheduled_contacts)
+
+    contacts = sorted(result.scheduled_contacts, key=lambda c: c['start_time'])
+    for earlier, later in zip(contacts, contacts[1:]):
+        assert earlier['end_time'] <= later['start_time'], "Stitched plan must not overlap"
+
+    unmatched = [{"satellite": "SAT-9", "data_mb": 100}]
+    empty = optimizer.create_decomposed_schedule(passes, unmatched)
+    assert empty.optimization_status == "NO_FEASIBLE_ASSIGNMENTS" and empty.unscheduled_demands == unmatched
+
+    # A week of passes for a small constellation, solved window by window
+    week_passes = [
+        _synthetic_pass(f"SAT-{s}", f"Station {k % 3}",
+                        start + timedelta(minutes=95 * k + 13 * s), minutes=8)
+        for s in range(6) for k in range(100)
+    ]
+    week_demands = [
+        {"id": i, "satellite": f"SAT-{i % 6}", "data_mb": 200 + 25 * (i % 9),
+         "deadline": (start + timedelta(days=1 + i % 7)).isoformat()}
+        for i in range(300)
+    ]
+    wall_start = time.time()
+    week = optimizer.create_decomposed_schedule(week_passes, week_demands)
+    wall_time = time.time() - wall_start
+    assert len(week.metadata['windows']) == 7
+    assert len(week.scheduled_contacts) + len(week.unscheduled_demands) == len(week_demands)
+    assert len({c['demand_id'] for c in week.scheduled_contacts}) == len(week.scheduled_contacts)
+    for contact in week.scheduled_contacts:
+        demand = week_demands[contact['demand_id']]
+        assert contact['start_time'][:-1] <= demand['deadline'], "Deadlines must hold across windows"
+
+    print(f"✅ Edge clash resolved; week plan with {len(week.scheduled_contacts)} contacts "
+          f"in {wall_time:.2f}s")
+
+def test_flexible_contact_starts():
+    """Test that several demands can share one long pass back to back."""
+    print("\n=== Testing Flexible Contact Starts ===")
+
+    start = datetime(2030, 1, 1)
+    passes = [_synthetic_pass("SAT-A", "Station 0", start, minutes=15)]
+    demands = [{"id": i, "satellite": "SAT-A", "data_mb": 1500} for i in range(3)]
+    demands.append({"id": "urgent", "satellite": "SAT-A", "data_mb": 500,
+                    "deadline": (start + timedelta(minutes=2)).isoformat()})
+
+    optimizer = AdvancedSchedulingOptimizer()
+    result = optimizer.create_advanced_schedule(passes, demands)
+    contacts = sorted(result.scheduled_contacts, key=lambda c: c['start_time'])
+    assert len(contacts) == 4, "All four contacts should share the pass"
+    assert contacts[0]['start_time'] == passes[0]['rise_time']
+    for earlier, later in zip(contacts, contacts[1:]):
+        assert earlier['end_time'] <= later['start_time'], "Contacts in one pass must not overlap"
+    assert contacts[-1]['end_time'] <= passes[0]['set_time'], "Contacts must end before set"
+    for contact in contacts:
+        if contact.get('demand_id') == "urgent":
+            assert contact['start_time'][:-1] <= demands[-1]['deadline'], "Deadline caps the start"
+    print(f"✅ {len(contacts)} contacts share one pass: "
+          f"{[c['start_time'][11:19] for c in contacts]}")
+
+def test_split_demand_scheduling():
+    """Test splitting large demands across several passes with MB allocations."""
+    print("\n=== Testing Split-Demand Scheduling ===")
+
+    start = datetime(2030, 1, 1)
+    # Four-minute passes carry about 1700 MB; SAT-B's pass overlaps SAT-A's second one
+    passes = [_synthetic_pass("SAT-A", "Station 0", start + timedelta(hours=h), minutes=4)
+              for h in [0, 2, 4]]
+    passes.append(_synthetic_pass("SAT-B", "Station 0", start + timedelta(hours=2, minutes=1), minutes=4))
+    demands = [
+        {"id": "dump", "satellite": "SAT-A", "data_mb": 3000},
+        {"id": "small", "satellite": "SAT-A", "data_mb": 300},
+        {"id": "other", "satellite": "SAT-B", "data_mb": 500},
+    ]
+
+    optimizer = AdvancedSchedulingOptimizer()
+    whole = optimizer.create_advanced_schedule(passes, demands)
+    split = optimizer.create_split_schedule(passes, demands, min_chunk_mb=100)
+    print(f"  Whole passes: {whole.total_data_scheduled} MB, split: {split.total_data_scheduled} MB")
+    assert "dump" in [d['id'] for d in whole.unscheduled_demands], "3000 MB fits no single pass"
+    assert split.total_data_scheduled == 3800 and not split.unscheduled_demands
+    assert split.metadata['split_demands'] >= 1 and not split.metadata['partial_demands']
+
+    delivered = {}
+    for contact in split.scheduled_contacts:
+        delivered[contact['demand_id']] = delivered.get(contact['demand_id'], 0) + contact['demand_mb']
+        assert contact['demand_mb'] >= 100, "Chunks must respect the minimum size"
+    assert delivered == {"dump": 3000, "small": 300, "other": 500}
+
+    # Each chunk holds the station only as long as its overhead and transfer take
+    link = optimizer.latency_estimator.estimate_demand_requirements(0.0)
+    rate_centi = int(link['effective_rate_mbps'] * 100)
+    for contact in split.scheduled_contacts:
+        needed = math.ceil(link['overhead_time']) + math.ceil(800 * contact['demand_mb'] / rate_centi)
+        assert contact['duration_seconds'] == needed, \
+            f"{contact['demand_mb']} MB chunk takes {contact['duration_seconds']}s, needs {needed}s"
+
+    contacts = sorted(split.scheduled_contacts, key=lambda c: c['start_time'])
+    for earlier, later in zip(contacts, contacts[1:]):
+        assert earlier['end_time'] <= later['start_time'], "Chunks must not overlap at the station"
+
+    # A demand larger than all passes together is only delivered in part when allowed
+    huge = [{"id": "huge", "satellite": "SAT-A", "data_mb": 10000}]
+    assert optimizer.create_split_schedule(passes, huge).total_data_scheduled == 0
+    partial = optimizer.create_split_schedule(passes, huge, allow_partial=True)
+    assert partial.metadata['partial_demands'][0]['scheduled_mb'] == partial.total_data_scheduled > 3000
+
+    print(f"✅ Split mode recovered {split.total_data_scheduled - whole.total_data_scheduled} MB "
+          f"in {len(split.scheduled_contacts)} chunks")
+
+    # Chunks sharing a pass run earliest deadline first and end by their deadline
+    shared = [_synthetic_pass("SAT-A", "Station 0", start, minutes=10)]
+    deadlined = [
+        {"id": "late", "satellite": "SAT-A", "data_mb": 1000,
+         "deadline": (start + timedelta(hours=1)).isoformat() + "Z"},
+        {"id": "early", "satellite": "SAT-A", "data_mb": 1000,
+         "deadline": (start + timedelta(minutes=3)).isoformat() + "Z"},
+    ]
+    result = optimizer.create_split_schedule(shared, deadlined)
+    assert result.total_data_scheduled == 2000, "Both demands fit the shared pass"
+    parse = lambda text: datetime.fromisoformat(text.replace('Z', '+00:00'))
+    deadlines = {d['id']: parse(d['deadline']) for d in deadlined}
+    for contact in result.scheduled_contacts:
+        assert parse(contact['end_time']) <= deadlines[contact['demand_id']], \
+            f"{contact['demand_id']} ends after its deadline"
+
+def test_incumbent_streaming():
+    """Test incumbent callbacks: contact deltas rebuild the schedule; early stops end the search."""
+    print("\n=== Testing Incumbent Streaming ===")
+
+    start = datetime(2030, 1, 1)
+    passes = [
+        _synthetic_pass(f"SAT-{s}", f"Station {k % 2}",
+                        start + timedelta(minutes=95 * k + 13 * s), minutes=8)
+        for s in range(6) for k in range(45)
+    ]
+    demands = [
+        {"id": i, "satellite": f"SAT-{i % 6}", "data_mb": 200 + 37 * (i % 11), "priority": 1 + i % 4,
+         "deadline": (start + timedelta(hours=6 + i % 60)).isoformat()}
+        for i in range(240)
+    ]
+
+    optimizer = AdvancedSchedulingOptimizer()
+    updates = []
+    result = optimizer.create_advanced_schedule(passes, demands, solver_timeout=20,
+                                                on_solution=updates.append,
+                                                no_improvement_seconds=1.0)
+    print(f"  {len(updates)} incumbents, first after {result.metadata['first_solution_seconds']:.2f}s; "
+          f"stopped after {result.solve_time_seconds:.2f}s ({result.metadata['stop_reason']}, "
+          f"{result.optimization_status})")
+
+    assert updates and result.metadata['incumbents'] == len(updates)
+    assert [u.sequence for u in updates] == list(range(1, len(updates) + 1))
+    for earlier, later in zip(updates, updates[1:]):
+        assert later.objective_value >= earlier.objective_value, "Incumbents must improve"
+        assert later.elapsed_seconds >= earlier.elapsed_seconds
+    assert all(u.gap >= 0 for u in updates)
+
+    # Replaying the deltas gives the final schedule
+    current = {}
+    for update in updates:
+        for contact_id in update.contacts_removed:
+            del current[contact_id]
+        for contact in update.contacts_added:
+            current[contact['contact_id']] = contact
+        assert len(current) == update.contact_count
+    replayed = sorted((c['demand_id'], c['start_time']) for c in current.values())
+    final = sorted((c['demand_id'], c['start_time']) for c in result.scheduled_contacts)
+    assert replayed == final
+    assert updates[-1].objective_value == result.objective_value
+    if result.optimization_status != "OPTIMAL":
+        assert result.metadata['stop_reason'] == "no_improvement"
+        assert result.solve_time_seconds < 20
+
+    # A loose target gap ends the search at the first good-enough incumbent
+    loose = optimizer.create_advanced_schedule(passes, demands, solver_timeout=20, target_gap=0.5)
+    assert loose.solution_quality in ("OPTIMAL", "FEASIBLE") and loose.scheduled_contacts
+    assert loose.solve_time_seconds < 20
+
+    print(f"✅ Deltas rebuild the {len(final)}-contact schedule; "
+          f"gap-0.5 stop after {loose.solve_time_seconds:.2f}s")
+
+def test_solver_profiles():
+    """Test named solver profiles and the tuning harness over a saved corpus."""
+    print("\n=== Testing Solver Profiles ===")
+
+    from ortools.sat.python import cp_model
+    from app.scheduling.optimizer import SOLVER_PROFILES, available_cores, get_solver_profile
+    from app.scheduling.synthetic import synthetic_instance
+    from app.scheduling.tuning import load_corpus, save_instance, summarize, tune
+    import tempfile
+
+    cores = available_cores()
+    for name, profile in SOLVER_PROFILES.items():
+        parameters = cp_model.CpSolver().parameters
+        profile.apply(parameters)
+        assert parameters.num_search_workers == profile.workers() >= profile.min_workers
+        assert profile.max_workers is None or profile.workers() <= max(profile.max_workers, profile.min_workers)
+        print(f"  {name}: {profile.workers()} workers on {cores} cores, "
+              f"linearization {parameters.linearization_level}, symmetry {parameters.symmetry_level}")
+    assert SOLVER_PROFILES["thorough"].workers() >= min(cores, 8)
+
+    seeded = get_solver_profile("fast", random_seed=7)
+    parameters = cp_model.CpSolver().parameters
+    seeded.apply(parameters, num_workers=2)
+    assert parameters.random_seed == 7 and parameters.num_search_workers == 2
+    assert SOLVER_PROFILES["fast"].random_seed is None, "Seeding must not touch the shared profile"
+    try:
+        get_solver_profile("reckless")
+        assert False, "Unknown profiles should be rejected"
+    except ValueError:
+        pass
+
+    optimizer = AdvancedSchedulingOptimizer("thorough", random_seed=3)
+    assert optimizer.solver_profile.name == "thorough" and optimizer.solver_profile.random_seed == 3
+
+    with tempfile.TemporaryDirectory() as corpus_dir:
+        for seed in range(2):
+            instance = synthetic_instance(satellites=3, days=1, demands=40, seed=seed)
+            save_instance(f"{corpus_dir}/instance_{seed}.json", instance["passes"], instance["demands"],
+                          instance["ground_stations"])
+        corpus = load_corpus(corpus_dir)
+        assert list(corpus) == ["instance_0", "instance_1"]
+        rows = tune(corpus, ["fast", "balanced"], time_limit=1, seeds=(None, 11))
+
+    assert len(rows) == 8
+    for row in rows:
+        assert row["first_feasible_seconds"] is not None and row["first_feasible_seconds"] <= row["solve_seconds"]
+        assert (row["optimal_seconds"] is not None) == (row["status"] == "OPTIMAL")
+        assert row["best_bound"] >= row["objective"] and row["gap"] >= 0, "Bound comes from the final solver state"
+    summary = summarize(rows)
+    assert set(summary) == {"fast", "balanced"}
+    assert all(stats["runs"] == 4 and stats["feasible"] == 4 for stats in summary.values())
+    print(f"✅ Profiles apply; tuning summary: "
+          f"{ {name: (stats['optimal'], stats['median_first_feasible_seconds']) for name, stats in summary.items()} }")
+
+def test_time_grid():
+    """Test that start variables are horizon-relative ticks and coarser grids stay feasible."""
+    print("\n=== Testing Time Grid ===")
+
+    from app.scheduling.synthetic import synthetic_instance
+    from app.scheduling.optimizer import TimeGrid
+
+    grid = TimeGrid(origin=1000, resolution=30)
+    assert grid.ceil(1001) == 1 and grid.floor(1059) == 1 and grid.nearest(1044) == 1
+    assert grid.length(31) == 2 and grid.to_posix(2) == 1060
+
+    instance = synthetic_instance(satellites=3, days=1, demands=40, seed=0)
+    optimizer = AdvancedSchedulingOptimizer()
+    assignments, _ = optimizer.preprocess_scheduling_data(instance["passes"], instance["demands"])
+    model, variables = optimizer.create_cp_sat_model(assignments)
+    horizon = max(a['set_ts'] for a in assignments) - min(a['rise_ts'] for a in assignments)
+    bounds = [start.proto.domain for start in variables['starts']]
+    assert min(b[0] for b in bounds) == 0, "Ticks count from the earliest rise"
+    assert max(b[-1] for b in bounds) <= horizon, "Start domains span the horizon, not POSIX time"
+
+    fine = optimizer.create_advanced_schedule(instance["passes"], instance["demands"], solver_timeout=20)
+    optimizer.time_resolution_seconds = 30
+    coarse = optimizer.create_advanced_schedule(instance["passes"], instance["demands"], solver_timeout=20)
+    assert coarse.scheduled_contacts and coarse.objective_value <= fine.objective_value
+    origin = datetime.fromisoformat(min(p['rise_time'] for p in instance["passes"]).rstrip('Z'))
+    by_station = {}
+    for contact in coarse.scheduled_contacts:
+        start = datetime.fromisoformat(contact['start_time'].rstrip('Z'))
+        assert (start - origin).total_seconds() % 30 == 0, "Starts must lie on the grid"
+        by_station.setdefault(contact['ground_station'], []).append(contact)
+    for contacts in by_station.values():
+        contacts.sort(key=lambda c: c['start_time'])
+        for earlier, later in zip(contacts, contacts[1:]):
+            assert earlier['end_time'] <= later['start_time'], "Grid contacts must not overlap"
+    print(f"✅ Horizon {horizon:.0f}s; objective {fine.objective_value} at 1s, "
+          f"{coarse.objective_value} at 30s")
+
+def test_candidate_pruning():
+    """Test that late and dominated assignments are pruned without changing the optimum."""
+    print("\n=== Testing Candidate Pruning ===")
+
+    start = datetime(2030, 1, 1, 12, 0, 0)
+    passes = [
+        _synthetic_pass("SAT-A", "Station 0", start),
+        _synthetic_pass("SAT-A", "Station 0", start),  # duplicate
+        _synthetic_pass("SAT-A", "Station 0", start + timedelta(minutes=1), minutes=5),  # inside the first
+        _synthetic_pass("SAT-A", "Station 1", start),  # same time, other station
+        _synthetic_pass("SAT-A", "Station 0", start + timedelta(days=1)),  # after the deadline
+    ]
+    demands = [{"id": "urgent", "satellite": "SAT-A", "data_mb": 500,
+                "deadline": (start + timedelta(hours=2)).isoformat()}]
+    demands += [{"id": i, "satellite": "SAT-A", "data_mb": 200} for i in range(4)]
+
+    optimizer = AdvancedSchedulingOptimizer()
+    assignments, _ = optimizer.preprocess_scheduling_data(passes, demands)
+    kept, report = optimizer.prune_assignments(assignments)
+    assert report == {"candidates": 25, "late": 1, "dominated": 10, "removed": 11}, report
+    assert {a['pass_idx'] for a in kept} == {0, 3, 4}
+    assert {a['pass_idx'] for a in kept if a['demand_idx'] == 0} == {0, 3}
+
+    pruned = optimizer.create_advanced_schedule(passes, demands, solver_timeout=10)
+    assert pruned.metadata['pruning'] == report
+    optimizer.prune_dominated = False
+    full = optimizer.create_advanced_schedule(passes, demands, solver_timeout=10)
+    assert pruned.objective_value == full.objective_value
+
+    # The four identical demands form one symmetric group
+    optimizer.prune_dominated = optimizer.symmetry_breaking = True
+    ordered = optimizer.create_advanced_schedule(passes, demands, solver_timeout=10)
+    assert ordered.metadata['symmetry']['groups'] == 1
+    assert ordered.metadata['symmetry']['demands'] == 4
+    assert ordered.objective_value == full.objective_value
+    print(f"✅ Removed {report['removed']} of {report['candidates']} assignments; "
+          f"objective {full.objective_value} either way")
+
+def test_hybrid_pipeline():
+    """Test the greedy start, neighborhood search and budget handling of the hybrid pipeline."""
+    print("\n=== Testing Hybrid Pipeline ===")
+
+    from app.scheduling.synthetic import synthetic_instance
+
+    instance = synthetic_instance(satellites=3, days=1, demands=60, seed=2)
+    passes, demands = instance["passes"], instance["demands"]
+    updates = []
+    optimizer = AdvancedSchedulingOptimizer(random_seed=1)
+    result = optimizer.create_hybrid_schedule(passes, demands, time_budget_seconds=20,
+                                              on_solution=updates.append)
+    pipeline = result.metadata["pipeline"]
+    assert updates[0].objective_value == pipeline["greedy_objective"]
+    assert updates[0].elapsed_seconds < 1, "The greedy plan must come first and fast"
+    objectives = [u.objective_value for u in updates]
+    assert objectives == sorted(objectives) and objectives[-1] == result.objective_value
+    assert result.metadata["incumbents"] == len(updates)
+    assert result.objective_value > pipeline["greedy_objective"], "The search should improve on greedy"
+
+    # The streamed deltas rebuild the final plan
+    current = {}
+    for update in updates:
+        for contact_id in update.contacts_removed:
+            del current[contact_id]
+        current.update({c['contact_id']: c for c in update.contacts_added})
+    assert len(current) == len(result.scheduled_contacts)
+
+    exact = AdvancedSchedulingOptimizer().create_advanced_schedule(passes, demands, solver_timeout=20)
+    assert result.optimization_status == "OPTIMAL", "Small instances end in a proven full solve"
+    assert result.objective_value == exact.objective_value
+    served = [c['demand_id'] for c in result.scheduled_contacts]
+    assert len(served) == len(set(served))
+
+    # Without time for the search the greedy plan is returned as it is
+    greedy = optimizer.create_hybrid_schedule(passes, demands, time_budget_seconds=0)
+    assert greedy.optimization_status == "FEASIBLE" and greedy.scheduled_contacts
+    assert greedy.objective_value == greedy.metadata["pipeline"]["greedy_objective"]
+    assert greedy.metadata["pipeline"]["iterations"] == 0
+
+    # A greedy plan at the bound ends the search at once
+    start = datetime(2030, 1, 1, 12, 0, 0)
+    single = [_synthetic_pass("SAT-A", "Station 0", start)]
+    t0 = time.perf_counter()
+    trivial = optimizer.create_hybrid_schedule(single, [{"id": 0, "satellite": "SAT-A", "data_mb": 500}],
+                                               time_budget_seconds=30)
+    assert time.perf_counter() - t0 < 5 and trivial.optimization_status == "OPTIMAL"
+    assert trivial.metadata["pipeline"]["iterations"] == 0
+
+    # Without pruning, late assignments still stay out of the greedy plan
+    late_demand = {"id": "late", "satellite": "SAT-A", "data_mb": 500,
+                   "deadline": (start - timedelta(hours=1)).isoformat()}
+    unpruned = AdvancedSchedulingOptimizer()
+    unpruned.prune_dominated = False
+    result_unpruned = unpruned.create_hybrid_schedule(single, [late_demand], time_budget_seconds=1)
+    assert not result_unpruned.scheduled_contacts and result_unpruned.unscheduled_demands == [late_demand]
+    assert result_unpruned.optimization_status == "NO_FEASIBLE_ASSIGNMENTS"
+
+    # Per-satellite limits hold in the greedy plan and in every neighborhood
+    limit = SchedulingConstraint("maximum_contacts_per_satellite", {"max_contacts": 2}, 1.0)
+    limited = optimizer.create_hybrid_schedule(passes, demands, constraints=[limit], time_budget_seconds=5)
+    per_satellite = {}
+    for contact in limited.scheduled_contacts:
+        per_satellite[contact['satellite']] = per_satellite.get(contact['satellite'], 0) + 1
+    assert max(per_satellite.values()) <= 2
+    assert set(limited.metadata["pipeline"]["neighborhoods"]) == {"satellites"}
+    print(f"✅ Greedy {pipeline['greedy_objective']} -> {result.objective_value} in "
+          f"{pipeline['iterations']} neighborhoods ({result.optimization_status})")
+
 def main():
     """Run all optimization tests."""
     print("=" * 70)
@@ -337,6 +955,19 @@ def main():
         test_strategy_comparison()
         test_backward_compatibility()
         test_performance()
+        test_multi_station_resources()
+        test_indexed_preprocessing()
+        test_model_build_scaling()
+        test_incremental_reoptimization()
+        test_parallel_strategy_comparison()
+        test_decomposed_schedule()
+        test_flexible_contact_starts()
+        test_split_demand_scheduling()
+        test_incumbent_streaming()
+        test_solver_profiles()
+        test_time_grid()
+        test_candidate_pruning()
+        test_hybrid_pipeline()
         
         print("\n" + "=" * 70)
         print("ALL OPTIMIZATION TESTS COMPLETED SUCCESSFULLY")
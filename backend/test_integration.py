@@ -286,6 +286,109 @@ def test_constraint_enforcement():
     print("✅ Constraint enforcement working")
     print("🎉 Constraint enforcement test PASSED!")
 
+def _pass(satellite, station, start, minutes):
+    return {
+        "satellite": satellite,
+        "ground_station": station,
+        "rise_time": start.isoformat() + 'Z',
+        "set_time": (start + timedelta(minutes=minutes)).isoformat() + 'Z',
+    }
+
+def _utc(timestamp):
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+def test_greedy_baseline():
+    """Test the heap-ordered, gap-filling greedy scheduler."""
+    print("\n=== Integration Test: Greedy Baseline ===")
+    
+    start = datetime(2030, 1, 1)
+    
+    # Several contacts fit back to back inside one long pass
+    passes = [_pass("SAT-A", "Station 0", start, 30)]
+    demands = [{"id": i, "satellite": "SAT-A", "data_mb": 500} for i in range(3)]
+    scheduled, unscheduled = create_baseline_schedule(passes, demands)
+    assert len(scheduled) == 3 and not unscheduled, "All demands should share the long pass"
+    assert _utc(scheduled[0]['start_time']) == _utc(passes[0]['rise_time'])
+    for earlier, later in zip(scheduled, scheduled[1:]):
+        assert _utc(earlier['end_time']) <= _utc(later['start_time']), "Contacts inside a pass must not overlap"
+    print("✅ Contacts placed in gaps inside a pass")
+    
+    # The heap order decides who gets a pass with room for one demand
+    passes = [_pass("SAT-A", "Station 0", start, 5)]
+    demands = [
+        {"id": "small-urgent", "satellite": "SAT-A", "data_mb": 1000, "priority": 3.0},
+        {"id": "large", "satellite": "SAT-A", "data_mb": 1500, "priority": 1.0},
+    ]
+    by_priority, _ = create_baseline_schedule(passes, demands, order="priority")
+    by_size, _ = create_baseline_schedule(passes, demands, order="size")
+    assert [c['demand_id'] for c in by_priority] == ["small-urgent"]
+    assert [c['demand_id'] for c in by_size] == ["large"]
+    # Deadlines are ordered by instant, whatever their offset or type
+    demands = [
+        {"id": "eleven-utc", "satellite": "SAT-A", "data_mb": 1500, "deadline": "2030-01-01T11:00:00Z"},
+        {"id": "ten-utc", "satellite": "SAT-A", "data_mb": 1500, "deadline": "2030-01-01T12:00:00+02:00"},
+        {"id": "noon", "satellite": "SAT-A", "data_mb": 1500, "deadline": start + timedelta(hours=12)},
+        {"id": "open", "satellite": "SAT-A", "data_mb": 1500},
+    ]
+    by_deadline, _ = create_baseline_schedule(passes, demands, order="deadline")
+    assert [c['demand_id'] for c in by_deadline] == ["ten-utc"]
+    print("✅ Demand heap honours priority and size order")
+    
+    # Deadlines, satellite matching and multi-antenna stations
+    passes = [_pass("SAT-A", "Station 0", start + timedelta(hours=2), 10),
+              _pass("SAT-B", "Station 0", start + timedelta(hours=2), 10)]
+    demands = [
+        {"id": "late", "satellite": "SAT-A", "data_mb": 300,
+         "deadline": (start + timedelta(hours=1)).isoformat()},
+        {"id": "a", "satellite": "SAT-A", "data_mb": 2000},
+        {"id": "b", "satellite": "SAT-B", "data_mb": 2000},
+        {"id": "unknown", "satellite": "SAT-Z", "data_mb": 100},
+    ]
+    single, _ = create_baseline_schedule(passes, demands)
+    dual, unscheduled = create_baseline_schedule(
+        passes, demands, ground_stations=[{"name": "Station 0", "antennas": 2}])
+    assert {d['id'] for d in unscheduled} == {"late", "unknown"}
+    assert len(single) == 2 and _utc(single[1]['start_time']) > _utc(single[0]['start_time']), \
+        "One antenna should serialize the two satellites"
+    assert len(dual) == 2 and _utc(dual[0]['start_time']) == _utc(dual[1]['start_time']), \
+        "Two antennas should serve both satellites at rise"
+    assert {c['antenna'] for c in dual} == {0, 1}
+    print("✅ Deadlines, satellite matching and antennas enforced")
+    
+    assert create_baseline_schedule([], demands) == ([], demands)
+    assert create_baseline_schedule(passes, []) == ([], [])
+    try:
+        create_baseline_schedule(passes, demands, order="random")
+        assert False, "Unknown order should be rejected"
+    except ValueError:
+        pass
+    
+    # Fallback-scale run: 100k passes
+    passes = [
+        _pass(f"SAT-{s}", f"Station {(s + k) % 20}",
+              start + timedelta(minutes=(k * 97 + s * 31) % (14 * 24 * 60)), 8)
+        for s in range(100) for k in range(1000)
+    ]
+    demands = [{"id": i, "satellite": f"SAT-{i % 100}", "data_mb": 200 + (i * 37) % 1500,
+                "priority": 1 + i % 5} for i in range(5000)]
+    start_time = time.time()
+    scheduled, unscheduled = create_baseline_schedule(passes, demands)
+    elapsed = time.time() - start_time
+    assert len(scheduled) + len(unscheduled) == len(demands)
+    
+    timelines = {}
+    for contact in scheduled:
+        for key in (contact['ground_station'], contact['satellite']):
+            timelines.setdefault(key, []).append((contact['start_time'], contact['end_time']))
+    for busy in timelines.values():
+        busy.sort()
+        for earlier, later in zip(busy, busy[1:]):
+            assert earlier[1] <= later[0], "Greedy schedule must be conflict-free"
+    
+    print(f"✅ {len(passes)} passes, {len(scheduled)} contacts in {elapsed:.3f}s")
+    print("🎉 Greedy baseline test PASSED!")
+    return True
+
 def main():
     """Run all integration tests."""
     print("=" * 80)
@@ -302,6 +405,7 @@ def main():
         test_results.append(("Error Handling", test_error_handling()))
         test_results.append(("Optimization Objectives", test_optimization_objectives()))
         test_results.append(("Constraint Enforcement", test_constraint_enforcement()))
+        test_results.append(("Greedy Baseline", test_greedy_baseline()))
         
         # Summary
         print("\n" + "=" * 80)
@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Test suite for the batch pass prediction engine.
+Checks the vectorized engine against Skyfield's per-pair event search.
+"""
+
+from app.core import ephemeris
+from app.core.ground_station import load_ground_stations
+from app.core.satellite import (
+    find_satellite_passes, find_passes_batch, find_passes_parallel, load_satellites, prediction_window
+)
+from skyfield.api import wgs84
+from app.core.pass_cache import PassCache
+from app.core.pass_table import PassTable
+from app.core.tle_catalog import TLECatalog, get_catalog, parse_tle_text
+from sgp4.exporter import export_tle
+import numpy as np
+import os
+from app.scheduling.baseline import create_baseline_schedule
+from app.scheduling.optimizer import AdvancedSchedulingOptimizer
+from app.scheduling.synthetic import (
+    EPOCH, scale_instance, synthetic_constellation, synthetic_ground_stations
+)
+import pickle
+from datetime import datetime, timedelta, timezone
+import tempfile
+import time
+
+def _parse(iso_time):
+    return datetime.fromisoformat(iso_time.replace('Z', '+00:00'))
+
+def test_batch_matches_single_pair():
+    """Test that the batch engine reproduces the legacy single-pair passes."""
+    print("=== Testing Batch Engine Against Legacy Passes ===")
+
+    stations = load_ground_stations()
+    satellites = load_satellites('iss.txt')
+    assert satellites, "No satellites loaded"
+
+    legacy = find_satellite_passes('iss.txt', stations[0], days=1)
+    batch = find_passes_batch(satellites, stations[:1], days=1)
+
+    print(f"  Legacy passes: {len(legacy)}, batch passes: {len(batch)}")
+    for legacy_pass in legacy:
+        rise = _parse(legacy_pass['rise_time'])
+        matches = [p for p in batch if abs((_parse(p['rise_time']) - rise).total_seconds()) < 5]
+        assert matches, f"No batch pass matches legacy rise at {legacy_pass['rise_time']}"
+        set_delta = abs((_parse(matches[0]['set_time']) - _parse(legacy_pass['set_time'])).total_seconds())
+        assert set_delta < 5, f"Set time differs by {set_delta:.1f}s"
+
+    print("✅ Batch engine matches legacy pass times")
+
+def test_batch_many_satellites_and_stations():
+    """Test that every satellite/station pair is evaluated and tagged."""
+    print("\n=== Testing Batch Engine Broadcasting ===")
+
+    stations = load_ground_stations()
+    satellites = load_satellites('iss.txt')
+    station_network = [dict(stations[0], name=f"{stations[0]['name']} #{i}") for i in range(3)]
+
+    start = time.time()
+    passes = find_passes_batch(satellites * 4, station_network, days=1)
+    elapsed = time.time() - start
+
+    single = find_passes_batch(satellites, stations[:1], days=1)
+    assert len(passes) == len(single) * 4 * 3, "Each satellite/station pair should yield the same passes"
+    assert {p['ground_station'] for p in passes} == {s['name'] for s in station_network}
+    assert all(p['norad_id'] == satellites[0].model.satnum for p in passes)
+
+    rise_times = [p['rise_time'] for p in passes]
+    assert rise_times == sorted(rise_times), "Passes should be sorted by rise time"
+
+    print(f"✅ {len(passes)} passes for 4 satellites x 3 stations in {elapsed:.3f}s")
+
+def test_pass_cache_incremental():
+    """Test that the pass cache extends its horizon without losing passes."""
+    print("\n=== Testing Persistent Pass Cache ===")
+
+    stations = load_ground_stations()
+    satellites = load_satellites('iss.txt')
+    start = datetime.now(timezone.utc).replace(microsecond=0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = PassCache(f"{tmp}/passes.sqlite3")
+        cold = cache.get_passes(satellites, stations, start, start + timedelta(days=1))
+        assert cache.stats["misses"] == len(stations), "First request should propagate"
+
+        # Slide the horizon forward by an hour: only the tail is recomputed
+        later = start + timedelta(hours=1)
+        warm = cache.get_passes(satellites, stations, later, later + timedelta(days=1))
+        assert cache.stats["extensions"] == len(stations), "Second request should extend"
+        assert cache.stats["misses"] == len(stations), "Second request should not start over"
+
+        fresh = PassCache(":memory:").get_passes(satellites, stations, later, later + timedelta(days=1))
+        assert [p['rise_time'][:16] for p in warm] == [p['rise_time'][:16] for p in fresh], \
+            "Extended cache should match a fresh computation"
+
+        # Re-opening the file serves the same window without propagating
+        reopened = PassCache(f"{tmp}/passes.sqlite3")
+        again = reopened.get_passes(satellites, stations, later, later + timedelta(days=1))
+        assert again == warm
+        assert reopened.stats["misses"] == 0 and reopened.stats["extensions"] == 0
+        cache.close()
+        reopened.close()
+
+    # The cached single-pair path agrees with the uncached event search to a second
+    window = dict(start=datetime(2030, 1, 1, tzinfo=timezone.utc), days=2)
+    uncached = find_satellite_passes('iss.txt', stations[0], **window)
+    cached = find_satellite_passes('iss.txt', stations[0], cache=PassCache(":memory:"), **window)
+    assert len(cached) == len(uncached), "Cached and uncached paths should find the same passes"
+    for exact, served in zip(uncached, cached):
+        for field in ('rise_time', 'culmination_time', 'set_time'):
+            delta = abs((_parse(served[field]) - _parse(exact[field])).total_seconds())
+            assert delta <= 2, f"Cached {field} differs by {delta:.0f}s"
+        assert set(exact) <= set(served), "Cached passes keep every legacy field"
+
+    print(f"✅ Cache served {len(cold)} then {len(warm)} passes incrementally")
+
+def test_lazy_ephemeris():
+    """Test that pass prediction never opens the planetary ephemeris."""
+    print("\n=== Testing Lazy Ephemeris Loading ===")
+
+    stations = load_ground_stations()
+    find_satellite_passes('iss.txt', stations[0], days=1)
+    find_passes_batch(load_satellites('iss.txt'), stations, days=1)
+
+    assert not ephemeris.is_ephemeris_loaded(), "Pass prediction should not load the ephemeris"
+    assert ephemeris.get_timescale() is ephemeris.get_timescale(), "Timescale should be shared"
+    print("✅ Ephemeris left unloaded, timescale shared")
+
+def test_pass_profiles():
+    """Test that sampled elevation/range profiles match Skyfield's topocentric positions."""
+    print("\n=== Testing Pass Elevation Profiles ===")
+
+    stations = load_ground_stations()
+    satellites = load_satellites('iss.txt')
+    passes = find_satellite_passes('iss.txt', stations[0], days=1, profile=True)
+    assert passes and all('profile' in p for p in passes)
+
+    location = wgs84.latlon(stations[0]['latitude'], stations[0]['longitude'],
+                            elevation_m=stations[0]['elevation_m'])
+    ts = ephemeris.get_timescale()
+    for pass_info in passes:
+        profile = pass_info['profile']
+        assert all(values.dtype.name == 'float32' for values in profile.values())
+        assert abs(profile['elevation_deg'][0] - 10.0) < 0.5 and abs(profile['elevation_deg'][-1] - 10.0) < 0.5
+
+        middle = len(profile['offsets_s']) // 2
+        when = _parse(pass_info['rise_time']) + timedelta(seconds=float(profile['offsets_s'][middle]))
+        altitude, _, distance = (satellites[0] - location).at(ts.from_datetime(when)).altaz()
+        assert abs(altitude.degrees - profile['elevation_deg'][middle]) < 0.1
+        assert abs(distance.km - profile['range_km'][middle]) < 5
+
+    # The batch engine attaches the same profiles without changing its passes
+    plain = find_passes_batch(satellites, stations, days=1)
+    profiled = find_passes_batch(satellites, stations, days=1, profile=True)
+    assert [p['rise_time'][:16] for p in plain] == [p['rise_time'][:16] for p in profiled]
+    assert all('profile' in p for p in profiled)
+
+    # Profiled contacts may only start late while the link still delivers:
+    # not at all on a pass that fades from rise, anywhere on one that climbs
+    offsets = np.arange(0, 601, 10, dtype=np.float32)
+    optimizer = AdvancedSchedulingOptimizer()
+    for elevation, shiftable in ((np.linspace(80, 10, len(offsets)), False),
+                                 (np.linspace(10, 80, len(offsets)), True)):
+        synthetic = {"satellite": "SAT", "rise_time": "2030-01-01T00:00:00Z", "set_time": "2030-01-01T00:10:00Z",
+                     "profile": {"offsets_s": offsets, "elevation_deg": elevation.astype(np.float32),
+                                 "range_km": np.full(len(offsets), 800, dtype=np.float32)}}
+        assignments, _ = optimizer.preprocess_scheduling_data([synthetic], [{"satellite": "SAT", "data_mb": 1500}])
+        earliest, latest = optimizer._start_windows(assignments)
+        free = 600 - assignments[0]['duration_seconds']
+        assert latest[0] - earliest[0] == (free if shiftable else 0), \
+            f"Start window {latest[0] - earliest[0]}s on a {'climbing' if shiftable else 'fading'} pass"
+
+    print(f"✅ {len(passes)} profiles match Skyfield elevation and range")
+
+def test_pass_table():
+    """Test that the columnar pass table round-trips legacy passes and schedules like them."""
+    print("\n=== Testing Columnar Pass Table ===")
+
+    instance = scale_instance("s", seed=3)
+    passes, demands = instance['passes'], instance['demands']
+    table = PassTable.from_dicts(passes)
+    assert len(table) == len(passes)
+    assert table.to_dicts() == passes, "Legacy passes must round-trip exactly"
+    assert table[5] == passes[5] and table.take([1, 2]).to_dicts() == passes[1:3]
+    assert table.nbytes < len(pickle.dumps(passes)) / 2
+    print(f"  {len(table)} passes: {table.nbytes} bytes vs {len(pickle.dumps(passes))} pickled")
+
+    # Missing fields, extra keys and non-UTC offsets survive the round trip
+    odd = [{"rise_time": "2030-01-01T05:30:00+05:30", "set_time": "2030-01-01T00:10:00.5Z", "window": 3}]
+    record = PassTable.from_dicts(odd).record(0)
+    assert record == {"rise_time": "2030-01-01T00:00:00Z", "set_time": "2030-01-01T00:10:00.500000Z", "window": 3}
+
+    # The predictor builds tables directly; they match its dictionaries
+    stations = load_ground_stations()[:2]
+    satellites = load_satellites('iss.txt')
+    predicted = find_passes_batch(satellites, stations, days=1, start=EPOCH, as_table=True)
+    assert isinstance(predicted, PassTable)
+    assert predicted.to_dicts() == find_passes_batch(satellites, stations, days=1, start=EPOCH)
+
+    # Tables and dictionaries give the same assignments and schedules
+    optimizer = AdvancedSchedulingOptimizer()
+    from_dicts, _ = optimizer.preprocess_scheduling_data(passes, demands)
+    from_table, _ = optimizer.preprocess_scheduling_data(table, demands)
+    assert [(a['pass_idx'], a['demand_idx'], a['duration_seconds']) for a in from_dicts] == \
+           [(a['pass_idx'], a['demand_idx'], a['duration_seconds']) for a in from_table]
+    assert [a['pass'] for a in from_table] == [a['pass'] for a in from_dicts]
+    assert create_baseline_schedule(table, demands) == create_baseline_schedule(passes, demands)
+
+    print(f"✅ Round trip exact, {len(from_table)} assignments identical from either format")
+
+def test_parallel_prediction():
+    """Test that sharded prediction over worker processes merges into the serial result."""
+    print("\n=== Testing Parallel Pass Prediction ===")
+
+    satellites = synthetic_constellation(12, seed=2)
+    stations = synthetic_ground_stations(3, seed=2)
+    serial = find_passes_batch(satellites, stations, days=1, start=EPOCH)
+    for workers in (1, 2, 3):
+        assert find_passes_parallel(satellites, stations, days=1, start=EPOCH, workers=workers) == serial
+
+    # Fewer satellites than shards: stations are split too
+    table = find_passes_parallel(satellites[:1], stations, days=1, start=EPOCH, workers=4, as_table=True)
+    assert table.to_dicts() == find_passes_batch(satellites[:1], stations, days=1, start=EPOCH)
+    assert table.stations == [station['name'] for station in stations]
+
+    print(f"✅ {len(serial)} passes identical across worker counts")
+
+def test_tle_catalog():
+    """Test bulk TLE parsing, epoch selection and the memory-mapped snapshot."""
+    print("\n=== Testing TLE Catalog ===")
+
+    satellites = synthetic_constellation(50, seed=5)
+    blocks = [f"0 {s.name}\r\n" + "\r\n".join(export_tle(s.model)) for s in satellites]
+    # A second, later epoch of SAT-0007 under a new name, and two broken element sets
+    line1, line2 = export_tle(satellites[7].model)
+    later = line1[:18] + "30005.00000000" + line1[32:]
+    blocks += [f"SAT-0007B\n{later}\n{line2}", "BROKEN\n1 99999U short\n2 99999 short", line2]
+    text = "\n\n".join(blocks)
+
+    records, skipped = parse_tle_text(text)
+    assert len(records) == 51 and skipped == 2
+    long_name = "X" + "Спутник-" * 5
+    named, _ = parse_tle_text(f"{long_name}\n{line1}\n{line2}")
+    assert long_name.startswith(TLECatalog.from_records(named).data["name"][0].decode()), \
+        "Names are cut at a character boundary"
+    assert parse_tle_text(text, verify_checksums=True)[0].size == 50, "Edited line fails its checksum"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bulk.txt")
+        snapshot = os.path.join(tmp, "bulk.npy")
+        with open(path, 'w') as f:
+            f.write(text)
+        parsed = TLECatalog.open([path], snapshot)
+        mapped = TLECatalog.open([path], snapshot)
+        assert isinstance(mapped.data, np.memmap) and np.array_equal(parsed.data, mapped.data)
+
+        assert len(mapped) == 51 and mapped.norad_ids.tolist() == list(range(90000, 90050))
+        assert mapped.resolve("SAT-0003") == 90003 and mapped.resolve("SAT-0007B") == 90007
+        assert mapped.resolve("SAT-0007") == 90007, "Former names still resolve"
+        assert "SAT-9999" not in mapped and 12345 not in mapped
+        assert len(mapped.epochs(90007)) == 2
+
+        # The element set closest to the requested time
+        assert mapped.satellite(90007, at=EPOCH).epoch.tt < mapped.satellite(90007, at=EPOCH + timedelta(days=10)).epoch.tt
+        early = mapped.satellite(90007, at=EPOCH + timedelta(days=1))
+        assert early.model.satnum == 90007 and abs(early.epoch.utc_datetime() - EPOCH) < timedelta(seconds=1)
+        assert mapped.satellite(90003) is mapped.satellite("SAT-0003"), "Satellites are built once"
+        assert [s.name for s in mapped.satellites([90001, "SAT-0002"])] == ["SAT-0001", "SAT-0002"]
+
+        # Propagation matches satellites built straight from the TLEs
+        from_catalog = find_passes_batch(mapped.satellites(range(90000, 90005), at=EPOCH), load_ground_stations()[:1],
+                                         days=1, start=EPOCH)
+        assert from_catalog == find_passes_batch(satellites[:5], load_ground_stations()[:1], days=1, start=EPOCH)
+
+        # A replacement with an older mtime is reparsed, not served from the snapshot
+        stat = os.stat(path)
+        with open(path, 'w') as f:
+            f.write("\n".join(blocks[:3]))
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+        assert len(TLECatalog.open([path], snapshot)) == 3
+
+        # Same-named files in different directories keep their own snapshots
+        for directory, count in (("a", 2), ("b", 4)):
+            os.makedirs(os.path.join(tmp, directory))
+            with open(os.path.join(tmp, directory, "active.txt"), 'w') as f:
+                f.write("\n".join(blocks[:count]))
+        for _ in range(2):
+            assert [len(get_catalog(os.path.join(tmp, d, "active.txt"), snapshot_dir=os.path.join(tmp, "snapshots")))
+                    for d in ("a", "b")] == [2, 4]
+
+        # Empty and all-malformed files give an empty catalog
+        for name, content in (("empty.txt", ""), ("broken.txt", "BROKEN\n1 99999U short\n2 99999 short\n")):
+            broken = os.path.join(tmp, name)
+            with open(broken, 'w') as f:
+                f.write(content)
+            catalog = TLECatalog.from_files([broken])
+            assert len(catalog) == 0 and catalog.satellites() == [] and "ISS" not in catalog
+        assert len(TLECatalog.from_files([])) == 0
+
+    assert [s.model.satnum for s in load_satellites('iss.txt')] == [25544]
+    assert load_satellites('iss.txt')[0] is load_satellites('iss.txt')[0], "TLE files are parsed once"
+
+    print(f"✅ {len(records)} element sets, {skipped} skipped, snapshot memory-mapped")
+
+def test_time_anchoring():
+    """Test explicit prediction windows and snapping them to a time grid."""
+    print("\n=== Testing Deterministic Time Anchoring ===")
+
+    start, end = prediction_window(EPOCH + timedelta(seconds=170), days=1, snap_seconds=300)
+    assert (start, end) == (EPOCH, EPOCH + timedelta(days=1))
+    assert prediction_window(EPOCH, EPOCH + timedelta(seconds=10), snap_seconds=300)[1] == EPOCH + timedelta(seconds=300)
+    naive = prediction_window(datetime(2030, 1, 1), datetime(2030, 1, 2))
+    assert naive == (EPOCH, EPOCH + timedelta(days=1))
+    try:
+        prediction_window(EPOCH, EPOCH)
+        assert False, "An empty window should be rejected"
+    except ValueError:
+        pass
+
+    # Calls anywhere inside one grid step give bit-identical pass tables
+    satellites = synthetic_constellation(6, seed=8)
+    stations = synthetic_ground_stations(2, seed=8)
+    tables = [find_passes_batch(satellites, stations, days=1, start=EPOCH + timedelta(seconds=offset),
+                                snap_seconds=300, as_table=True) for offset in (0, 61, 299)]
+    assert all(table.data.tobytes() == tables[0].data.tobytes() for table in tables)
+    unsnapped = find_passes_batch(satellites, stations, days=1, start=EPOCH + timedelta(seconds=61), as_table=True)
+    assert unsnapped.data.tobytes() != tables[0].data.tobytes()
+
+    # The legacy single-pair search honours an explicit window
+    station = load_ground_stations()[0]
+    window_end = EPOCH + timedelta(hours=12)
+    legacy = find_satellite_passes('iss.txt', station, start=EPOCH, end=window_end)
+    assert legacy == find_satellite_passes('iss.txt', station, start=EPOCH, end=window_end)
+    assert all(EPOCH <= _parse(p['rise_time']) and _parse(p['set_time']) <= window_end for p in legacy)
+
+    print(f"✅ Snapped windows reproduce {len(tables[0])} passes exactly")
+
+def main():
+    """Run all pass prediction tests."""
+    print("=" * 60)
+    print("BATCH PASS PREDICTION TEST SUITE")
+    print("=" * 60)
+
+    try:
+        test_batch_matches_single_pair()
+        test_batch_many_satellites_and_stations()
+        test_pass_cache_incremental()
+        test_lazy_ephemeris()
+        test_pass_profiles()
+        test_pass_table()
+        test_parallel_prediction()
+        test_tle_catalog()
+        test_time_anchoring()
+
+        print("\n" + "=" * 60)
+        print("ALL PASS PREDICTION TESTS COMPLETED SUCCESSFULLY")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+
+if __name__ == "__main__":
+    main()